@@ -1,10 +1,58 @@
-__all__ = ["article", "defaults", "search", "translate", "translators"]
+__all__ = [
+    "adaptive",
+    "archive",
+    "article",
+    "batch",
+    "cache",
+    "defaults",
+    "fetcher",
+    "index",
+    "limiter",
+    "memory",
+    "metrics",
+    "planner",
+    "retry",
+    "search",
+    "store",
+    "translate",
+    "translators",
+]
 __version__ = "0.0.1"
 
 
-# submodules
-from . import article
-from . import defaults
-from . import search
-from . import translate
-from . import translators
+# standard library
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+
+# submodules (imported on first access)
+if TYPE_CHECKING:
+    from . import adaptive
+    from . import archive
+    from . import article
+    from . import batch
+    from . import cache
+    from . import defaults
+    from . import fetcher
+    from . import index
+    from . import limiter
+    from . import memory
+    from . import metrics
+    from . import planner
+    from . import retry
+    from . import search
+    from . import store
+    from . import translate
+    from . import translators
+
+
+def __getattr__(name: str) -> Any:
+    """Import a submodule on first access (e.g. ``aixiv.search``)."""
+    if name in __all__:
+        return import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
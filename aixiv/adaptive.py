@@ -0,0 +1,212 @@
+__all__ = ["AdaptiveConcurrency", "maximum"]
+
+
+# standard library
+from asyncio import CancelledError, Future, get_running_loop
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from logging import getLogger
+from time import monotonic
+from typing import Any, TypeVar, Union
+
+
+# dependencies
+from .defaults import (
+    ADAPTIVE_DECREASE,
+    ADAPTIVE_MAXIMUM,
+    ADAPTIVE_MINIMUM,
+    ADAPTIVE_TOLERANCE,
+    CONCURRENCY,
+)
+from .retry import is_retryable
+
+
+# type hints
+T = TypeVar("T")
+
+
+# constants
+LATENCY_WINDOW = 100
+LOGGER = getLogger(__name__)
+
+
+@dataclass
+class AdaptiveConcurrency:
+    """Adaptive concurrency limit by AIMD (additive increase, multiplicative decrease).
+
+    The limit of in-flight calls increases by one per ``limit``
+    successful calls as long as their latencies stay within
+    ``tolerance`` times the minimum of recent latencies, and it is
+    multiplied by ``decrease`` when a call is throttled or times out
+    (i.e. fails with a retryable error or is cancelled). The limit is
+    decreased at most once per round trip so that a burst of failures
+    of concurrent calls is counted as a single congestion signal.
+
+    Args:
+        minimum: Minimum limit of in-flight calls.
+        maximum: Maximum limit of in-flight calls.
+        initial: Initial limit of in-flight calls.
+        tolerance: Ratio of latency to the minimum of recent latencies
+            below which the limit is increased.
+        decrease: Factor by which the limit is multiplied on congestion.
+
+    """
+
+    minimum: int = ADAPTIVE_MINIMUM
+    """Minimum limit of in-flight calls."""
+
+    maximum: int = ADAPTIVE_MAXIMUM
+    """Maximum limit of in-flight calls."""
+
+    initial: int = CONCURRENCY
+    """Initial limit of in-flight calls."""
+
+    tolerance: float = ADAPTIVE_TOLERANCE
+    """Ratio of latency to the minimum of recent latencies to increase."""
+
+    decrease: float = ADAPTIVE_DECREASE
+    """Factor by which the limit is multiplied on congestion."""
+
+    limit: float = field(init=False)
+    """Current limit of in-flight calls."""
+
+    inflight: int = field(default=0, init=False)
+    """Current number of in-flight calls."""
+
+    decreased: float = field(default=0.0, init=False, repr=False)
+    """Last time (monotonic) when the limit was decreased."""
+
+    latencies: deque[float] = field(
+        default_factory=lambda: deque(maxlen=LATENCY_WINDOW),
+        init=False,
+        repr=False,
+    )
+    """Latencies of recent successful calls in seconds."""
+
+    waiters: deque["Future[None]"] = field(
+        default_factory=deque,
+        init=False,
+        repr=False,
+    )
+    """Futures of callers waiting for the limit."""
+
+    def __post_init__(self) -> None:
+        self.limit = float(min(max(self.initial, self.minimum), self.maximum))
+
+    async def __call__(self, func: Callable[[T], Any], arg: T, /) -> Any:
+        """Call a function within the limit and observe its outcome.
+
+        Args:
+            func: Function or coroutine function to be called.
+            arg: Argument of the function.
+
+        Returns:
+            Result of the function.
+
+        """
+        await self.acquire()
+
+        try:
+            return await self.observe(func, arg)
+        finally:
+            self.release()
+
+    async def observe(self, func: Callable[[T], Any], arg: T, /) -> Any:
+        """Call a function and update the limit by its outcome.
+
+        Unlike :meth:`__call__`, it does not wait for the limit so that
+        callers can acquire it beforehand (e.g. outside a timeout).
+        Only calls returning awaitables are observed, so that a function
+        can skip the observation by returning a result directly
+        (e.g. a cache hit).
+
+        Args:
+            func: Function or coroutine function to be called.
+            arg: Argument of the function.
+
+        Returns:
+            Result of the function.
+
+        """
+        if not isinstance(result := func(arg), Awaitable):
+            return result
+
+        start = monotonic()
+
+        try:
+            result = await result
+        except CancelledError:
+            self.update(start, True)
+            raise
+        except Exception as error:
+            self.update(start, is_retryable(error))
+            raise
+
+        self.update(start, False)
+        return result
+
+    async def acquire(self) -> None:
+        """Wait until a call can be made within the limit."""
+        if not self.waiters and self.inflight < int(self.limit):
+            self.inflight += 1
+            return
+
+        future: Future[None] = get_running_loop().create_future()
+        self.waiters.append(future)
+
+        try:
+            await future
+        except CancelledError:
+            if future.done() and not future.cancelled():
+                self.inflight -= 1
+                self.wake()
+
+            raise
+        finally:
+            if future in self.waiters:
+                self.waiters.remove(future)
+
+    def release(self) -> None:
+        """Release a call and let waiting callers make calls."""
+        self.inflight -= 1
+        self.wake()
+
+    def update(self, start: float, congested: bool, /) -> None:
+        """Update the limit by the outcome of a call.
+
+        Args:
+            start: Time (monotonic) when the call was started.
+            congested: Whether the call was throttled or timed out.
+
+        """
+        now = monotonic()
+
+        if congested:
+            # decrease at most once per round trip
+            if start >= self.decreased:
+                self.limit = max(self.minimum, self.limit * self.decrease)
+                self.decreased = now
+                LOGGER.debug(f"Decreased the concurrency limit to {self.limit:.1f}.")
+        else:
+            self.latencies.append(latency := now - start)
+
+            if latency <= self.tolerance * min(self.latencies):
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+        self.wake()
+
+    def wake(self) -> None:
+        """Let waiting callers make calls within the limit."""
+        while self.waiters and self.inflight < int(self.limit):
+            if not (future := self.waiters.popleft()).done():
+                future.set_result(None)
+                self.inflight += 1
+
+
+def maximum(concurrency: Union[int, AdaptiveConcurrency], /) -> int:
+    """Return the maximum number of concurrent executions."""
+    if isinstance(concurrency, AdaptiveConcurrency):
+        return concurrency.maximum
+
+    return concurrency
@@ -0,0 +1,415 @@
+__all__ = [
+    "Archive",
+    "ArchiveWriter",
+    "JSONLWriter",
+    "read_jsonl",
+    "write_archive",
+    "write_jsonl",
+]
+
+
+# standard library
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from json import dumps, loads
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from shutil import copyfileobj
+from struct import Struct
+from tempfile import TemporaryFile
+from typing import IO, Any, Optional, Union
+
+
+# dependencies
+from typing_extensions import Self
+from .article import Article
+
+
+# constants
+ARCHIVE_COLUMNS = (
+    "title",
+    "authors",
+    "summary",
+    "url",
+    "origin",
+    "origin_title",
+    "origin_authors",
+    "origin_summary",
+    "origin_url",
+)
+ARCHIVE_HEADER = Struct("<8sQQ")
+ARCHIVE_MAGIC = b"AIXIVARC"
+ARCHIVE_OFFSET = Struct("<Q")
+ARCHIVE_VERSION = 1
+AUTHORS_SEP = "\x1f"
+ENCODING = "utf-8"
+ORIGIN_NONE = b""
+ORIGIN_SHARED = b"\x01"
+ORIGIN_OWN = b"\x02"
+
+
+@dataclass
+class JSONLWriter:
+    """Append-only streaming writer of articles to a JSONL file.
+
+    Each article (with its original article in ``origin``)
+    is written as a JSON object per line as soon as it is given.
+
+    Args:
+        path: Path of the JSONL file.
+        append: Whether to append articles to an existing file.
+
+    """
+
+    path: Union[Path, str]
+    """Path of the JSONL file."""
+
+    append: bool = True
+    """Whether to append articles to an existing file."""
+
+    file: IO[str] = field(init=False, repr=False)
+    """File object of the JSONL file."""
+
+    def __post_init__(self) -> None:
+        path = Path(self.path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(path, "a" if self.append else "w", encoding=ENCODING)
+
+    def write(self, article: Article, /) -> None:
+        """Write an article as a line of the JSONL file."""
+        self.file.write(dumps(to_dict(article), ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        """Flush and close the JSONL file."""
+        self.file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+@dataclass
+class ArchiveWriter:
+    """Streaming writer of articles to a columnar binary archive.
+
+    Each field of articles is streamed to a temporary column file
+    as soon as an article is given, and the columns are concatenated
+    into the archive (with an offset index per column) when closed.
+
+    The archive consists of a header (magic, version, and number of
+    articles), a directory of the positions of the columns, and the
+    columns, each of which is an array of ``n + 1`` little-endian
+    64-bit offsets followed by the concatenated UTF-8 values.
+
+    Args:
+        path: Path of the archive.
+
+    """
+
+    path: Union[Path, str]
+    """Path of the archive."""
+
+    count: int = field(default=0, init=False)
+    """Number of written articles."""
+
+    offsets: list[IO[bytes]] = field(default_factory=list, init=False, repr=False)
+    """Temporary files of the offsets of the columns."""
+
+    values: list[IO[bytes]] = field(default_factory=list, init=False, repr=False)
+    """Temporary files of the values of the columns."""
+
+    def __post_init__(self) -> None:
+        for _ in ARCHIVE_COLUMNS:
+            self.offsets.append(offsets := TemporaryFile())
+            self.values.append(TemporaryFile())
+            offsets.write(ARCHIVE_OFFSET.pack(0))
+
+    def write(self, article: Article, /) -> None:
+        """Write an article (and its original one) to the archive."""
+        for offsets, values, value in zip(self.offsets, self.values, to_row(article)):
+            values.write(value)
+            offsets.write(ARCHIVE_OFFSET.pack(values.tell()))
+
+        self.count += 1
+
+    def close(self) -> None:
+        """Write the archive and remove the temporary column files."""
+        path = Path(self.path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            directory: list[int] = []
+            position = ARCHIVE_HEADER.size
+            position += 2 * ARCHIVE_OFFSET.size * len(ARCHIVE_COLUMNS)
+
+            for values in self.values:
+                directory.append(position)
+                position += ARCHIVE_OFFSET.size * (self.count + 1)
+                directory.append(position)
+                position += values.tell()
+
+            with open(path, "wb") as archive:
+                archive.write(
+                    ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, self.count)
+                )
+
+                for position in directory:
+                    archive.write(ARCHIVE_OFFSET.pack(position))
+
+                for offsets, values in zip(self.offsets, self.values):
+                    offsets.seek(0)
+                    values.seek(0)
+                    copyfileobj(offsets, archive)
+                    copyfileobj(values, archive)
+        finally:
+            for file in self.offsets + self.values:
+                file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+@dataclass
+class Archive:
+    """Memory-mapped reader of a columnar binary archive of articles.
+
+    Only the bytes of the requested fields are read (and decoded),
+    so that an article or a column (e.g. titles) can be loaded
+    from a large archive without parsing the whole file.
+
+    Args:
+        path: Path of the archive (written by :class:`ArchiveWriter`).
+
+    Raises:
+        ValueError: Raised if the file is not an archive of articles.
+
+    """
+
+    path: Union[Path, str]
+    """Path of the archive."""
+
+    count: int = field(default=0, init=False)
+    """Number of articles in the archive."""
+
+    directory: dict[str, tuple[int, int]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+    """Positions of the offsets and values of each column."""
+
+    file: IO[bytes] = field(init=False, repr=False)
+    """File object of the archive."""
+
+    buffer: Optional[mmap] = field(default=None, init=False, repr=False)
+    """Memory map of the archive (``None`` if closed)."""
+
+    def __post_init__(self) -> None:
+        self.file = open(Path(self.path).expanduser(), "rb")
+
+        try:
+            self.buffer = mmap(self.file.fileno(), 0, access=ACCESS_READ)
+            magic, version, self.count = ARCHIVE_HEADER.unpack_from(self.buffer)
+        except Exception as error:
+            self.close()
+            raise ValueError(f"Not an archive of articles: {self.path!r}.") from error
+
+        if magic != ARCHIVE_MAGIC or version != ARCHIVE_VERSION:
+            self.close()
+            raise ValueError(f"Not an archive of articles: {self.path!r}.")
+
+        position = ARCHIVE_HEADER.size
+
+        for name in ARCHIVE_COLUMNS:
+            offsets = ARCHIVE_OFFSET.unpack_from(self.buffer, position)[0]
+            position += ARCHIVE_OFFSET.size
+            values = ARCHIVE_OFFSET.unpack_from(self.buffer, position)[0]
+            position += ARCHIVE_OFFSET.size
+            self.directory[name] = offsets, values
+
+    def get(self, index: int, name: str, /) -> bytes:
+        """Return the raw value of a field of an article.
+
+        Args:
+            index: Index of the article.
+            name: Name of the column (e.g. ``"title"``).
+
+        Returns:
+            Raw (UTF-8 encoded) value of the field.
+
+        """
+        if self.buffer is None:
+            raise ValueError("The archive is closed.")
+
+        if not -self.count <= index < self.count:
+            raise IndexError(f"Archive index out of range: {index}.")
+
+        index %= self.count
+        offsets, values = self.directory[name]
+        position = offsets + ARCHIVE_OFFSET.size * index
+        start = ARCHIVE_OFFSET.unpack_from(self.buffer, position)[0]
+        end = ARCHIVE_OFFSET.unpack_from(self.buffer, position + ARCHIVE_OFFSET.size)[0]
+        return self.buffer[values + start : values + end]
+
+    def column(self, name: str, /) -> Iterator[str]:
+        """Yield the values of a column (e.g. ``"title"``) of all articles."""
+        for index in range(self.count):
+            yield self.get(index, name).decode(ENCODING)
+
+    def close(self) -> None:
+        """Close the memory map and the file of the archive."""
+        if self.buffer is not None:
+            self.buffer.close()
+            self.buffer = None
+
+        self.file.close()
+
+    def __getitem__(self, index: int, /) -> Article:
+        """Return an article (with its original one) by index."""
+        values = [self.get(index, name) for name in ARCHIVE_COLUMNS]
+        return from_row(values)
+
+    def __iter__(self) -> Iterator[Article]:
+        """Iterate over the articles of the archive."""
+        for index in range(self.count):
+            yield self[index]
+
+    def __len__(self) -> int:
+        """Return the number of articles in the archive."""
+        return self.count
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def read_jsonl(path: Union[Path, str], /) -> Iterator[Article]:
+    """Read articles (with their original ones) from a JSONL file lazily."""
+    with open(Path(path).expanduser(), encoding=ENCODING) as file:
+        for line in file:
+            if line.strip():
+                yield from_dict(loads(line))
+
+
+def write_archive(articles: Iterable[Article], path: Union[Path, str], /) -> int:
+    """Write articles (with their original ones) to a columnar binary archive.
+
+    Args:
+        articles: Articles to be written (may be a lazy iterable).
+        path: Path of the archive.
+
+    Returns:
+        Number of written articles.
+
+    """
+    with ArchiveWriter(path) as writer:
+        for article in articles:
+            writer.write(article)
+
+    return writer.count
+
+
+def write_jsonl(
+    articles: Iterable[Article],
+    path: Union[Path, str],
+    /,
+    *,
+    append: bool = True,
+) -> int:
+    """Write articles (with their original ones) to a JSONL file.
+
+    Args:
+        articles: Articles to be written (may be a lazy iterable).
+        path: Path of the JSONL file.
+        append: Whether to append articles to an existing file.
+
+    Returns:
+        Number of written articles.
+
+    """
+    count = 0
+
+    with JSONLWriter(path, append) as writer:
+        for article in articles:
+            writer.write(article)
+            count += 1
+
+    return count
+
+
+def from_dict(data: dict[str, Any], /) -> Article:
+    """Convert a dictionary (of a JSONL line) to an article."""
+    origin = data.get("origin")
+
+    return Article(
+        title=data["title"],
+        authors=data["authors"],
+        summary=data["summary"],
+        url=data["url"],
+        origin=None if origin is None else from_dict(origin),
+    )
+
+
+def from_row(values: list[bytes], /) -> Article:
+    """Convert raw values of the columns to an article."""
+    flag = values[4]
+    title, authors, summary, url, _, *origin = [
+        value.decode(ENCODING) for value in values
+    ]
+    authors_ = authors.split(AUTHORS_SEP) if authors else []
+
+    if flag == ORIGIN_NONE:
+        return Article(title, authors_, summary, url)
+
+    if flag == ORIGIN_SHARED:
+        origin[1], origin[3] = authors, url
+
+    origin_authors = origin[1].split(AUTHORS_SEP) if origin[1] else []
+    return Article(
+        title,
+        authors_,
+        summary,
+        url,
+        Article(origin[0], origin_authors, origin[2], origin[3]),
+    )
+
+
+def to_dict(article: Article, /) -> dict[str, Any]:
+    """Convert an article (and its original one) to a dictionary."""
+    return {
+        "title": article.title,
+        "authors": list(article.authors),
+        "summary": article.summary,
+        "url": article.url,
+        "origin": None if article.origin is None else to_dict(article.origin),
+    }
+
+
+def to_row(article: Article, /) -> list[bytes]:
+    """Convert an article (and its original one) to raw values of the columns."""
+    authors = AUTHORS_SEP.join(article.authors)
+    row = [article.title, authors, article.summary, article.url]
+
+    if (origin := article.origin) is None:
+        values = [value.encode(ENCODING) for value in row]
+        return values + [ORIGIN_NONE, b"", b"", b"", b""]
+
+    origin_authors = AUTHORS_SEP.join(origin.authors)
+    values = [value.encode(ENCODING) for value in row]
+
+    if origin_authors == authors and origin.url == article.url:
+        values.append(ORIGIN_SHARED)
+        origin_authors, origin_url = "", ""
+    else:
+        values.append(ORIGIN_OWN)
+        origin_url = origin.url
+
+    origin_row = [origin.title, origin_authors, origin.summary, origin_url]
+    return values + [value.encode(ENCODING) for value in origin_row]
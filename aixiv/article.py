@@ -1,34 +1,74 @@
-__all__ = ["Article", "amap"]
+__all__ = [
+    "Article",
+    "ArticleTable",
+    "ThreadedIterator",
+    "aiter_map",
+    "amap",
+    "amap_async",
+]
 
 
 # standard library
-from asyncio import Semaphore, TimeoutError, gather, run, wait_for
-from collections.abc import Awaitable, Callable, Iterable
+from asyncio import (
+    Queue,
+    Semaphore,
+    Task,
+    TimeoutError,
+    create_task,
+    run,
+    to_thread,
+    wait_for,
+)
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from contextlib import AbstractAsyncContextManager, AsyncExitStack
 from dataclasses import dataclass, field, replace
+from functools import partial
 from logging import getLogger
 from reprlib import Repr
-from typing import Optional, TypeVar, Union
+from sys import intern, version_info
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, Union, overload
 
 
 # dependencies
-from arxiv import Result
 from typing_extensions import Self
+from .adaptive import AdaptiveConcurrency
 from .defaults import CONCURRENCY, TIMEOUT
+from .metrics import REGISTRY
+from .retry import Retry
 
 
 # type hints
+if TYPE_CHECKING:
+    from arxiv import Result
+
 TArticle = TypeVar("TArticle", bound="Article")
 Finally = Union[TArticle, Awaitable[TArticle]]
+Articles = Union[Iterable[TArticle], AsyncIterable[TArticle]]
+Outcome = tuple[int, Union[TArticle, Exception, None]]
 
 
 # constants
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if version_info >= (3, 10) else {}
 LOGGER = getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Article:
     """Article information.
 
+    The article is slotted (Python 3.10+) and its authors are stored
+    as a tuple of interned names, so that the names shared by many
+    articles (and their translations) are stored only once in memory.
+
     Args:
         title: Title of the article.
         authors: Authors of the article.
@@ -41,8 +81,8 @@ class Article:
     title: str
     """Title of the article."""
 
-    authors: list[str]
-    """Authors of the article."""
+    authors: Sequence[str]
+    """Authors of the article (stored as a tuple of interned names)."""
 
     summary: str
     """Summary of the article."""
@@ -53,13 +93,21 @@ class Article:
     origin: Optional[Self] = field(default=None, repr=False)
     """Original article (if any)."""
 
+    def __post_init__(self) -> None:
+        authors = self.authors
+
+        if type(authors) is tuple and all(intern(name) is name for name in authors):
+            return
+
+        object.__setattr__(self, "authors", tuple(map(intern, authors)))
+
     @classmethod
-    def from_arxiv(cls, result: Result, /) -> Self:
+    def from_arxiv(cls, result: "Result", /) -> Self:
         """Create an article from an arXiv query result."""
 
         return cls(
             title=result.title,
-            authors=[author.name for author in result.authors],
+            authors=tuple(author.name for author in result.authors),
             summary=result.summary,
             url=result.entry_id,
         )
@@ -67,20 +115,159 @@ class Article:
     def __format__(self, format_spec: str, /) -> str:
         """Support shortened representation of the article."""
         if not format_spec:
-            return super().__format__(format_spec)
+            return object.__format__(self, format_spec)
         else:
             repr = Repr()
             repr.maxother = int(format_spec)
             return repr.repr(self)
 
 
+@dataclass
+class ArticleTable:
+    """Columnar (struct-of-arrays) container of articles.
+
+    Each field of articles (and of their original articles) is stored
+    in a column (list) instead of an article object per row, so that
+    a large collection of articles and their translations can be kept
+    without the per-object overhead. Only the first level of
+    ``origin`` is stored (i.e. the origin of an origin is dropped).
+
+    Args:
+        title: Column of the titles.
+        authors: Column of the authors.
+        summary: Column of the summaries.
+        url: Column of the URLs.
+        origin_title: Column of the titles of the original articles.
+        origin_authors: Column of the authors of the original articles.
+        origin_summary: Column of the summaries of the original articles.
+        origin_url: Column of the URLs of the original articles.
+
+    """
+
+    title: list[str] = field(default_factory=list)
+    """Column of the titles."""
+
+    authors: list[tuple[str, ...]] = field(default_factory=list)
+    """Column of the authors."""
+
+    summary: list[str] = field(default_factory=list)
+    """Column of the summaries."""
+
+    url: list[str] = field(default_factory=list)
+    """Column of the URLs."""
+
+    origin_title: list[Optional[str]] = field(default_factory=list)
+    """Column of the titles of the original articles."""
+
+    origin_authors: list[Optional[tuple[str, ...]]] = field(default_factory=list)
+    """Column of the authors of the original articles."""
+
+    origin_summary: list[Optional[str]] = field(default_factory=list)
+    """Column of the summaries of the original articles."""
+
+    origin_url: list[Optional[str]] = field(default_factory=list)
+    """Column of the URLs of the original articles."""
+
+    @classmethod
+    def from_articles(cls, articles: Iterable[Article], /) -> Self:
+        """Create a table from articles."""
+        table = cls()
+        table.extend(articles)
+        return table
+
+    def to_articles(self) -> list[Article]:
+        """Convert the table to a list of articles."""
+        return list(self)
+
+    def append(self, article: Article, /) -> None:
+        """Append an article (and its original one) to the table."""
+        authors = tuple(article.authors)
+        self.title.append(article.title)
+        self.authors.append(authors)
+        self.summary.append(article.summary)
+        self.url.append(article.url)
+
+        if (origin := article.origin) is None:
+            self.origin_title.append(None)
+            self.origin_authors.append(None)
+            self.origin_summary.append(None)
+            self.origin_url.append(None)
+        else:
+            origin_authors = tuple(origin.authors)
+            self.origin_title.append(origin.title)
+            self.origin_authors.append(
+                authors if origin_authors == authors else origin_authors
+            )
+            self.origin_summary.append(origin.summary)
+            self.origin_url.append(origin.url)
+
+    def extend(self, articles: Iterable[Article], /) -> None:
+        """Append articles (and their original ones) to the table."""
+        for article in articles:
+            self.append(article)
+
+    @overload
+    def __getitem__(self, index: int, /) -> Article: ...
+
+    @overload
+    def __getitem__(self, index: slice, /) -> Self: ...
+
+    def __getitem__(self, index: Union[int, slice], /) -> Union[Article, Self]:
+        """Return an article (or a table of articles) by index."""
+        if isinstance(index, slice):
+            return type(self)(
+                *(column[index] for column in self.columns()),
+            )
+
+        if (origin_title := self.origin_title[index]) is None:
+            origin = None
+        else:
+            origin = Article(
+                origin_title,
+                self.origin_authors[index] or (),
+                self.origin_summary[index] or "",
+                self.origin_url[index] or "",
+            )
+
+        return Article(
+            self.title[index],
+            self.authors[index],
+            self.summary[index],
+            self.url[index],
+            origin,
+        )
+
+    def __iter__(self) -> Iterator[Article]:
+        """Iterate over the articles of the table."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __len__(self) -> int:
+        """Return the number of articles in the table."""
+        return len(self.url)
+
+    def columns(self) -> tuple[list[Any], ...]:
+        """Return the columns of the table."""
+        return (
+            self.title,
+            self.authors,
+            self.summary,
+            self.url,
+            self.origin_title,
+            self.origin_authors,
+            self.origin_summary,
+            self.origin_url,
+        )
+
+
 def amap(
     func: Callable[[TArticle], Finally[TArticle]],
     articles: Iterable[TArticle],
     /,
     *,
-    concurrency: int = CONCURRENCY,
+    concurrency: Union[int, AdaptiveConcurrency] = CONCURRENCY,
     timeout: float = TIMEOUT,
+    retry: Optional[Retry] = None,
 ) -> list[TArticle]:
     """Article-to-article map function.
 
@@ -89,15 +276,266 @@ def amap(
         articles: Articles to be mapped.
         concurrency: Number of concurrent executions.
             Only used when ``func`` is a coroutine function.
+            If it is an adaptive concurrency limit, the number is
+            adjusted by the latencies and failures of ``func``
+            (waiting for the limit is not counted in ``timeout``).
+        timeout: Timeout per article in seconds.
+            Only used when ``func`` is a coroutine function.
+            If ``retry`` is given, it is the timeout per attempt.
+        retry: Retry policy for failed (or timed-out) articles.
+            If it is not given, errors of ``func`` are raised as they are.
+
+    Returns:
+        List of mapped articles by ``func`` with each
+        original article stored in the ``origin`` attribute.
+        If timeout occurs (or all attempts fail), the original
+        article is returned.
+
+    Notes:
+        If ``func`` is an async context manager (e.g. a translator),
+        it is entered and exited within the event loop of the mapping
+        so that its resources (e.g. connection pools) are released.
+
+    """
+
+    async def main() -> list[TArticle]:
+        async with AsyncExitStack() as stack:
+            if isinstance(func, AbstractAsyncContextManager):
+                await stack.enter_async_context(func)
+
+            return await amap_async(
+                func,
+                articles,
+                concurrency=concurrency,
+                timeout=timeout,
+                retry=retry,
+            )
+
+    return run(main())
+
+
+@dataclass
+class ThreadedIterator(Iterator[TArticle], Generic[TArticle]):
+    """Iterator of articles consumed in a worker thread by async pipelines.
+
+    Async pipelines (e.g. :func:`aiter_map`) consume a plain iterator
+    on the thread of the event loop, as it may not be used from other
+    threads (e.g. rows of an SQLite cursor). An iterator wrapped by it
+    is instead consumed in a worker thread, so that an iterator doing
+    blocking I/O (e.g. :func:`aixiv.search.iter_search`) does not block
+    the event loop. It must therefore be safe to use from other threads.
+
+    Args:
+        iterator: Wrapped iterator of articles.
+
+    """
+
+    iterator: Iterator[TArticle]
+    """Wrapped iterator of articles."""
+
+    def __next__(self) -> TArticle:
+        return next(self.iterator)
+
+
+async def amap_async(
+    func: Callable[[TArticle], Finally[TArticle]],
+    articles: Iterable[TArticle],
+    /,
+    *,
+    concurrency: Union[int, AdaptiveConcurrency] = CONCURRENCY,
+    timeout: float = TIMEOUT,
+    retry: Optional[Retry] = None,
+) -> list[TArticle]:
+    """Article-to-article map coroutine function.
+
+    Unlike :func:`amap`, it runs within the running event loop
+    (e.g. in Jupyter or an async web service) so that several stages
+    can share one event loop. If ``func`` is an async context manager
+    (e.g. a translator), it is not entered by this function and thus
+    its resources (e.g. connection pools) can be shared across calls.
+
+    Args:
+        func: Function or coroutine function for mapping.
+        articles: Articles to be mapped.
+        concurrency: Number of concurrent executions.
+            Only used when ``func`` is a coroutine function.
+            If it is an adaptive concurrency limit, the number is
+            adjusted by the latencies and failures of ``func``
+            (waiting for the limit is not counted in ``timeout``).
         timeout: Timeout per article in seconds.
             Only used when ``func`` is a coroutine function.
+            If ``retry`` is given, it is the timeout per attempt.
+        retry: Retry policy for failed (or timed-out) articles.
+            If it is not given, errors of ``func`` are raised as they are.
 
     Returns:
         List of mapped articles by ``func`` with each
         original article stored in the ``origin`` attribute.
-        If timeout occurs, the original article is returned.
+        If timeout occurs (or all attempts fail), the original
+        article is returned.
+
+    """
+    mapped = aiter_map(
+        func,
+        articles,
+        concurrency=concurrency,
+        timeout=timeout,
+        retry=retry,
+    )
+    return [article async for article in mapped]
+
+
+async def aiter_map(
+    func: Callable[[TArticle], Finally[TArticle]],
+    articles: Articles[TArticle],
+    /,
+    *,
+    concurrency: Union[int, AdaptiveConcurrency] = CONCURRENCY,
+    timeout: float = TIMEOUT,
+    retry: Optional[Retry] = None,
+    ordered: bool = True,
+) -> AsyncIterator[TArticle]:
+    """Article-to-article map async generator.
+
+    Unlike :func:`amap`, it consumes ``articles`` lazily and yields
+    each mapped article as soon as it is ready. Articles are mapped by
+    ``concurrency`` workers pulling them from a bounded queue, and at
+    most ``concurrency`` articles are in flight or waiting to be yielded
+    at once, so that memory usage does not grow with the number of articles.
+
+    Args:
+        func: Function or coroutine function for mapping.
+        articles: Articles (or async iterable of them) to be mapped.
+            If it is a :class:`ThreadedIterator`, it is consumed in
+            a worker thread so that fetching articles does not block
+            the event loop.
+        concurrency: Number of concurrent executions.
+            Only used when ``func`` is a coroutine function.
+            If it is an adaptive concurrency limit, the number is
+            adjusted by the latencies and failures of ``func``
+            (waiting for the limit is not counted in ``timeout``).
+        timeout: Timeout per article in seconds.
+            Only used when ``func`` is a coroutine function.
+            If ``retry`` is given, it is the timeout per attempt.
+        retry: Retry policy for failed (or timed-out) articles.
+            If it is not given, errors of ``func`` are raised as they are.
+        ordered: If True, mapped articles are yielded in the original
+            order. Otherwise, they are yielded in the order of completion
+            so that a slow article does not hold back the others.
+
+    Yields:
+        Mapped articles by ``func`` with each original
+        article stored in the ``origin`` attribute.
+        If timeout occurs (or all attempts fail), the original
+        article is yielded.
 
     """
+    adaptive: Optional[AdaptiveConcurrency] = None
+
+    if isinstance(concurrency, AdaptiveConcurrency):
+        adaptive = concurrency
+        func = partial(adaptive.observe, func)
+        concurrency = adaptive.maximum
+
+    concurrency = max(1, concurrency)
+    inputs: Queue[Optional[tuple[int, TArticle, float]]] = Queue(concurrency)
+    outputs: Queue[Outcome[TArticle]] = Queue()
+    slots = Semaphore(concurrency)
+
+    async def produce() -> None:
+        index = 0
+
+        try:
+            async for article in aiterate(articles):
+                await slots.acquire()
+                await inputs.put((index, article, perf_counter()))
+                index += 1
+        except Exception as error:
+            outputs.put_nowait((index, error))
+            index += 1
+
+        # end of inputs (for workers) and outputs (for consumer)
+        for _ in range(concurrency):
+            await inputs.put(None)
+
+        outputs.put_nowait((index, None))
+
+    async def work() -> None:
+        while (item := await inputs.get()) is not None:
+            index, article, queued = item
+            REGISTRY.observe("aixiv_queue_wait_seconds", perf_counter() - queued)
+
+            # wait for the adaptive limit outside the timeout of func
+            if adaptive is not None:
+                await adaptive.acquire()
+
+            try:
+                outputs.put_nowait((index, await apply(func, article, timeout, retry)))
+            except Exception as error:
+                outputs.put_nowait((index, error))
+            finally:
+                if adaptive is not None:
+                    adaptive.release()
+
+    tasks: list[Task[None]] = [create_task(produce())]
+    tasks.extend(create_task(work()) for _ in range(concurrency))
+    buffer: dict[int, Union[TArticle, Exception]] = {}
+    total: Optional[int] = None
+    yielded = 0
+
+    try:
+        while total is None or yielded < total:
+            index, result = await outputs.get()
+
+            if result is None:
+                total = index
+                continue
+
+            if not ordered:
+                buffer[yielded] = result
+            else:
+                buffer[index] = result
+
+            while yielded in buffer:
+                if isinstance(result := buffer.pop(yielded), Exception):
+                    raise result
+
+                yield result
+                yielded += 1
+                slots.release()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def aiterate(articles: Articles[TArticle], /) -> AsyncIterator[TArticle]:
+    """Iterate articles asynchronously (without blocking the event loop)."""
+    if isinstance(articles, AsyncIterable):
+        async for article in articles:
+            yield article
+    elif isinstance(articles, ThreadedIterator):
+
+        def next_article() -> Optional[TArticle]:
+            return next(articles, None)
+
+        while True:
+            if (next_ := await to_thread(next_article)) is None:
+                break
+
+            yield next_
+    else:
+        for article in articles:
+            yield article
+
+
+async def apply(
+    func: Callable[[TArticle], Finally[TArticle]],
+    article: TArticle,
+    timeout: float,
+    retry: Optional[Retry] = None,
+    /,
+) -> TArticle:
+    """Apply an article-to-article function to an article with timeout."""
 
     async def afunc(article: TArticle, /) -> TArticle:
         if isinstance(result := func(article), Awaitable):
@@ -105,23 +543,32 @@ def amap(
         else:
             return replace(result, origin=article)
 
-    async def main() -> list[TArticle]:
-        sem = Semaphore(concurrency)
-
-        async def runner(article: TArticle, /) -> TArticle:
-            async with sem:
-                try:
-                    LOGGER.debug(f"Start processing {article:100}.")
-                    return await wait_for(afunc(article), timeout)
-                except TimeoutError:
-                    LOGGER.warning(
-                        f"Timeout in processing {article:100}."
-                        "The original article was returned instead."
-                    )
-                    return article
-                finally:
-                    LOGGER.debug(f"Finish processing {article:100}.")
-
-        return list(await gather(*map(runner, articles)))
+    start = perf_counter()
 
-    return run(main())
+    try:
+        LOGGER.debug(f"Start processing {article:100}.")
+
+        if retry is None:
+            return await wait_for(afunc(article), timeout)
+
+        return await retry.run(partial(afunc, article), timeout, article.url)
+    except TimeoutError:
+        REGISTRY.inc("aixiv_timeouts_total")
+        LOGGER.warning(
+            f"Timeout in processing {article:100}."
+            "The original article was returned instead."
+        )
+        return article
+    except Exception as error:
+        if retry is None:
+            raise
+
+        REGISTRY.inc("aixiv_failures_total")
+        LOGGER.warning(
+            f"Failed to process {article:100} ({error!r}). "
+            "The original article was returned instead."
+        )
+        return article
+    finally:
+        REGISTRY.observe("aixiv_article_seconds", perf_counter() - start)
+        LOGGER.debug(f"Finish processing {article:100}.")
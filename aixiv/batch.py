@@ -0,0 +1,345 @@
+__all__ = ["Batcher", "BatchError", "Singleflight", "dumps_batch", "loads_batch"]
+
+
+# standard library
+from asyncio import (
+    Future,
+    Task,
+    TimerHandle,
+    ensure_future,
+    gather,
+    get_running_loop,
+    shield,
+)
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from hashlib import sha256
+from json import JSONDecodeError, dumps, loads
+from logging import getLogger
+from time import perf_counter
+from typing import Optional
+
+
+# dependencies
+from .limiter import estimate_tokens
+from .metrics import REGISTRY
+
+
+# type hints
+Request = Callable[[list[str]], Awaitable[list[str]]]
+Call = Callable[[str], Awaitable[str]]
+
+
+# constants
+ARRAY_START = "["
+ARRAY_END = "]"
+LINGER = 0.05
+SINGLEFLIGHT_MAXSIZE = 10_000
+SINGLEFLIGHT_FRESH: ContextVar[bool] = ContextVar("SINGLEFLIGHT_FRESH", default=False)
+LOGGER = getLogger(__name__)
+
+
+class BatchError(ValueError):
+    """Error raised when a batch response does not match its request."""
+
+    pass
+
+
+@dataclass
+class Batcher:
+    """Coalesce concurrent single-text requests into batch requests.
+
+    Texts submitted while a batch is open are packed together until
+    the batch reaches ``size`` texts or ``tokens`` (estimated) tokens,
+    or until ``linger`` seconds have passed since the first submission.
+    If a batch request fails with :class:`BatchError` (e.g. misaligned
+    or partial response), each text is sent again as a single request.
+
+    Args:
+        request: Coroutine function that sends a single request for texts
+            and returns their results in the same order.
+        size: Maximum number of texts per request.
+        tokens: Maximum number of (estimated) tokens per request.
+        linger: Maximum waiting time in seconds to fill a batch.
+        name: Name of the requester (e.g. translator) for the metrics.
+
+    """
+
+    request: Request
+    """Coroutine function that sends a single request for texts."""
+
+    size: int = 1
+    """Maximum number of texts per request."""
+
+    tokens: Optional[int] = None
+    """Maximum number of (estimated) tokens per request."""
+
+    linger: float = LINGER
+    """Maximum waiting time in seconds to fill a batch."""
+
+    name: str = ""
+    """Name of the requester (e.g. translator) for the metrics."""
+
+    pending: list[tuple[str, "Future[str]"]] = field(
+        default_factory=list,
+        init=False,
+        repr=False,
+    )
+    """Texts (and their futures) of the open batch."""
+
+    handle: Optional[TimerHandle] = field(default=None, init=False, repr=False)
+    """Timer handle to flush the open batch."""
+
+    tasks: set["Task[None]"] = field(default_factory=set, init=False, repr=False)
+    """Running batch requests."""
+
+    async def __call__(self, text: str, /) -> str:
+        """Submit a text and wait for its result."""
+        if self.size <= 1:
+            return (await self.run_single(text))[0]
+
+        loop = get_running_loop()
+        future: Future[str] = loop.create_future()
+
+        if self.pending and self.tokens is not None:
+            pending = sum(estimate_tokens(item) for item, _ in self.pending)
+
+            if pending + estimate_tokens(text) > self.tokens:
+                self.flush()
+
+        self.pending.append((text, future))
+
+        if len(self.pending) >= self.size:
+            self.flush()
+        elif self.handle is None:
+            self.handle = loop.call_later(self.linger, self.flush)
+
+        return await future
+
+    async def pack(self, texts: list[str], /) -> list[str]:
+        """Send texts together as a request regardless of the batch size.
+
+        If the request fails with :class:`BatchError`,
+        each text is sent again as a single request.
+
+        Args:
+            texts: Texts to be sent together.
+
+        Returns:
+            Results of the texts in the same order.
+
+        """
+        loop = get_running_loop()
+        pending = [(text, loop.create_future()) for text in texts]
+        await self.run_batch(pending)
+        return list(await gather(*(future for _, future in pending)))
+
+    def flush(self) -> None:
+        """Send the open batch as a request (if any)."""
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+
+        if not self.pending:
+            return
+
+        pending, self.pending = self.pending, []
+        task = get_running_loop().create_task(self.run_batch(pending))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def run_batch(self, pending: list[tuple[str, "Future[str]"]], /) -> None:
+        """Send a batch request and set the results to the futures."""
+        texts = [text for text, _ in pending]
+
+        try:
+            results = await self.send(texts)
+
+            if len(results) != len(texts):
+                raise BatchError(f"Expected {len(texts)} results: {len(results)}.")
+        except BatchError as error:
+            if len(texts) == 1:
+                set_exception(pending[0][1], error)
+                return
+
+            LOGGER.warning(f"{error} Falling back to per-text requests.")
+            await gather(*(self.run_batch([item]) for item in pending))
+            return
+        except Exception as error:
+            for _, future in pending:
+                set_exception(future, error)
+
+            return
+
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def run_single(self, text: str, /) -> list[str]:
+        """Send a single request for a text."""
+        results = await self.send([text])
+
+        if len(results) != 1:
+            raise BatchError(f"Expected 1 result: {len(results)}.")
+
+        return results
+
+    async def send(self, texts: list[str], /) -> list[str]:
+        """Send a request for texts and record its metrics."""
+        start = perf_counter()
+        tokens = sum(map(estimate_tokens, texts))
+        REGISTRY.inc("aixiv_request_texts_total", len(texts), requester=self.name)
+        REGISTRY.inc("aixiv_request_tokens_total", tokens, requester=self.name)
+
+        try:
+            return await self.request(texts)
+        except Exception:
+            REGISTRY.inc("aixiv_request_errors_total", requester=self.name)
+            raise
+        finally:
+            elapsed = perf_counter() - start
+            REGISTRY.observe("aixiv_request_seconds", elapsed, requester=self.name)
+
+
+@dataclass
+class Singleflight:
+    """Deduplicate calls for identical texts by their content hash.
+
+    Concurrent calls for the same text share a single in-flight call
+    and its result is fanned out to all of them. Results of completed
+    calls are also kept (up to ``maxsize`` texts, least recently used
+    first out) so that later calls for the same text are not sent again.
+    Failed calls are not kept so that they can be retried.
+
+    An in-flight call is cancelled once all of its callers are cancelled
+    (e.g. timed out). Calls in a context where :data:`SINGLEFLIGHT_FRESH`
+    is set (i.e. retries and hedged requests of :class:`aixiv.retry.Retry`)
+    do not join an in-flight call but send a new one.
+
+    Args:
+        call: Coroutine function that processes a single text.
+        maxsize: Maximum number of kept results.
+
+    """
+
+    call: Call
+    """Coroutine function that processes a single text."""
+
+    maxsize: int = SINGLEFLIGHT_MAXSIZE
+    """Maximum number of kept results."""
+
+    calls: int = field(default=0, init=False)
+    """Number of calls actually sent."""
+
+    saved: int = field(default=0, init=False)
+    """Number of calls saved by deduplication."""
+
+    inflight: dict[str, "Future[str]"] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+    """In-flight calls keyed by the hashes of texts."""
+
+    waiters: dict["Future[str]", int] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+    """Numbers of callers waiting for the in-flight calls."""
+
+    results: OrderedDict[str, str] = field(
+        default_factory=OrderedDict,
+        init=False,
+        repr=False,
+    )
+    """Results of completed calls keyed by the hashes of texts."""
+
+    async def __call__(self, text: str, /) -> str:
+        """Submit a text and wait for its (possibly shared) result."""
+        key = sha256(text.encode()).hexdigest()
+
+        if (result := self.results.get(key)) is not None:
+            self.results.move_to_end(key)
+            self.saved += 1
+            return result
+
+        future = None if SINGLEFLIGHT_FRESH.get() else self.inflight.get(key)
+
+        if future is not None:
+            self.saved += 1
+        else:
+            self.inflight[key] = future = ensure_future(self.call(text))
+            self.calls += 1
+
+            def done(future: "Future[str]", /) -> None:
+                if self.inflight.get(key) is future:
+                    del self.inflight[key]
+
+                if not future.cancelled() and future.exception() is None:
+                    self.results[key] = future.result()
+
+                    if len(self.results) > self.maxsize:
+                        self.results.popitem(last=False)
+
+            future.add_done_callback(done)
+
+        self.waiters[future] = self.waiters.get(future, 0) + 1
+
+        try:
+            # shield the shared call from the cancellation of one of callers
+            return await shield(future)
+        finally:
+            if (waiters := self.waiters.pop(future) - 1) > 0:
+                self.waiters[future] = waiters
+            elif not future.done():
+                future.cancel()
+
+    def clear(self) -> None:
+        """Clear the kept results (but not the statistics)."""
+        self.results.clear()
+
+
+def set_exception(future: "Future[str]", error: BaseException, /) -> None:
+    """Set an exception to a future unless it is done (e.g. cancelled)."""
+    if not future.done():
+        future.set_exception(error)
+
+
+def dumps_batch(texts: list[str], /) -> str:
+    """Dump texts to a JSON array for a batch prompt."""
+    return dumps(texts, ensure_ascii=False, indent=1)
+
+
+def loads_batch(string: str, length: int, /) -> list[str]:
+    """Load results from a JSON array in a batch response.
+
+    Args:
+        string: Response possibly including the JSON array
+            (e.g. wrapped by Markdown code fences).
+        length: Expected number of results.
+
+    Returns:
+        Results loaded from the JSON array.
+
+    Raises:
+        BatchError: Raised if the JSON array cannot be loaded
+            or does not have ``length`` strings.
+
+    """
+    start, end = string.find(ARRAY_START), string.rfind(ARRAY_END)
+
+    try:
+        results = loads(string[start : end + 1])
+    except JSONDecodeError as error:
+        raise BatchError(f"Failed to load a JSON array: {error}.") from error
+
+    if not isinstance(results, list) or len(results) != length:
+        raise BatchError(f"Expected {length} results: {string!r}.")
+
+    if not all(isinstance(result, str) for result in results):
+        raise BatchError(f"Expected results of strings: {string!r}.")
+
+    return results
@@ -0,0 +1,433 @@
+__all__ = ["Cache", "CacheInfo", "Response", "ResponseCache"]
+
+
+# standard library
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from hashlib import sha256
+from json import dumps, loads
+from logging import getLogger
+from pathlib import Path
+from re import compile
+from sqlite3 import Connection, connect
+from time import time
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
+
+
+# dependencies
+from typing_extensions import Self
+from .article import TArticle
+from .defaults import (
+    CACHE_MAXAGE,
+    CACHE_MAXSIZE,
+    CACHE_PATH,
+    RESPONSE_CACHE_MAXSIZE,
+    RESPONSE_CACHE_PATH,
+    RESPONSE_CACHE_SETTLE,
+    RESPONSE_CACHE_TTL,
+)
+from .metrics import REGISTRY
+
+
+# type hints
+if TYPE_CHECKING:
+    from .translate import Translator
+
+
+# constants
+ARXIV_DATE_FORMAT = "%Y%m%d%H%M%S"
+ARXIV_WINDOW_PATTERN = compile(r"submittedDate:\[(\d+) TO (\d+)\]")
+LOGGER = getLogger(__name__)
+SQL_CREATE = """
+CREATE TABLE IF NOT EXISTS translations (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+)
+"""
+SQL_DELETE = "DELETE FROM translations WHERE key = ?"
+SQL_EVICT_AGE = "DELETE FROM translations WHERE created < ?"
+SQL_EVICT_SIZE = """
+DELETE FROM translations WHERE key IN (
+    SELECT key FROM translations ORDER BY accessed ASC LIMIT ?
+)
+"""
+SQL_INSERT = "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?)"
+SQL_MEMORY = ":memory:"
+SQL_SELECT = "SELECT value, created FROM translations WHERE key = ?"
+SQL_SIZE = "SELECT COUNT(*) FROM translations"
+SQL_TOUCH = "UPDATE translations SET accessed = ? WHERE key = ?"
+SQL_RESPONSE_CREATE = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    etag TEXT,
+    modified TEXT,
+    expires REAL,
+    accessed REAL NOT NULL
+)
+"""
+SQL_RESPONSE_EVICT = """
+DELETE FROM responses WHERE key IN (
+    SELECT key FROM responses ORDER BY accessed ASC LIMIT ?
+)
+"""
+SQL_RESPONSE_INSERT = "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)"
+SQL_RESPONSE_SELECT = (
+    "SELECT body, etag, modified, expires FROM responses WHERE key = ?"
+)
+SQL_RESPONSE_SIZE = "SELECT COUNT(*) FROM responses"
+SQL_RESPONSE_TOUCH = "UPDATE responses SET accessed = ? WHERE key = ?"
+SQL_RESPONSE_UPDATE = "UPDATE responses SET expires = ?, accessed = ? WHERE key = ?"
+TOUCH_CHUNKSIZE = 1000
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a translation cache."""
+
+    hits: int
+    """Number of cache hits."""
+
+    misses: int
+    """Number of cache misses."""
+
+    maxsize: Optional[int]
+    """Maximum number of entries (``None`` if unbounded)."""
+
+    currsize: int
+    """Current number of entries."""
+
+
+@dataclass
+class Cache:
+    """Persistent on-disk (SQLite) cache of translated articles.
+
+    Each entry is keyed by the URL of an article, the translator class,
+    the model name (if any), the target language, the summarization flag,
+    and a hash of the source texts of the fields to be translated.
+    Entries are evicted when they are older than ``maxage`` or, least
+    recently used first, when the number of entries exceeds ``maxsize``.
+    The access times of cache hits are kept in memory and written
+    in a single transaction per chunk of hits (or before eviction
+    and on close), so that a warm rerun does not commit per article.
+
+    Args:
+        path: Path of the SQLite database (``":memory:"`` for in-memory).
+        maxsize: Maximum number of entries (``None`` if unbounded).
+        maxage: Maximum age of entries in seconds (``None`` if unbounded).
+
+    """
+
+    path: Union[Path, str] = CACHE_PATH
+    """Path of the SQLite database."""
+
+    maxsize: Optional[int] = CACHE_MAXSIZE
+    """Maximum number of entries (``None`` if unbounded)."""
+
+    maxage: Optional[float] = CACHE_MAXAGE
+    """Maximum age of entries in seconds (``None`` if unbounded)."""
+
+    hits: int = field(default=0, init=False)
+    """Number of cache hits."""
+
+    misses: int = field(default=0, init=False)
+    """Number of cache misses."""
+
+    connection: Connection = field(init=False, repr=False)
+    """Connection to the SQLite database."""
+
+    accessed: dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    """Access times of cache hits not yet written to the database."""
+
+    def __post_init__(self) -> None:
+        path = Path(self.path).expanduser()
+
+        if str(path) != SQL_MEMORY:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.connection = connect(path)
+        self.connection.execute(SQL_CREATE)
+        self.connection.commit()
+
+    def get(self, translator: "Translator", article: TArticle, /) -> Optional[TArticle]:
+        """Return the cached translation of an article (if any).
+
+        Args:
+            translator: Translator for the article.
+            article: Original (untranslated) article.
+
+        Returns:
+            Translated article with the original one stored
+            in the ``origin`` attribute, or ``None`` if missed.
+
+        """
+        key = self.key(translator, article)
+        row = self.connection.execute(SQL_SELECT, (key,)).fetchone()
+
+        if row is None:
+            self.misses += 1
+            REGISTRY.inc("aixiv_cache_requests_total", result="miss")
+            return None
+
+        if self.maxage is not None and row[1] < time() - self.maxage:
+            self.connection.execute(SQL_DELETE, (key,))
+            self.connection.commit()
+            self.misses += 1
+            REGISTRY.inc("aixiv_cache_requests_total", result="miss")
+            return None
+
+        self.accessed[key] = time()
+
+        if len(self.accessed) >= TOUCH_CHUNKSIZE:
+            self.flush()
+
+        self.hits += 1
+        REGISTRY.inc("aixiv_cache_requests_total", result="hit")
+        return replace(article, **loads(row[0]), origin=article)
+
+    def set(
+        self, translator: "Translator", article: TArticle, translated: TArticle, /
+    ) -> None:
+        """Store the translation of an article.
+
+        Args:
+            translator: Translator for the article.
+            article: Original (untranslated) article.
+            translated: Translated article.
+
+        """
+        now = time()
+        key = self.key(translator, article)
+        value = dumps(
+            {name: getattr(translated, name) for name in translator.fields},
+            ensure_ascii=False,
+        )
+
+        self.accessed.pop(key, None)
+        self.connection.execute(SQL_INSERT, (key, value, now, now))
+        self.evict(now)
+        self.connection.commit()
+
+    def evict(self, now: Optional[float] = None, /) -> None:
+        """Evict expired and least recently used entries."""
+        self.touch()
+
+        if self.maxage is not None:
+            now = time() if now is None else now
+            self.connection.execute(SQL_EVICT_AGE, (now - self.maxage,))
+
+        if self.maxsize is not None:
+            if (excess := self.size() - self.maxsize) > 0:
+                self.connection.execute(SQL_EVICT_SIZE, (excess,))
+
+    def info(self) -> CacheInfo:
+        """Return the statistics of the cache."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, self.size())
+
+    def size(self) -> int:
+        """Return the current number of entries."""
+        return self.connection.execute(SQL_SIZE).fetchone()[0]
+
+    def touch(self) -> None:
+        """Write the access times of cache hits kept in memory."""
+        if self.accessed:
+            items = [(accessed, key) for key, accessed in self.accessed.items()]
+            self.connection.executemany(SQL_TOUCH, items)
+            self.accessed.clear()
+
+    def flush(self) -> None:
+        """Write the access times of cache hits in a single transaction."""
+        if self.accessed:
+            self.touch()
+            self.connection.commit()
+
+    def close(self) -> None:
+        """Close the connection to the SQLite database."""
+        self.flush()
+        self.connection.close()
+
+    @staticmethod
+    def key(translator: "Translator", article: TArticle, /) -> str:
+        """Return the cache key of an article for a translator."""
+        source = dumps(
+            [getattr(article, name) for name in translator.fields],
+            ensure_ascii=False,
+        )
+        cls = type(translator)
+        items: list[Any] = [
+            article.url,
+            f"{cls.__module__}.{cls.__qualname__}",
+            getattr(translator, "model", None),
+            translator.language,
+            translator.summarize,
+            sha256(source.encode()).hexdigest(),
+        ]
+        return sha256(dumps(items).encode()).hexdigest()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class Response(NamedTuple):
+    """Response (of the arXiv API) stored in a response cache."""
+
+    body: bytes
+    """Body of the response."""
+
+    etag: Optional[str] = None
+    """Entity tag of the response (if any)."""
+
+    modified: Optional[str] = None
+    """Last modified date of the response (if any)."""
+
+    expires: Optional[float] = None
+    """Time (POSIX timestamp) when it expires (``None`` if never)."""
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the response can be used without revalidation."""
+        return self.expires is None or self.expires > time()
+
+
+@dataclass
+class ResponseCache:
+    """Persistent on-disk (SQLite) cache of responses of the arXiv API.
+
+    Each response is keyed by the URL of the API, the normalized query,
+    the page offset and size, and the sort criterion and order. A cached
+    response is used without any request until it expires after ``ttl``
+    seconds, and then revalidated by a conditional request (with its
+    ETag or Last-Modified date) so that an unmodified page is not
+    downloaded again. Responses of queries whose date window ended
+    more than ``settle`` seconds ago (i.e. are no longer updated)
+    never expire. Entries are evicted, least recently used first,
+    when the number of entries exceeds ``maxsize``.
+
+    Args:
+        path: Path of the SQLite database (``":memory:"`` for in-memory).
+        ttl: Time to live of responses in seconds (before revalidation).
+        settle: Time in seconds after which a past date window
+            is no longer updated.
+        maxsize: Maximum number of entries (``None`` if unbounded).
+
+    """
+
+    path: Union[Path, str] = RESPONSE_CACHE_PATH
+    """Path of the SQLite database."""
+
+    ttl: float = RESPONSE_CACHE_TTL
+    """Time to live of responses in seconds (before revalidation)."""
+
+    settle: float = RESPONSE_CACHE_SETTLE
+    """Time in seconds after which a past date window is no longer updated."""
+
+    maxsize: Optional[int] = RESPONSE_CACHE_MAXSIZE
+    """Maximum number of entries (``None`` if unbounded)."""
+
+    hits: int = field(default=0, init=False)
+    """Number of fresh responses used without any request."""
+
+    revalidated: int = field(default=0, init=False)
+    """Number of responses revalidated as not modified."""
+
+    misses: int = field(default=0, init=False)
+    """Number of responses downloaded and stored."""
+
+    connection: Connection = field(init=False, repr=False)
+    """Connection to the SQLite database."""
+
+    def __post_init__(self) -> None:
+        path = Path(self.path).expanduser()
+
+        if str(path) != SQL_MEMORY:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.connection = connect(path)
+        self.connection.execute(SQL_RESPONSE_CREATE)
+        self.connection.commit()
+
+    def get(self, key: str, /) -> Optional[Response]:
+        """Return the cached response (fresh or not) of a key (if any)."""
+        row = self.connection.execute(SQL_RESPONSE_SELECT, (key,)).fetchone()
+
+        if row is None:
+            return None
+
+        response = Response(*row)
+
+        if response.fresh:
+            self.connection.execute(SQL_RESPONSE_TOUCH, (time(), key))
+            self.connection.commit()
+            self.hits += 1
+            REGISTRY.inc("aixiv_response_cache_requests_total", result="hit")
+
+        return response
+
+    def set(self, key: str, response: Response, /) -> None:
+        """Store a downloaded response of a key."""
+        row = (key, *response, time())
+        self.connection.execute(SQL_RESPONSE_INSERT, row)
+
+        if self.maxsize is not None:
+            if (excess := self.size() - self.maxsize) > 0:
+                self.connection.execute(SQL_RESPONSE_EVICT, (excess,))
+
+        self.connection.commit()
+        self.misses += 1
+        REGISTRY.inc("aixiv_response_cache_requests_total", result="miss")
+
+    def revalidate(self, key: str, expires: Optional[float], /) -> None:
+        """Update the expiration of a response revalidated as not modified."""
+        self.connection.execute(SQL_RESPONSE_UPDATE, (expires, time(), key))
+        self.connection.commit()
+        self.revalidated += 1
+        REGISTRY.inc("aixiv_response_cache_requests_total", result="revalidated")
+
+    def expires(self, query: str, /) -> Optional[float]:
+        """Return when a response of a query expires (``None`` if never)."""
+        now = time()
+
+        if (match := ARXIV_WINDOW_PATTERN.search(query)) is not None:
+            end = datetime.strptime(match[2], ARXIV_DATE_FORMAT)
+            end = end.replace(tzinfo=timezone.utc)
+
+            if end.timestamp() < now - self.settle:
+                return None
+
+        return now + self.ttl
+
+    def size(self) -> int:
+        """Return the current number of entries."""
+        return self.connection.execute(SQL_RESPONSE_SIZE).fetchone()[0]
+
+    def close(self) -> None:
+        """Close the connection to the SQLite database."""
+        self.connection.close()
+
+    @staticmethod
+    def key(url: str, query: str, start: int, size: int, *args: str) -> str:
+        """Return the cache key of a page of the arXiv API.
+
+        Args:
+            url: URL of the arXiv API.
+            query: Query string (normalized in whitespace).
+            start: Index of the first result of the page.
+            size: Maximum number of results of the page.
+            *args: Other parameters (e.g. sort criterion and order).
+
+        Returns:
+            Cache key of the page.
+
+        """
+        items: list[Any] = [url, " ".join(query.split()), start, size, *args]
+        return sha256(dumps(items).encode()).hexdigest()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -8,10 +8,40 @@ __all__ = [
     "START",
     "END",
     "FORMATTING",
+    "FORMAT_CHUNKSIZE",
+    "FORMAT_PROCESSES",
     "MAXIMUM",
     "ORDER",
     "SORT",
+    "SHARD_CONCURRENCY",
+    "SHARD_DAYS",
+    # constants (cache)
+    "CACHE_MAXAGE",
+    "CACHE_MAXSIZE",
+    "CACHE_PATH",
+    "MEMORY_PATH",
+    "MEMORY_SIMILARITY",
+    "RESPONSE_CACHE_MAXSIZE",
+    "RESPONSE_CACHE_PATH",
+    "RESPONSE_CACHE_SETTLE",
+    "RESPONSE_CACHE_TTL",
+    # constants (store)
+    "STORE_PATH",
+    # constants (index)
+    "INDEX_B",
+    "INDEX_K1",
+    "INDEX_LIMIT",
+    # constants (adaptive)
+    "ADAPTIVE_DECREASE",
+    "ADAPTIVE_MAXIMUM",
+    "ADAPTIVE_MINIMUM",
+    "ADAPTIVE_TOLERANCE",
+    # constants (retry)
+    "ATTEMPTS",
+    "BACKOFF",
+    "HEDGE",
     # constants (translate)
+    "CACHE",
     "LANGUAGE",
     "API_KEY",
     "SUMMARIZE",
@@ -20,7 +50,7 @@ __all__ = [
 
 
 # standard library
-from typing import Literal
+from typing import Literal, Optional
 
 
 # constants (article)
@@ -47,6 +77,12 @@ END = "0 day ago at midnight in UTC"
 FORMATTING = True
 """Whether to format articles."""
 
+FORMAT_CHUNKSIZE = 64
+"""Number of articles per chunk sent to a formatting process."""
+
+FORMAT_PROCESSES: Optional[int] = 1
+"""Number of formatting processes (1 for serial, None for all cores)."""
+
 MAXIMUM = 1000
 """Maximum number of articles to return."""
 
@@ -56,6 +92,83 @@ ORDER: Literal["descending"] = "descending"
 SORT: Literal["relevance"] = "relevance"
 """Sort criterion of the search results."""
 
+SHARD_CONCURRENCY = 4
+"""Number of concurrent shards of a sharded search."""
+
+SHARD_DAYS = 7.0
+"""Length of the date window of each shard of a sharded search in days."""
+
+
+# constants (cache)
+CACHE_MAXAGE = 30 * 24 * 60 * 60
+"""Maximum age of cached translations in seconds."""
+
+CACHE_MAXSIZE = 100_000
+"""Maximum number of cached translations."""
+
+CACHE_PATH = "~/.cache/aixiv/translations.db"
+"""Path of the translation cache database."""
+
+MEMORY_PATH = "~/.cache/aixiv/memory.db"
+"""Path of the translation memory database."""
+
+MEMORY_SIMILARITY = 1.0
+"""Minimum similarity of fuzzy matches in the translation memory (1 to disable)."""
+
+RESPONSE_CACHE_MAXSIZE = 10_000
+"""Maximum number of cached responses of the arXiv API."""
+
+RESPONSE_CACHE_PATH = "~/.cache/aixiv/responses.db"
+"""Path of the response cache database of the arXiv API."""
+
+RESPONSE_CACHE_SETTLE = 3 * 24 * 60 * 60
+"""Time in seconds after which a past date window is no longer updated."""
+
+RESPONSE_CACHE_TTL = 60 * 60
+"""Time to live of cached responses in seconds (before revalidation)."""
+
+
+# constants (store)
+STORE_PATH = "~/.local/share/aixiv/articles.db"
+"""Path of the local article store database."""
+
+
+# constants (index)
+INDEX_B = 0.75
+"""BM25 parameter of the document length normalization."""
+
+INDEX_K1 = 1.2
+"""BM25 parameter of the term frequency saturation."""
+
+INDEX_LIMIT = 10
+"""Maximum number of articles returned by a query of the index."""
+
+
+# constants (adaptive)
+ADAPTIVE_DECREASE = 0.5
+"""Factor by which the adaptive concurrency limit is multiplied on congestion."""
+
+ADAPTIVE_MAXIMUM = 64
+"""Maximum limit of the adaptive concurrency."""
+
+ADAPTIVE_MINIMUM = 1
+"""Minimum limit of the adaptive concurrency."""
+
+ADAPTIVE_TOLERANCE = 2.0
+"""Ratio of latency to the minimum of recent latencies to increase the limit."""
+
+
+# constants (retry)
+ATTEMPTS = 3
+"""Maximum number of attempts per article."""
+
+BACKOFF = 1.0
+"""Base delay of the exponential backoff in seconds."""
+
+HEDGE: Optional[float] = None
+"""Quantile of recent latencies to fire a hedged request (``None`` to disable)."""
+
+
 # constants (translate)
 TRANSLATOR = "aixiv.translators.Google"
 """Translator class or the path for it."""
@@ -68,3 +181,6 @@ LANGUAGE = "auto"
 
 SUMMARIZE = False
 """Whether to summarize the articles."""
+
+CACHE: Optional[str] = None
+"""Translation cache or the path for it (``None`` to disable)."""
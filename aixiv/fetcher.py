@@ -0,0 +1,475 @@
+__all__ = ["Fetcher", "HTTPError", "Page", "parse"]
+
+
+# standard library
+from asyncio import (
+    StreamReader,
+    Task,
+    TimeoutError,
+    create_task,
+    open_connection,
+    sleep,
+    wait_for,
+)
+from collections.abc import AsyncIterator, Iterable, Sequence
+from contextlib import suppress
+from dataclasses import dataclass, field
+from logging import getLogger
+from random import uniform
+from ssl import create_default_context
+from time import perf_counter
+from typing import Any, Literal, NamedTuple, Optional
+from urllib.parse import urlencode, urljoin, urlsplit
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+
+# dependencies
+from .article import Article
+from .cache import Response, ResponseCache
+from .defaults import MAXIMUM, ORDER, SORT
+from .limiter import RateLimiter
+from .metrics import REGISTRY
+
+
+# constants
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+ARXIV_DATE_LENGTH = 14
+ARXIV_ERROR_ID = "/api/errors"
+ATOM = "{http://www.w3.org/2005/Atom}"
+CHUNK_SIZE = 2**16
+DELAY = 5.0
+HTTP_NOT_MODIFIED = 304
+HTTP_OK = 200
+HTTP_REDIRECTS = (301, 302, 303, 307, 308)
+LOGGER = getLogger(__name__)
+MAX_REDIRECTS = 5
+OPENSEARCH = "{http://a9.com/-/spec/opensearch/1.1/}"
+PAGE_SIZE = 100
+RETRIES = 5
+SECONDS_PER_MINUTE = 60.0
+TIMEOUT = 30.0
+USER_AGENT = "aixiv"
+
+
+class HTTPError(Exception):
+    """Error raised when an HTTP response is not successful."""
+
+    pass
+
+
+class Page(NamedTuple):
+    """Page of the arXiv API results."""
+
+    articles: list[Article]
+    """Articles in the page."""
+
+    total: int
+    """Total number of results for the query."""
+
+    dates: list[str]
+    """Submitted dates of the articles (in the arXiv date format)."""
+
+    updated: Sequence[str] = ()
+    """Last updated dates of the articles (in the arXiv date format)."""
+
+
+@dataclass
+class Fetcher:
+    """Native async fetcher of the arXiv API.
+
+    While the articles of a page are consumed, the next page is
+    fetched in the background (prefetch). Each page is parsed
+    incrementally as its response body arrives, and requests are
+    spaced by at least ``delay`` seconds (shared by all concurrent
+    calls of the fetcher) and retried with exponential backoff.
+    If a response cache is given, fresh cached pages are used
+    without any request (nor delay), and stale ones are revalidated
+    by conditional requests.
+
+    Args:
+        url: URL of the arXiv API (may be a local stand-in server).
+        delay: Minimum interval between requests in seconds.
+        retries: Maximum number of retries per page.
+        page_size: Maximum number of articles per page.
+        timeout: Timeout per page request in seconds.
+        cache: Response cache of the arXiv API (``None`` if not cached).
+
+    """
+
+    url: str = ARXIV_API_URL
+    """URL of the arXiv API."""
+
+    delay: float = DELAY
+    """Minimum interval between requests in seconds."""
+
+    retries: int = RETRIES
+    """Maximum number of retries per page."""
+
+    page_size: int = PAGE_SIZE
+    """Maximum number of articles per page."""
+
+    timeout: float = TIMEOUT
+    """Timeout per page request in seconds."""
+
+    cache: Optional[ResponseCache] = field(default=None, compare=False)
+    """Response cache of the arXiv API (``None`` if not cached)."""
+
+    limiter: RateLimiter = field(init=False, repr=False, compare=False)
+    """Rate limiter to keep the politeness delay between requests."""
+
+    def __post_init__(self) -> None:
+        if self.delay > 0:
+            self.limiter = RateLimiter(SECONDS_PER_MINUTE / self.delay)
+        else:
+            self.limiter = RateLimiter()
+
+    async def results(
+        self,
+        query: str,
+        /,
+        *,
+        maximum: int = MAXIMUM,
+        order: Literal["ascending", "descending"] = ORDER,
+        sort: Literal["lastUpdatedDate", "relevance", "submittedDate"] = SORT,
+    ) -> AsyncIterator[Article]:
+        """Fetch articles for a query and yield them page by page.
+
+        Args:
+            query: Query string for the arXiv API.
+            maximum: Maximum number of articles to return.
+            order: Sort order of the search results.
+            sort: Sort criterion of the search results.
+
+        Yields:
+            Articles found with the query.
+
+        """
+        async for page in self.pages(query, maximum=maximum, order=order, sort=sort):
+            for article in page.articles:
+                yield article
+
+    async def pages(
+        self,
+        query: str,
+        /,
+        *,
+        maximum: int = MAXIMUM,
+        order: Literal["ascending", "descending"] = ORDER,
+        sort: Literal["lastUpdatedDate", "relevance", "submittedDate"] = SORT,
+    ) -> AsyncIterator[Page]:
+        """Fetch pages for a query while prefetching the next one.
+
+        Args:
+            query: Query string for the arXiv API.
+            maximum: Maximum number of articles to return.
+            order: Sort order of the search results.
+            sort: Sort criterion of the search results.
+
+        Yields:
+            Pages of the arXiv API results (truncated to ``maximum``).
+
+        """
+        start = 0
+        task: Optional[Task[Page]] = None
+
+        def prefetch(start: int, /) -> Task[Page]:
+            size = min(self.page_size, maximum - start)
+            return create_task(self.fetch(query, start, size, order, sort))
+
+        try:
+            if maximum <= 0:
+                return
+
+            task = prefetch(start)
+
+            while task is not None:
+                page = await task
+                stop = min(maximum, page.total)
+                task = None
+
+                if page.articles and (next_ := start + len(page.articles)) < stop:
+                    task = prefetch(next_)
+
+                yield Page(
+                    page.articles[: stop - start],
+                    page.total,
+                    page.dates[: stop - start],
+                    page.updated[: stop - start],
+                )
+                start += len(page.articles)
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def fetch(
+        self,
+        query: str,
+        start: int,
+        size: int,
+        order: Literal["ascending", "descending"] = ORDER,
+        sort: Literal["lastUpdatedDate", "relevance", "submittedDate"] = SORT,
+        /,
+    ) -> Page:
+        """Fetch a page of the arXiv API results with retries.
+
+        Args:
+            query: Query string for the arXiv API.
+            start: Index of the first result of the page.
+            size: Maximum number of results of the page.
+            order: Sort order of the search results.
+            sort: Sort criterion of the search results.
+
+        Returns:
+            Page of the arXiv API results.
+
+        """
+        params = {
+            "search_query": query,
+            "id_list": "",
+            "sortBy": sort,
+            "sortOrder": order,
+            "start": start,
+            "max_results": size,
+        }
+        url = f"{self.url}?{urlencode(params)}"
+        key, cached = "", None
+
+        if self.cache is not None:
+            key = self.cache.key(self.url, query, start, size, sort, order)
+
+            if (cached := self.cache.get(key)) is not None and cached.fresh:
+                LOGGER.debug(f"Using the cached response of {url!r}.")
+                return await parse(iterate_body(cached.body))
+
+        attempt = 0
+
+        while True:
+            await self.limiter.acquire()
+
+            try:
+                LOGGER.debug(f"Fetching {url!r} (attempt {attempt + 1}).")
+
+                with REGISTRY.time("aixiv_fetch_seconds"):
+                    page, response = await wait_for(
+                        self.get(url, cached),
+                        self.timeout,
+                    )
+
+                if not page.articles and start < page.total:
+                    raise HTTPError(f"Unexpectedly empty page: {url!r}.")
+
+                if self.cache is not None:
+                    expires = self.cache.expires(query)
+
+                    if response is None:
+                        self.cache.revalidate(key, expires)
+                    else:
+                        self.cache.set(key, response._replace(expires=expires))
+
+                return page
+            except (HTTPError, OSError, ParseError, TimeoutError) as error:
+                if attempt == self.retries:
+                    raise
+
+                backoff = self.delay * 2**attempt * uniform(0.5, 1.0)
+                REGISTRY.inc("aixiv_fetch_retries_total")
+                LOGGER.warning(f"{error!r} Retrying in {backoff:.1f} s.")
+                await sleep(backoff)
+                attempt += 1
+
+    async def get(
+        self,
+        url: str,
+        cached: Optional[Response] = None,
+        /,
+    ) -> tuple[Page, Optional[Response]]:
+        """Send a GET request and parse the response body incrementally.
+
+        Args:
+            url: URL of the request.
+            cached: Cached response of the URL to be revalidated (if any).
+                If given, the request is conditional, and the cached body
+                is parsed if the response is not modified.
+
+        Returns:
+            Page parsed from the response body, and the response to be
+            cached (``None`` if not cached or not modified).
+
+        """
+        validators = ""
+
+        if cached is not None and cached.etag is not None:
+            validators += f"If-None-Match: {cached.etag}\r\n"
+
+        if cached is not None and cached.modified is not None:
+            validators += f"If-Modified-Since: {cached.modified}\r\n"
+
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            https = parts.scheme == "https"
+            host = parts.hostname or ""
+            port = parts.port or (443 if https else 80)
+            path = f"{parts.path or '/'}?{parts.query}"
+
+            reader, writer = await open_connection(
+                host,
+                port,
+                ssl=create_default_context() if https else None,
+            )
+
+            try:
+                request = (
+                    f"GET {path} HTTP/1.0\r\n"
+                    f"Host: {parts.netloc}\r\n"
+                    f"User-Agent: {USER_AGENT}\r\n"
+                    "Accept: application/atom+xml\r\n"
+                    f"{validators}\r\n"
+                )
+                writer.write(request.encode())
+                await writer.drain()
+                status, headers = await read_head(reader)
+
+                if status in HTTP_REDIRECTS and "location" in headers:
+                    url = urljoin(url, headers["location"])
+                    continue
+
+                if status == HTTP_NOT_MODIFIED and cached is not None:
+                    return await parse(iterate_body(cached.body)), None
+
+                if status != HTTP_OK:
+                    raise HTTPError(f"HTTP status {status}: {url!r}.")
+
+                if self.cache is None:
+                    return await parse(read_body(reader)), None
+
+                chunks: list[bytes] = []
+                page = await parse(record_body(reader, chunks))
+                response = Response(
+                    b"".join(chunks),
+                    headers.get("etag"),
+                    headers.get("last-modified"),
+                )
+                return page, response
+            finally:
+                writer.close()
+
+                # errors in closing (e.g. a reset connection) do not matter
+                with suppress(OSError):
+                    await writer.wait_closed()
+
+        raise HTTPError(f"Too many redirects: {url!r}.")
+
+
+async def parse(chunks: AsyncIterator[bytes], /) -> Page:
+    """Parse chunks of an Atom feed of the arXiv API incrementally.
+
+    Args:
+        chunks: Chunks of the Atom feed (e.g. a response body).
+
+    Returns:
+        Page of the arXiv API results.
+
+    Raises:
+        HTTPError: Raised if the feed is an error of the arXiv API.
+        ParseError: Raised if the feed is not a valid XML.
+
+    """
+    parser: Any = XMLPullParser(events=("end",))
+    articles: list[Article] = []
+    dates: list[str] = []
+    updated: list[str] = []
+    total = 0
+    elapsed = 0.0
+
+    def read(events: Iterable[tuple[str, Any]]) -> None:
+        nonlocal total
+
+        for _, elem in events:
+            if elem.tag == f"{OPENSEARCH}totalResults":
+                total = int(elem.text or 0)
+            elif elem.tag == f"{ATOM}entry":
+                articles.append(to_article(elem))
+                dates.append(to_date(elem.findtext(f"{ATOM}published", "")))
+                updated.append(to_date(elem.findtext(f"{ATOM}updated", "")))
+                elem.clear()
+
+    async for chunk in chunks:
+        start = perf_counter()
+        parser.feed(chunk)
+        read(parser.read_events())
+        elapsed += perf_counter() - start
+
+    start = perf_counter()
+    parser.close()
+    read(parser.read_events())
+    REGISTRY.observe("aixiv_parse_seconds", elapsed + perf_counter() - start)
+    return Page(articles, total, dates, updated)
+
+
+async def iterate_body(body: bytes, /) -> AsyncIterator[bytes]:
+    """Yield a body (e.g. of a cached response) as a single chunk."""
+    yield body
+
+
+async def read_body(reader: StreamReader, /) -> AsyncIterator[bytes]:
+    """Read the body of an HTTP response chunk by chunk."""
+    while chunk := await reader.read(CHUNK_SIZE):
+        yield chunk
+
+
+async def record_body(
+    reader: StreamReader,
+    chunks: list[bytes],
+    /,
+) -> AsyncIterator[bytes]:
+    """Read the body of an HTTP response chunk by chunk while recording them."""
+    async for chunk in read_body(reader):
+        chunks.append(chunk)
+        yield chunk
+
+
+async def read_head(reader: StreamReader, /) -> tuple[int, dict[str, str]]:
+    """Read the status code and headers of an HTTP response.
+
+    Raises:
+        HTTPError: Raised if the status line is empty or malformed
+            (e.g. the connection is closed by the server).
+
+    """
+    line = await reader.readline()
+    parts = line.split()
+
+    if len(parts) < 2 or not parts[0].startswith(b"HTTP/") or not parts[1].isdigit():
+        raise HTTPError(f"Malformed status line: {line!r}.")
+
+    status = int(parts[1])
+    headers: dict[str, str] = {}
+
+    while (line := await reader.readline()).strip():
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    return status, headers
+
+
+def to_article(entry: Element, /) -> Article:
+    """Convert an Atom entry of the arXiv API to an article."""
+    url = entry.findtext(f"{ATOM}id", "")
+
+    if ARXIV_ERROR_ID in url:
+        raise HTTPError(entry.findtext(f"{ATOM}summary", "Unknown error."))
+
+    return Article(
+        title=entry.findtext(f"{ATOM}title", ""),
+        authors=tuple(
+            author.findtext(f"{ATOM}name", "")
+            for author in entry.iterfind(f"{ATOM}author")
+        ),
+        summary=entry.findtext(f"{ATOM}summary", ""),
+        url=url,
+    )
+
+
+def to_date(string: str, /) -> str:
+    """Convert an Atom date-time (e.g. 2021-01-01T00:00:00Z) to the arXiv one."""
+    return "".join(filter(str.isdigit, string))[:ARXIV_DATE_LENGTH]
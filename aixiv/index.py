@@ -0,0 +1,302 @@
+__all__ = ["Hit", "Index", "Postings", "tokenize"]
+
+
+# standard library
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from heapq import nlargest
+from math import log
+from operator import itemgetter
+from re import compile
+from typing import NamedTuple, Optional
+
+
+# dependencies
+from typing_extensions import Self
+from .article import Article
+from .defaults import INDEX_B, INDEX_K1, INDEX_LIMIT
+from .store import parse_id
+
+
+# constants
+COMPACTION_RATIO = 0.5
+MAX_FREQUENCY = 2**16 - 1
+TOKEN_PATTERN = compile(r"\w+")
+
+
+class Hit(NamedTuple):
+    """Article matched by a query of an index."""
+
+    article: Article
+    """Matched article."""
+
+    score: float
+    """BM25 score of the article for the query."""
+
+
+class Postings(NamedTuple):
+    """Posting list of a term (parallel arrays in the order of documents)."""
+
+    documents: array
+    """Document numbers (unsigned 32-bit integers) containing the term."""
+
+    frequencies: array
+    """Term frequencies (unsigned 16-bit integers) in the documents."""
+
+
+@dataclass
+class Index:
+    """Local in-memory inverted index of articles with BM25 ranking.
+
+    The title, summary, and authors of each article are tokenized into
+    lowercase words, and each term is mapped to its posting list of
+    document numbers and term frequencies stored in typed arrays
+    (6 bytes per posting instead of Python objects). Articles can be
+    added incrementally: those already indexed are skipped, and newer
+    versions (by arXiv ID) replace older ones, whose postings are
+    dropped by occasional compaction. The BM25 weights of queried terms
+    are cached (until documents change), and common terms of a query
+    only update the top candidates once no other document can outrank
+    them (MaxScore). Use :meth:`from_articles` with
+    :meth:`aixiv.store.Store.articles` to index a local store.
+
+    Args:
+        k1: BM25 parameter of the term frequency saturation.
+        b: BM25 parameter of the document length normalization.
+
+    """
+
+    k1: float = INDEX_K1
+    """BM25 parameter of the term frequency saturation."""
+
+    b: float = INDEX_B
+    """BM25 parameter of the document length normalization."""
+
+    articles: list[Optional[Article]] = field(default_factory=list, init=False)
+    """Indexed articles by document number (``None`` if replaced)."""
+
+    lengths: array = field(default_factory=lambda: array("I"), init=False)
+    """Numbers of tokens of the documents by document number."""
+
+    numbers: dict[str, int] = field(default_factory=dict, init=False)
+    """Document numbers of the latest versions by arXiv ID."""
+
+    postings: dict[str, Postings] = field(default_factory=dict, init=False)
+    """Posting lists by term."""
+
+    removed: dict[str, int] = field(default_factory=dict, init=False)
+    """Numbers of postings of removed documents by term."""
+
+    total: int = field(default=0, init=False)
+    """Total number of tokens of the latest versions."""
+
+    norms: Optional[list[float]] = field(default=None, init=False, repr=False)
+    """Cached length normalization of the documents (``None`` if outdated)."""
+
+    weights: dict[str, array] = field(default_factory=dict, init=False, repr=False)
+    """Cached BM25 weights of the postings by term."""
+
+    bounds: dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    """Cached upper bounds (maximum weights) of the postings by term."""
+
+    @classmethod
+    def from_articles(cls, articles: Iterable[Article], /, **options: float) -> Self:
+        """Create an index from articles."""
+        index = cls(**options)
+        index.add(articles)
+        return index
+
+    def add(self, articles: Iterable[Article], /) -> int:
+        """Add articles to the index incrementally.
+
+        Articles already indexed (or older versions than indexed ones)
+        are skipped, and newer versions replace the indexed ones.
+
+        Args:
+            articles: Articles to be indexed.
+
+        Returns:
+            Number of newly indexed articles.
+
+        """
+        added = 0
+
+        for article in articles:
+            id, version = parse_id(article.url)
+
+            if (number := self.numbers.get(id)) is not None:
+                indexed = self.articles[number]
+
+                if indexed is not None and (
+                    indexed == article or version < parse_id(indexed.url)[1]
+                ):
+                    continue
+
+                self.remove(number)
+
+            self.insert(id, article)
+            added += 1
+
+        if len(self.articles) - len(self) > COMPACTION_RATIO * len(self.articles):
+            self.compact()
+
+        return added
+
+    def search(self, query: str, /, *, limit: int = INDEX_LIMIT) -> list[Hit]:
+        """Return articles ranked by their BM25 scores for a query.
+
+        Args:
+            query: Query string (matched by any of its words).
+            limit: Maximum number of articles to return.
+
+        Returns:
+            Matched articles in descending order of score.
+
+        """
+        terms = {term for term in tokenize(query) if term in self.postings}
+        weights = {term: self.weigh(term) for term in terms}
+        remaining = sum(self.bounds[term] for term in terms)
+        scores: dict[int, float] = {}
+
+        # MaxScore: terms are processed in descending order of their upper
+        # bounds, and once no unseen document can reach the current top
+        # scores, the remaining (common) terms only update the candidates
+        for term in sorted(terms, key=self.bounds.__getitem__, reverse=True):
+            documents = self.postings[term].documents
+
+            if len(scores) >= limit:
+                threshold = nlargest(limit, scores.values())[-1]
+            else:
+                threshold = 0.0
+
+            if threshold > remaining:
+                scores = {
+                    number: score
+                    for number, score in scores.items()
+                    if score + remaining >= threshold
+                }
+
+                for number, score in scores.items():
+                    position = bisect_left(documents, number)
+
+                    if position < len(documents) and documents[position] == number:
+                        scores[number] = score + weights[term][position]
+            else:
+                for number, weight in zip(documents, weights[term]):
+                    scores[number] = scores.get(number, 0.0) + weight
+
+            remaining -= self.bounds[term]
+
+        hits: list[Hit] = []
+
+        for number, score in nlargest(limit, scores.items(), key=itemgetter(1)):
+            if score > 0 and (article := self.articles[number]) is not None:
+                hits.append(Hit(article, score))
+
+        return hits
+
+    def weigh(self, term: str, /) -> array:
+        """Return the BM25 weights of the postings of an indexed term.
+
+        Args:
+            term: Indexed term.
+
+        Returns:
+            BM25 weights (single-precision floats) in the order of postings
+            (zeros for removed documents).
+
+        """
+        if (weights := self.weights.get(term)) is not None:
+            return weights
+
+        if self.norms is None:
+            average = self.total / max(len(self), 1)
+            self.norms = [
+                self.k1 * (1 - self.b + self.b * length / average)
+                for length in self.lengths
+            ]
+
+        articles, norms, k1 = self.articles, self.norms, self.k1
+        frequency = len(self.postings[term].documents) - self.removed.get(term, 0)
+        idf = log(1 + (len(self) - frequency + 0.5) / (frequency + 0.5))
+        weights = array(
+            "f",
+            [
+                (
+                    idf * tf * (k1 + 1) / (tf + norms[number])
+                    if articles[number] is not None
+                    else 0.0
+                )
+                for number, tf in zip(*self.postings[term])
+            ],
+        )
+        self.weights[term] = weights
+        self.bounds[term] = max(weights, default=0.0)
+        return weights
+
+    def insert(self, id: str, article: Article, /) -> None:
+        """Insert an article as a new document."""
+        number = len(self.articles)
+        counts = Counter(tokenize_article(article))
+
+        for term, count in counts.items():
+            if (postings := self.postings.get(term)) is None:
+                postings = Postings(array("I"), array("H"))
+                self.postings[term] = postings
+
+            postings.documents.append(number)
+            postings.frequencies.append(
+                count if count <= MAX_FREQUENCY else MAX_FREQUENCY
+            )
+
+        length = sum(counts.values())
+        self.articles.append(article)
+        self.lengths.append(length)
+        self.numbers[id] = number
+        self.total += length
+        self.norms = None
+        self.weights.clear()
+        self.bounds.clear()
+
+    def remove(self, number: int, /) -> None:
+        """Remove a document (its postings are dropped by compaction)."""
+        if (article := self.articles[number]) is None:
+            return
+
+        for term in set(tokenize_article(article)):
+            self.removed[term] = self.removed.get(term, 0) + 1
+
+        self.articles[number] = None
+        self.total -= self.lengths[number]
+        self.norms = None
+        self.weights.clear()
+        self.bounds.clear()
+
+    def compact(self) -> None:
+        """Renumber documents and rebuild posting lists without removed ones."""
+        articles = [article for article in self.articles if article is not None]
+        self.articles = []
+        self.lengths = array("I")
+        self.numbers = {}
+        self.postings = {}
+        self.removed = {}
+        self.total = 0
+
+        for article in articles:
+            self.insert(parse_id(article.url)[0], article)
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+
+def tokenize(text: str, /) -> list[str]:
+    """Split a text into lowercase words."""
+    return TOKEN_PATTERN.findall(text.casefold())
+
+
+def tokenize_article(article: Article, /) -> list[str]:
+    """Split the title, summary, and authors of an article into lowercase words."""
+    return tokenize(f"{article.title}\n{article.summary}\n{' '.join(article.authors)}")
@@ -0,0 +1,155 @@
+__all__ = ["RateLimiter", "estimate_tokens"]
+
+
+# standard library
+from asyncio import AbstractEventLoop, Lock, get_running_loop, sleep
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Optional
+
+
+# dependencies
+from .metrics import REGISTRY
+
+
+# constants
+CHARS_PER_TOKEN = 4
+SECONDS_PER_MINUTE = 60.0
+
+
+@dataclass
+class Bucket:
+    """Token bucket refilled continuously at a constant rate.
+
+    Args:
+        rate: Refill rate per second.
+        capacity: Maximum level of the bucket.
+
+    """
+
+    rate: float
+    """Refill rate per second."""
+
+    capacity: float
+    """Maximum level of the bucket."""
+
+    level: float = field(init=False)
+    """Current level of the bucket (may be negative)."""
+
+    updated: float = field(init=False)
+    """Last time (monotonic) when the level was updated."""
+
+    def __post_init__(self) -> None:
+        self.level = self.capacity
+        self.updated = monotonic()
+
+    def refill(self) -> None:
+        """Refill the bucket according to the elapsed time."""
+        now = monotonic()
+        self.level = min(self.capacity, self.level + self.rate * (now - self.updated))
+        self.updated = now
+
+    def delay(self, amount: float, /) -> float:
+        """Return the time in seconds until an amount can be consumed."""
+        self.refill()
+        return max(0.0, (min(amount, self.capacity) - self.level) / self.rate)
+
+    def consume(self, amount: float, /) -> None:
+        """Consume an amount from the bucket (the level may get negative)."""
+        self.refill()
+        self.level -= amount
+
+
+@dataclass
+class RateLimiter:
+    """Async rate limiter with request and token budgets.
+
+    One limiter is meant to be shared by all concurrent calls
+    to a provider so that they collectively stay within its quota.
+    Callers wait (without blocking the event loop) in FIFO order.
+    A request larger than the per-second token budget is admitted
+    once the bucket is full and its excess is paid off afterwards.
+
+    Args:
+        rpm: Maximum requests per minute (``None`` if unlimited).
+        tpm: Maximum tokens per minute (``None`` if unlimited).
+
+    """
+
+    rpm: Optional[float] = None
+    """Maximum requests per minute (``None`` if unlimited)."""
+
+    tpm: Optional[float] = None
+    """Maximum tokens per minute (``None`` if unlimited)."""
+
+    requests: Optional[Bucket] = field(default=None, init=False, repr=False)
+    """Token bucket for requests."""
+
+    tokens: Optional[Bucket] = field(default=None, init=False, repr=False)
+    """Token bucket for tokens."""
+
+    lock: Optional[Lock] = field(default=None, init=False, repr=False)
+    """Lock to serve waiting callers in FIFO order."""
+
+    loop: Optional[AbstractEventLoop] = field(default=None, init=False, repr=False)
+    """Event loop which the lock belongs to."""
+
+    def __post_init__(self) -> None:
+        if self.rpm is not None:
+            rate = self.rpm / SECONDS_PER_MINUTE
+            self.requests = Bucket(rate, max(1.0, rate))
+
+        if self.tpm is not None:
+            rate = self.tpm / SECONDS_PER_MINUTE
+            self.tokens = Bucket(rate, max(1.0, rate))
+
+    async def acquire(self, tokens: int = 0, /) -> None:
+        """Wait until a request with given tokens can be sent.
+
+        Args:
+            tokens: Number of (estimated) tokens of the request.
+
+        """
+        if self.requests is None and self.tokens is None:
+            return
+
+        start = monotonic()
+
+        async with self.get_lock():
+            while (delay := self.delay(tokens)) > 0:
+                await sleep(delay)
+
+            REGISTRY.observe("aixiv_ratelimit_wait_seconds", monotonic() - start)
+
+            if self.requests is not None:
+                self.requests.consume(1)
+
+            if self.tokens is not None:
+                self.tokens.consume(tokens)
+
+    def delay(self, tokens: int = 0, /) -> float:
+        """Return the time in seconds until a request can be sent."""
+        delays = [0.0]
+
+        if self.requests is not None:
+            delays.append(self.requests.delay(1))
+
+        if self.tokens is not None:
+            delays.append(self.tokens.delay(tokens))
+
+        return max(delays)
+
+    def get_lock(self) -> Lock:
+        """Return the lock bound to the running event loop."""
+        loop = get_running_loop()
+
+        if self.lock is None or self.loop is not loop:
+            self.lock = Lock()
+            self.loop = loop
+
+        return self.lock
+
+
+def estimate_tokens(text: str, /) -> int:
+    """Roughly estimate the number of tokens in a text."""
+    return len(text) // CHARS_PER_TOKEN + 1
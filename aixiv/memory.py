@@ -0,0 +1,249 @@
+__all__ = ["MemoryInfo", "TranslationMemory", "join_sentences", "split_sentences"]
+
+
+# standard library
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from hashlib import sha256
+from json import dumps
+from logging import getLogger
+from pathlib import Path
+from re import compile
+from sqlite3 import Connection, connect
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
+from unicodedata import normalize as normalize_unicode
+
+
+# dependencies
+from typing_extensions import Self
+from .defaults import MEMORY_PATH, MEMORY_SIMILARITY
+
+
+# type hints
+if TYPE_CHECKING:
+    from .translate import Translator
+
+
+# constants
+ABBREVIATIONS = ("al.", "cf.", "e.g.", "eq.", "eqs.", "etc.", "fig.", "i.e.", "vs.")
+CANDIDATES = 10
+LOGGER = getLogger(__name__)
+NGRAM = 2
+NO_SPACE_LANGUAGES = ("ja", "zh")
+NUMBER_PATTERN = compile(r"\d+(?:\.\d+)?")
+SENTENCE_PATTERN = compile(r"(?<=[.!?])\s+(?=[A-Z0-9$\\(\[])")
+SPACE_PATTERN = compile(r"\s+")
+SQL_CREATE = """
+CREATE TABLE IF NOT EXISTS segments (
+    id INTEGER PRIMARY KEY,
+    scope TEXT NOT NULL,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    UNIQUE (scope, source)
+);
+CREATE TABLE IF NOT EXISTS grams (
+    gram TEXT NOT NULL,
+    id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS grams_gram ON grams (gram);
+"""
+SQL_INSERT = "INSERT OR IGNORE INTO segments (scope, source, target) VALUES (?, ?, ?)"
+SQL_INSERT_GRAM = "INSERT INTO grams VALUES (?, ?)"
+SQL_MEMORY = ":memory:"
+SQL_SELECT = "SELECT target FROM segments WHERE scope = ? AND source = ?"
+SQL_SELECT_FUZZY = """
+SELECT s.source, s.target FROM grams g JOIN segments s ON s.id = g.id
+WHERE s.scope = ? AND g.gram IN ({})
+GROUP BY s.id ORDER BY COUNT(*) DESC LIMIT ?
+"""
+SQL_SIZE = "SELECT COUNT(*) FROM segments"
+
+
+class MemoryInfo(NamedTuple):
+    """Statistics of a translation memory."""
+
+    hits: int
+    """Number of exact matches."""
+
+    fuzzy: int
+    """Number of fuzzy matches."""
+
+    misses: int
+    """Number of misses."""
+
+    currsize: int
+    """Current number of sentences."""
+
+
+@dataclass
+class TranslationMemory:
+    """Persistent on-disk (SQLite) sentence-level translation memory.
+
+    Each translated sentence is keyed by its normalized source text
+    and the translator class, the model name (if any), and the target
+    language, so that a revised abstract (e.g. of a new version of
+    an article) only needs its new or changed sentences to be translated.
+    By default, only exact matches (after normalization) are reused.
+    If ``similarity`` is less than 1, a sentence is also matched fuzzily
+    with stored ones sharing the most word n-grams (through an index)
+    if their similarity (by edit operations) is at least ``similarity``
+    and they have the same numbers. Note that a fuzzy match may differ
+    in meaning (e.g. by a negation) while being highly similar.
+
+    Args:
+        path: Path of the SQLite database (``":memory:"`` for in-memory).
+        similarity: Minimum similarity (between 0 and 1) of fuzzy matches.
+            Fuzzy matching is disabled if it is 1 (default).
+
+    """
+
+    path: Union[Path, str] = MEMORY_PATH
+    """Path of the SQLite database."""
+
+    similarity: float = MEMORY_SIMILARITY
+    """Minimum similarity of fuzzy matches."""
+
+    hits: int = field(default=0, init=False)
+    """Number of exact matches."""
+
+    fuzzy: int = field(default=0, init=False)
+    """Number of fuzzy matches."""
+
+    misses: int = field(default=0, init=False)
+    """Number of misses."""
+
+    connection: Connection = field(init=False, repr=False)
+    """Connection to the SQLite database."""
+
+    def __post_init__(self) -> None:
+        path = Path(self.path).expanduser()
+
+        if str(path) != SQL_MEMORY:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.connection = connect(path)
+        self.connection.executescript(SQL_CREATE)
+        self.connection.commit()
+
+    def get(self, translator: "Translator", sentence: str, /) -> Optional[str]:
+        """Return the stored translation of a sentence (if any).
+
+        Args:
+            translator: Translator for the sentence.
+            sentence: Source sentence.
+
+        Returns:
+            Translation of the exactly or fuzzily matched sentence,
+            or ``None`` if missed.
+
+        """
+        scope, source = self.scope(translator), normalize(sentence)
+        row = self.connection.execute(SQL_SELECT, (scope, source)).fetchone()
+
+        if row is not None:
+            self.hits += 1
+            return row[0]
+
+        if self.similarity < 1 and (grams := ngrams(source)):
+            query = SQL_SELECT_FUZZY.format(", ".join("?" * len(grams)))
+            params = (scope, *grams, CANDIDATES)
+            numbers = NUMBER_PATTERN.findall(source)
+
+            for candidate, target in self.connection.execute(query, params):
+                if NUMBER_PATTERN.findall(candidate) != numbers:
+                    continue
+
+                if SequenceMatcher(None, source, candidate).ratio() >= self.similarity:
+                    self.fuzzy += 1
+                    return target
+
+        self.misses += 1
+        return None
+
+    def set(self, translator: "Translator", sentence: str, translated: str, /) -> None:
+        """Store the translation of a sentence.
+
+        Args:
+            translator: Translator for the sentence.
+            sentence: Source sentence.
+            translated: Translated sentence.
+
+        """
+        scope, source = self.scope(translator), normalize(sentence)
+        cursor = self.connection.execute(SQL_INSERT, (scope, source, translated))
+
+        if cursor.rowcount:
+            rows = [(gram, cursor.lastrowid) for gram in ngrams(source)]
+            self.connection.executemany(SQL_INSERT_GRAM, rows)
+
+        self.connection.commit()
+
+    def info(self) -> MemoryInfo:
+        """Return the statistics of the translation memory."""
+        return MemoryInfo(self.hits, self.fuzzy, self.misses, self.size())
+
+    def size(self) -> int:
+        """Return the current number of sentences."""
+        return self.connection.execute(SQL_SIZE).fetchone()[0]
+
+    def close(self) -> None:
+        """Close the connection to the SQLite database."""
+        self.connection.close()
+
+    @staticmethod
+    def scope(translator: "Translator", /) -> str:
+        """Return the scope of sentences translated by a translator."""
+        cls = type(translator)
+        items: list[Any] = [
+            f"{cls.__module__}.{cls.__qualname__}",
+            getattr(translator, "model", None),
+            translator.language,
+        ]
+        return sha256(dumps(items).encode()).hexdigest()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def join_sentences(sentences: list[str], language: str, /) -> str:
+    """Join translated sentences into a text in a language."""
+    return ("" if language in NO_SPACE_LANGUAGES else " ").join(sentences)
+
+
+def ngrams(source: str, /) -> list[str]:
+    """Return the unique word n-grams of a normalized sentence."""
+    words = source.lower().split()
+
+    if len(words) < NGRAM:
+        return words
+
+    return sorted(
+        {" ".join(words[i : i + NGRAM]) for i in range(len(words) - NGRAM + 1)}
+    )
+
+
+def normalize(sentence: str, /) -> str:
+    """Normalize a sentence (Unicode and whitespace)."""
+    return SPACE_PATTERN.sub(" ", normalize_unicode("NFKC", sentence)).strip()
+
+
+def split_sentences(text: str, /) -> list[str]:
+    """Split a text (e.g. an abstract) into sentences.
+
+    A text is split after a period, question mark, or exclamation mark
+    followed by whitespace and an uppercase letter, a digit, or math,
+    unless the period ends a common abbreviation (e.g. "et al.").
+
+    """
+    sentences: list[str] = []
+
+    for segment in SENTENCE_PATTERN.split(text.strip()):
+        if sentences and sentences[-1].split()[-1].lower() in ABBREVIATIONS:
+            sentences[-1] = f"{sentences[-1]} {segment}"
+        else:
+            sentences.append(segment)
+
+    return sentences
@@ -0,0 +1,258 @@
+__all__ = ["REGISTRY", "Histogram", "Registry"]
+
+
+# standard library
+from bisect import bisect_left
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from json import dumps
+from logging import getLogger
+from math import inf
+from time import perf_counter
+from typing import Any
+
+
+# type hints
+Hook = Callable[[str, float, dict[str, str]], None]
+Labels = tuple[tuple[str, str], ...]
+
+
+# constants
+BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+LOGGER = getLogger(__name__)
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+@dataclass
+class Histogram:
+    """Histogram of observed values with fixed buckets.
+
+    Args:
+        buckets: Upper bounds of the buckets (in ascending order).
+
+    """
+
+    buckets: tuple[float, ...] = BUCKETS
+    """Upper bounds of the buckets (in ascending order)."""
+
+    counts: list[int] = field(init=False)
+    """Number of observed values per bucket (the last one for +Inf)."""
+
+    count: int = field(default=0, init=False)
+    """Number of observed values."""
+
+    sum: float = field(default=0.0, init=False)
+    """Sum of observed values."""
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float, /) -> None:
+        """Observe a value."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float, /) -> float:
+        """Estimate a quantile (e.g. 0.99 for p99) of the observed values.
+
+        The quantile is linearly interpolated within the bucket
+        where it falls (as ``histogram_quantile`` of Prometheus).
+
+        """
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        cumulative = 0
+
+        for index, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / count
+
+            cumulative += count
+
+        return self.buckets[-1]
+
+
+@dataclass
+class Registry:
+    """Registry of the metrics (counters and histograms) of pipelines.
+
+    Metrics are identified by their names and labels (keyword arguments).
+    Hooks (callables receiving the name, value, and labels) are called
+    on every recorded value so that metrics can also be forwarded
+    to other systems (e.g. logging or tracing) as they are recorded.
+
+    """
+
+    counters: dict[str, dict[Labels, float]] = field(default_factory=dict)
+    """Counters by their names and labels."""
+
+    histograms: dict[str, dict[Labels, Histogram]] = field(default_factory=dict)
+    """Histograms by their names and labels."""
+
+    hooks: list[Hook] = field(default_factory=list)
+    """Callables called on every recorded value."""
+
+    def inc(self, name: str, value: float = 1.0, /, **labels: str) -> None:
+        """Increment a counter.
+
+        Args:
+            name: Name of the counter (e.g. ``"aixiv_retries_total"``).
+            value: Amount to increment.
+            **labels: Labels of the counter.
+
+        """
+        counters = self.counters.setdefault(name, {})
+        key = to_key(labels)
+        counters[key] = counters.get(key, 0.0) + value
+        self.call_hooks(name, value, labels)
+
+    def observe(self, name: str, value: float, /, **labels: str) -> None:
+        """Observe a value in a histogram.
+
+        Args:
+            name: Name of the histogram (e.g. ``"aixiv_request_seconds"``).
+            value: Value to be observed.
+            **labels: Labels of the histogram.
+
+        """
+        histograms = self.histograms.setdefault(name, {})
+
+        if (histogram := histograms.get(key := to_key(labels))) is None:
+            histogram = histograms[key] = Histogram()
+
+        histogram.observe(value)
+        self.call_hooks(name, value, labels)
+
+    @contextmanager
+    def time(self, name: str, /, **labels: str) -> Iterator[None]:
+        """Observe the elapsed time of a block (in seconds) in a histogram."""
+        start = perf_counter()
+
+        try:
+            yield
+        finally:
+            self.observe(name, perf_counter() - start, **labels)
+
+    def call_hooks(self, name: str, value: float, labels: dict[str, str], /) -> None:
+        """Call the hooks with a recorded value (errors are only logged)."""
+        for hook in self.hooks:
+            try:
+                hook(name, value, labels)
+            except Exception as error:
+                LOGGER.warning(f"Failed to call a metrics hook: {error!r}.")
+
+    def reset(self) -> None:
+        """Remove all recorded metrics (but not the hooks)."""
+        self.counters.clear()
+        self.histograms.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the metrics to a dictionary (with estimated quantiles)."""
+        metrics: dict[str, Any] = {}
+
+        for name, counters in sorted(self.counters.items()):
+            metrics[name] = {
+                "type": "counter",
+                "samples": [
+                    {"labels": dict(key), "value": value}
+                    for key, value in sorted(counters.items())
+                ],
+            }
+
+        for name, histograms in sorted(self.histograms.items()):
+            samples: list[dict[str, Any]] = []
+
+            for key, histogram in sorted(histograms.items()):
+                sample: dict[str, Any] = {
+                    "labels": dict(key),
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                }
+
+                for q in QUANTILES:
+                    sample[f"p{round(q * 100)}"] = histogram.quantile(q)
+
+                samples.append(sample)
+
+            metrics[name] = {"type": "histogram", "samples": samples}
+
+        return metrics
+
+    def to_json(self) -> str:
+        """Export the metrics in JSON."""
+        return dumps(self.to_dict(), ensure_ascii=False)
+
+    def to_prometheus(self) -> str:
+        """Export the metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        for name, counters in sorted(self.counters.items()):
+            lines.append(f"# TYPE {name} counter")
+
+            for key, value in sorted(counters.items()):
+                lines.append(f"{name}{format_labels(key)} {value}")
+
+        for name, histograms in sorted(self.histograms.items()):
+            lines.append(f"# TYPE {name} histogram")
+
+            for key, histogram in sorted(histograms.items()):
+                cumulative = 0
+
+                for bound, count in zip((*histogram.buckets, inf), histogram.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == inf else repr(bound)
+                    labels = format_labels((*key, ("le", le)))
+                    lines.append(f"{name}_bucket{labels} {cumulative}")
+
+                lines.append(f"{name}_sum{format_labels(key)} {histogram.sum}")
+                lines.append(f"{name}_count{format_labels(key)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def format_labels(key: Labels, /) -> str:
+    """Format labels in the Prometheus text exposition format."""
+    if not key:
+        return ""
+
+    labels = ",".join(f'{name}="{escape(value)}"' for name, value in key)
+    return f"{{{labels}}}"
+
+
+def escape(value: str, /) -> str:
+    """Escape a label value in the Prometheus text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def to_key(labels: dict[str, str], /) -> Labels:
+    """Convert labels to a hashable key (sorted by name)."""
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+# default registry
+REGISTRY = Registry()
+"""Default registry of the metrics recorded by aixiv."""
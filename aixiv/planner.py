@@ -0,0 +1,175 @@
+__all__ = ["Shard", "merge", "plan"]
+
+
+# standard library
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from heapq import merge as merge_sorted
+from itertools import zip_longest
+from operator import itemgetter
+from typing import Literal, NamedTuple, Optional
+
+
+# dependencies
+from .article import Article
+from .defaults import ORDER, SHARD_DAYS, SORT
+from .store import parse_id
+
+
+# type hints
+Result = tuple[str, Article]
+
+
+# constants
+ARXIV_DATE_FORMAT = "%Y%m%d%H%M%S"
+
+
+class Shard(NamedTuple):
+    """Shard (sub-query) of a search."""
+
+    start: str
+    """Start date of the shard (in the arXiv date format)."""
+
+    end: str
+    """End date of the shard (in the arXiv date format)."""
+
+    category: Optional[str] = None
+    """arXiv category of the shard (``None`` for any)."""
+
+    keyword: Optional[str] = None
+    """Keyword of the shard (``None`` for any)."""
+
+    @property
+    def query(self) -> str:
+        """Query string of the shard for arXiv."""
+        query = f"submittedDate:[{self.start} TO {self.end}]"
+
+        if self.category is not None:
+            query += f" AND (cat:{self.category})"
+
+        if self.keyword is not None:
+            query += f' AND (abs:"{self.keyword}")'
+
+        return query
+
+
+def plan(
+    categories: Sequence[str],
+    keywords: Sequence[str],
+    start: str,
+    end: str,
+    /,
+    *,
+    days: float = SHARD_DAYS,
+) -> list[Shard]:
+    """Plan shards of a search across date windows, categories, and keywords.
+
+    Since a search matches articles in any of the categories and with
+    any of the keywords, it is split into the shards of each date window,
+    category, and keyword, whose union of results is the same as those
+    of the search (articles matched by several shards are deduplicated
+    by :func:`merge`).
+
+    Args:
+        categories: arXiv categories of the search.
+        keywords: Keywords of the search.
+        start: Start date of the search (in the arXiv date format).
+        end: End date of the search (in the arXiv date format).
+        days: Length of the date window of each shard in days.
+
+    Returns:
+        Shards of the search (in the order of date windows).
+
+    Raises:
+        ValueError: Raised if the length of the date window is not positive.
+
+    """
+    if days <= 0:
+        raise ValueError(f"Length of the date window must be positive: {days}.")
+
+    windows: list[tuple[str, str]] = []
+    start_ = datetime.strptime(start, ARXIV_DATE_FORMAT)
+    end_ = datetime.strptime(end, ARXIV_DATE_FORMAT)
+    window = timedelta(days=days)
+
+    while True:
+        stop = min(start_ + window, end_)
+        windows.append(
+            (
+                start_.strftime(ARXIV_DATE_FORMAT),
+                stop.strftime(ARXIV_DATE_FORMAT),
+            )
+        )
+
+        if (start_ := stop) >= end_:
+            break
+
+    categories_: Sequence[Optional[str]] = categories or [None]
+    keywords_: Sequence[Optional[str]] = keywords or [None]
+
+    return [
+        Shard(start, end, category, keyword)
+        for start, end in windows
+        for category in categories_
+        for keyword in keywords_
+    ]
+
+
+def merge(
+    results: Sequence[Sequence[Result]],
+    /,
+    *,
+    order: Literal["ascending", "descending"] = ORDER,
+    sort: Literal["lastUpdatedDate", "relevance", "submittedDate"] = SORT,
+) -> list[Article]:
+    """Merge results of shards without duplicates while keeping their order.
+
+    Each article is deduplicated by its arXiv ID, keeping the latest
+    version. If the results are sorted by date, they are merged by
+    the date (keys of the results) in the sort order. Otherwise
+    (sorted by relevance), they are interleaved in the order of shards
+    so that each rank of all shards precedes the next rank.
+
+    Args:
+        results: Results of the shards as pairs of a sort key
+            (e.g. the submitted date) and an article.
+        order: Sort order of the results of each shard.
+        sort: Sort criterion of the results of each shard.
+
+    Returns:
+        Merged articles.
+
+    """
+    latest: dict[str, int] = {}
+
+    for result in results:
+        for _, article in result:
+            id, version = parse_id(article.url)
+            latest[id] = max(latest.get(id, version), version)
+
+    if sort == "relevance":
+        merged = [
+            result
+            for results_ in zip_longest(*results)
+            for result in results_
+            if result is not None
+        ]
+    else:
+        merged = list(
+            merge_sorted(
+                *results,
+                key=itemgetter(0),
+                reverse=order == "descending",
+            )
+        )
+
+    articles: list[Article] = []
+
+    for _, article in merged:
+        id, version = parse_id(article.url)
+
+        if latest.get(id) == version:
+            articles.append(article)
+            del latest[id]
+
+    return articles
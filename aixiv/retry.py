@@ -0,0 +1,274 @@
+__all__ = ["Report", "Retry", "is_retryable"]
+
+
+# standard library
+from asyncio import FIRST_COMPLETED, Future, TimeoutError, ensure_future, sleep, wait
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from logging import getLogger
+from random import uniform
+from time import monotonic
+from typing import Literal, NamedTuple, Optional, TypeVar
+
+
+# dependencies
+from .batch import SINGLEFLIGHT_FRESH, BatchError
+from .defaults import ATTEMPTS, BACKOFF, HEDGE
+from .metrics import REGISTRY
+
+
+# type hints
+T = TypeVar("T")
+
+
+# constants
+BACKOFF_MAX = 60.0
+LATENCY_SAMPLES = 10
+LATENCY_WINDOW = 100
+LOGGER = getLogger(__name__)
+REPORT_WINDOW = 1000
+RETRYABLE_ERRORS = (BatchError, OSError, TimeoutError)
+RETRYABLE_NAMES = (
+    "Connection",
+    "DeadlineExceeded",
+    "InternalServerError",
+    "RateLimit",
+    "ResourceExhausted",
+    "ServiceUnavailable",
+    "Timeout",
+    "TooManyRequests",
+)
+RETRYABLE_STATUSES = (408, 409, 425, 429, 500, 502, 503, 504)
+
+
+class Report(NamedTuple):
+    """Report of the attempts to process an article."""
+
+    name: str
+    """Name of the processed item (e.g. URL of an article)."""
+
+    attempts: int
+    """Number of attempts (not including hedged ones)."""
+
+    outcome: Literal["success", "timeout", "error"]
+    """Outcome of the last attempt."""
+
+    hedged: bool
+    """Whether any hedged request was fired."""
+
+    error: Optional[str]
+    """Representation of the last error (if any)."""
+
+    elapsed: float
+    """Elapsed time of all attempts in seconds."""
+
+
+@dataclass
+class Retry:
+    """Retry policy with exponential backoff, jitter, and hedging.
+
+    A failed attempt is retried after ``backoff * 2 ** (n - 1)`` seconds
+    (n: number of failed attempts; capped at 60 seconds) scaled by
+    a random factor between 0.5 and 1.0, as long as the error is
+    retryable and ``attempts`` is not exhausted. If ``hedge`` is given,
+    a duplicate of an attempt is fired once it takes longer than
+    the ``hedge`` quantile of recent latencies, and the first successful
+    one is used. Retries and hedged requests send new requests instead
+    of joining in-flight identical ones (see
+    :class:`aixiv.batch.Singleflight`). A report of the attempts is
+    recorded for each article (only recent ones are kept so that memory
+    usage does not grow with the number of articles), and its outcome
+    is counted by the metric ``aixiv_outcomes_total``.
+
+    Args:
+        attempts: Maximum number of attempts per article.
+        backoff: Base delay of the exponential backoff in seconds.
+        hedge: Quantile (between 0 and 1) of recent latencies
+            after which a hedged request is fired (``None`` to disable).
+
+    """
+
+    attempts: int = ATTEMPTS
+    """Maximum number of attempts per article."""
+
+    backoff: float = BACKOFF
+    """Base delay of the exponential backoff in seconds."""
+
+    hedge: Optional[float] = HEDGE
+    """Quantile of recent latencies to fire a hedged request."""
+
+    latencies: deque[float] = field(
+        default_factory=lambda: deque(maxlen=LATENCY_WINDOW),
+        init=False,
+        repr=False,
+    )
+    """Latencies of recent successful attempts in seconds."""
+
+    reports: deque[Report] = field(
+        default_factory=lambda: deque(maxlen=REPORT_WINDOW),
+        init=False,
+        repr=False,
+    )
+    """Reports of the attempts for recent articles."""
+
+    async def run(
+        self, func: Callable[[], Awaitable[T]], timeout: float, name: str
+    ) -> T:
+        """Run a coroutine function with retries (and hedging).
+
+        Args:
+            func: Coroutine function to be run (without arguments).
+            timeout: Timeout per attempt in seconds.
+            name: Name of the processed item for the report.
+
+        Returns:
+            Result of the first successful attempt.
+
+        Raises:
+            Exception: The error of the last attempt if all attempts failed
+                or the error is not retryable.
+
+        """
+        start = monotonic()
+        hedged = False
+        attempt = 1
+
+        while True:
+            try:
+                result, hedged_ = await self.attempt(
+                    func,
+                    timeout,
+                    fresh=attempt > 1,
+                )
+                hedged |= hedged_
+            except Exception as error:
+                if attempt < self.attempts and self.retryable(error):
+                    delay = self.delay(attempt)
+                    REGISTRY.inc("aixiv_retries_total")
+                    LOGGER.warning(
+                        f"{error!r} in processing {name!r}. "
+                        f"Retrying in {delay:.1f} s (attempt {attempt + 1})."
+                    )
+                    await sleep(delay)
+                    attempt += 1
+                    continue
+
+                outcome: Literal["timeout", "error"]
+                outcome = "timeout" if isinstance(error, TimeoutError) else "error"
+                elapsed = monotonic() - start
+                self.record(
+                    Report(name, attempt, outcome, hedged, repr(error), elapsed)
+                )
+                raise
+
+            elapsed = monotonic() - start
+            self.record(Report(name, attempt, "success", hedged, None, elapsed))
+            return result
+
+    def record(self, report: Report, /) -> None:
+        """Record a report of the attempts and count its outcome."""
+        self.reports.append(report)
+        REGISTRY.inc("aixiv_outcomes_total", outcome=report.outcome)
+
+    async def attempt(
+        self,
+        func: Callable[[], Awaitable[T]],
+        timeout: float,
+        /,
+        *,
+        fresh: bool = False,
+    ) -> tuple[T, bool]:
+        """Run a single attempt (with a hedged request if it is slow).
+
+        Args:
+            func: Coroutine function to be run (without arguments).
+            timeout: Timeout of the attempt in seconds.
+            fresh: Whether the attempt sends new requests instead of
+                joining in-flight identical ones (e.g. for a retry).
+
+        Returns:
+            Result of the attempt and whether a hedged request was fired.
+
+        """
+        start = monotonic()
+        threshold = self.threshold()
+        tasks: set[Future[T]] = {ensure_future(run_fresh(func) if fresh else func())}
+        errors: list[BaseException] = []
+        hedged = False
+
+        try:
+            while tasks:
+                if hedged or threshold is None or threshold >= timeout:
+                    limit = timeout
+                else:
+                    limit = threshold
+
+                done, tasks = await wait(
+                    tasks,
+                    timeout=max(0.0, limit - (monotonic() - start)),
+                    return_when=FIRST_COMPLETED,
+                )
+
+                for task in done:
+                    if (error := task.exception()) is None:
+                        self.latencies.append(monotonic() - start)
+                        return task.result(), hedged
+
+                    errors.append(error)
+
+                if done:
+                    continue
+
+                if limit == timeout:
+                    raise TimeoutError(f"Timeout after {timeout} s.")
+
+                LOGGER.debug(f"Firing a hedged request after {threshold} s.")
+                tasks.add(ensure_future(run_fresh(func)))
+                REGISTRY.inc("aixiv_hedges_total")
+                hedged = True
+
+            raise errors[-1]
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def retryable(self, error: BaseException, /) -> bool:
+        """Decide whether an error is retryable (see :func:`is_retryable`)."""
+        return is_retryable(error)
+
+    def delay(self, attempt: int, /) -> float:
+        """Return the backoff delay (with jitter) after a failed attempt."""
+        return min(BACKOFF_MAX, self.backoff * 2 ** (attempt - 1)) * uniform(0.5, 1.0)
+
+    def threshold(self) -> Optional[float]:
+        """Return the latency threshold to fire a hedged request (if any)."""
+        if self.hedge is None or len(self.latencies) < LATENCY_SAMPLES:
+            return None
+
+        latencies = sorted(self.latencies)
+        return latencies[round(self.hedge * (len(latencies) - 1))]
+
+
+async def run_fresh(func: Callable[[], Awaitable[T]], /) -> T:
+    """Run a coroutine function without joining in-flight identical calls."""
+    SINGLEFLIGHT_FRESH.set(True)
+    return await func()
+
+
+def is_retryable(error: BaseException, /) -> bool:
+    """Decide whether an error is retryable.
+
+    Timeouts, connection errors, malformed batch responses, and errors
+    with a retryable HTTP status code (e.g. 429 or 503) of the providers
+    are considered to be retryable.
+
+    """
+    if isinstance(error, RETRYABLE_ERRORS):
+        return True
+
+    for name in ("status_code", "code"):
+        if isinstance(status := getattr(error, name, None), int):
+            return status in RETRYABLE_STATUSES
+
+    return any(name in type(error).__name__ for name in RETRYABLE_NAMES)
@@ -1,63 +1,148 @@
-__all__ = ["format", "search"]
+__all__ = [
+    "aformat",
+    "aharvest",
+    "aiter_search",
+    "asearch",
+    "asearch_sharded",
+    "format",
+    "harvest",
+    "iter_search",
+    "search",
+    "search_sharded",
+]
 
 
 # standard library
-from collections.abc import Iterable, Sequence
+from asyncio import Semaphore, gather, run, to_thread
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import repeat
 from logging import getLogger
-from re import compile
-from typing import Literal
+from pathlib import Path
+from re import IGNORECASE, compile
+from time import time
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
 
 # dependencies
-from arxiv import Client, Search, SortCriterion, SortOrder
-from dateparser import parse
-from pylatexenc.latex2text import LatexNodes2Text
-from .article import Article, TArticle, amap
+from .article import Article, TArticle, ThreadedIterator, amap, amap_async
+from .fetcher import Fetcher
+from .metrics import REGISTRY
+from .planner import Result, Shard, merge, plan
+from .store import Store
 from .defaults import (
     KEYWORDS,
     CATEGORIES,
     START,
     END,
     FORMATTING,
+    FORMAT_CHUNKSIZE,
+    FORMAT_PROCESSES,
     MAXIMUM,
     ORDER,
     SORT,
+    SHARD_CONCURRENCY,
+    SHARD_DAYS,
+    STORE_PATH,
 )
 
 
+# type hints
+if TYPE_CHECKING:
+    from pylatexenc.latex2text import LatexNodes2Text
+
+
 # constants
 ARXIV_DATE_FORMAT = "%Y%m%d%H%M%S"
-ARXIV_LATEX_CONVERTER = LatexNodes2Text()
+ARXIV_LATEX_CACHE_SIZE = 2**14
+ARXIV_LATEX_MATH_PATTERN = compile(r"(\$[^$]+\$)")
+ARXIV_LATEX_PATTERN = compile(r"[\\$%&^_{}~`]|--|''")
 ARXIV_SEP_PATTERN = compile(r"\n+\s*|\n*\s+")
 ARXIV_SEP_REPL = " "
+DATE_CACHE_SIZE = 2**10
+DATE_ISO_PATTERN = compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.\d+)?)?)?"
+    r"(?:Z|[+-]\d{2}:?\d{2})?(?:\s+in\s+UTC)?",
+    IGNORECASE,
+)
+DATE_RELATIVE_PATTERN = compile(
+    r"(\d+)\s+(minute|hour|day|week)s?\s+ago(\s+at\s+midnight)?(\s+in\s+UTC)?",
+    IGNORECASE,
+)
 LOGGER = getLogger(__name__)
 
 
-def format(articles: Iterable[TArticle], /) -> list[TArticle]:
+def __getattr__(name: str) -> Any:
+    """Return module attributes constructed on first access."""
+    if name == "ARXIV_LATEX_CONVERTER":
+        return get_latex_converter()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def format(
+    articles: Iterable[TArticle],
+    /,
+    *,
+    processes: Optional[int] = FORMAT_PROCESSES,
+    chunksize: int = FORMAT_CHUNKSIZE,
+) -> list[TArticle]:
     """Format the title and summary of each article.
 
     Args:
         articles: Articles to be formatted.
+        processes: Number of formatting processes.
+            If it is one, articles are formatted serially.
+            If it is ``None``, all CPU cores are used.
+        chunksize: Number of articles per chunk sent to a process.
+            Only used when ``processes`` is not one.
 
     Returns:
         Articles with each title and summary formatted.
+        They are identical (including the order) regardless of
+        the number of processes.
 
     """
+    with REGISTRY.time("aixiv_format_seconds"):
+        if processes == 1:
+            return list(amap(format_article, articles))
+
+        articles = list(articles)
+
+        with ProcessPoolExecutor(processes) as executor:
+            formatted = executor.map(format_article, articles, chunksize=chunksize)
+            return [replace(f, origin=a) for a, f in zip(articles, formatted)]
 
-    def runner(article: TArticle, /) -> TArticle:
-        try:
-            title = convert_latex(format_sep(article.title))
-            summary = convert_latex(format_sep(article.summary))
-            return replace(article, title=title, summary=summary)
-        except Exception:
-            LOGGER.warning(
-                f"Failed to format {article:100}. "
-                "The original article was returned instead."
-            )
-            return article
 
-    return list(amap(runner, articles))
+async def aformat(
+    articles: Iterable[TArticle],
+    /,
+    *,
+    processes: Optional[int] = FORMAT_PROCESSES,
+    chunksize: int = FORMAT_CHUNKSIZE,
+) -> list[TArticle]:
+    """Format the title and summary of each article (async version).
+
+    See :func:`format` for the details. If ``processes`` is not one,
+    the process pool is driven from a worker thread so that
+    the running event loop is not blocked.
+
+    """
+    if processes == 1:
+        with REGISTRY.time("aixiv_format_seconds"):
+            return await amap_async(format_article, articles)
+
+    return await to_thread(
+        format,
+        articles,
+        processes=processes,
+        chunksize=chunksize,
+    )
 
 
 def search(
@@ -70,6 +155,7 @@ def search(
     maximum: int = MAXIMUM,
     order: Literal["ascending", "descending"] = ORDER,
     sort: Literal["lastUpdatedDate", "relevance", "submittedDate"] = SORT,
+    fetcher: Optional[Fetcher] = None,
 ) -> list[Article]:
     """Search for articles in arXiv.
 
@@ -82,20 +168,246 @@ def search(
         maximum: Maximum number of articles to return.
         order: Sort order of the search results.
         sort: Sort criterion of the search results.
+        fetcher: Native async fetcher of the arXiv API.
+            If it is not given, the ``arxiv`` package is used instead.
 
     Returns:
         Articles found with given conditions.
 
     """
-    query = f"submittedDate:[{format_date(start)} TO {format_date(end)}]"
+    return run(
+        asearch(
+            categories,
+            keywords,
+            start,
+            end,
+            formatting=formatting,
+            maximum=maximum,
+            order=order,
+            sort=sort,
+            fetcher=fetcher,
+        )
+    )
 
-    if categories:
-        sub = " OR ".join(f"cat:{cat}" for cat in categories)
-        query += f" AND ({sub})"
 
-    if keywords:
-        sub = " OR ".join(f'abs:"{kwd}"' for kwd in keywords)
-        query += f" AND ({sub})"
+async def asearch(
+    categories: Sequence[str] = CATEGORIES,
+    keywords: Sequence[str] = KEYWORDS,
+    start: str = START,
+    end: str = END,
+    *,
+    formatting: bool = FORMATTING,
+    maximum: int = MAXIMUM,
+    order: Literal["ascending", "descending"] = ORDER,
+    sort: Literal["lastUpdatedDate", "relevance", "submittedDate"] = SORT,
+    fetcher: Optional[Fetcher] = None,
+) -> list[Article]:
+    """Search for articles in arXiv (async version).
+
+    See :func:`search` for the details. If ``fetcher`` is not given,
+    the ``arxiv`` package is driven from a worker thread so that
+    the running event loop is not blocked.
+
+    """
+    query = create_query(categories, keywords, start, end)
+
+    if fetcher is None:
+        results = fetch(query, maximum=maximum, order=order, sort=sort)
+
+        with REGISTRY.time("aixiv_search_seconds"):
+            articles = await to_thread(list, results)
+    else:
+        results_ = fetcher.results(query, maximum=maximum, order=order, sort=sort)
+        articles = [article async for article in results_]
+
+    LOGGER.debug(f"Query for search: {query!r}")
+    LOGGER.debug(f"Number of articles found: {len(articles)}")
+
+    return await aformat(articles) if formatting else articles
+
+
+def search_sharded(
+    categories: Sequence[str] = CATEGORIES,
+    keywords: Sequence[str] = KEYWORDS,
+    start: str = START,
+    end: str = END,
+    *,
+    formatting: bool = FORMATTING,
+    maximum: int = MAXIMUM,
+    order: Literal["ascending", "descending"] = ORDER,
+    sort: Literal["lastUpdatedDate", "relevance", "submittedDate"] = SORT,
+    days: float = SHARD_DAYS,
+    concurrency: int = SHARD_CONCURRENCY,
+    fetcher: Optional[Fetcher] = None,
+) -> list[Article]:
+    """Search for articles in arXiv by concurrent shards.
+
+    The search is split into shards of each date window, category, and
+    keyword (see :func:`aixiv.planner.plan`), each of which is fetched
+    up to ``maximum`` articles, so that a search over large categories
+    or long periods is neither truncated by the paging of arXiv nor
+    fetched serially. Shards are fetched concurrently by one fetcher,
+    whose politeness delay between requests is shared by all shards
+    (global budget). The results are merged with deduplication by
+    arXiv ID (keeping the latest version) in the sort order
+    (see :func:`aixiv.planner.merge`), and all of them are returned:
+    ``maximum`` limits each shard (not the merged results), so that
+    the number of articles returned is not limited by it but by
+    ``days`` (i.e. the number of shards).
+
+    Args:
+        categories: arXiv categories.
+        keywords: Keywords of the search.
+        start: Start date (and time) of the search.
+        end: End date (and time) of the search.
+        formatting: Whether to format articles.
+        maximum: Maximum number of articles to fetch per shard.
+        order: Sort order of the search results.
+        sort: Sort criterion of the search results.
+        days: Length of the date window of each shard in days.
+        concurrency: Number of concurrently fetched shards.
+        fetcher: Native async fetcher of the arXiv API.
+            If it is not given, a fetcher with default options is used.
+
+    Returns:
+        Articles found with given conditions.
+
+    """
+    return run(
+        asearch_sharded(
+            categories,
+            keywords,
+            start,
+            end,
+            formatting=formatting,
+            maximum=maximum,
+            order=order,
+            sort=sort,
+            days=days,
+            concurrency=concurrency,
+            fetcher=fetcher,
+        )
+    )
+
+
+async def asearch_sharded(
+    categories: Sequence[str] = CATEGORIES,
+    keywords: Sequence[str] = KEYWORDS,
+    start: str = START,
+    end: str = END,
+    *,
+    formatting: bool = FORMATTING,
+    maximum: int = MAXIMUM,
+    order: Literal["ascending", "descending"] = ORDER,
+    sort: Literal["lastUpdatedDate", "relevance", "submittedDate"] = SORT,
+    days: float = SHARD_DAYS,
+    concurrency: int = SHARD_CONCURRENCY,
+    fetcher: Optional[Fetcher] = None,
+) -> list[Article]:
+    """Search for articles in arXiv by concurrent shards (async version).
+
+    See :func:`search_sharded` for the details.
+
+    """
+    if fetcher is None:
+        fetcher = Fetcher()
+
+    shards = plan(
+        categories,
+        keywords,
+        format_date(start),
+        format_date(end),
+        days=days,
+    )
+    semaphore = Semaphore(max(1, concurrency))
+
+    async def fetch_shard(shard: Shard, /) -> list[Result]:
+        results: list[Result] = []
+
+        async with semaphore:
+            async for page in fetcher.pages(
+                shard.query,
+                maximum=maximum,
+                order=order,
+                sort=sort,
+            ):
+                if sort == "submittedDate":
+                    results.extend(zip(page.dates, page.articles))
+                elif sort == "lastUpdatedDate":
+                    results.extend(zip(page.updated, page.articles))
+                else:
+                    results.extend(zip(repeat(""), page.articles))
+
+        if len(results) >= maximum:
+            LOGGER.warning(
+                f"Shard ({shard.query}) may be truncated at {maximum} articles. "
+                "Decrease days to split it further."
+            )
+
+        return results
+
+    LOGGER.debug(f"Number of shards for search: {len(shards)}")
+    REGISTRY.inc("aixiv_search_shards_total", len(shards))
+    results = await gather(*map(fetch_shard, shards))
+    articles = merge(results, order=order, sort=sort)
+    LOGGER.debug(f"Number of articles found: {len(articles)}")
+
+    return await aformat(articles) if formatting else articles
+
+
+def iter_search(
+    categories: Sequence[str] = CATEGORIES,
+    keywords: Sequence[str] = KEYWORDS,
+    start: str = START,
+    end: str = END,
+    *,
+    formatting: bool = FORMATTING,
+    maximum: int = MAXIMUM,
+    order: Literal["ascending", "descending"] = ORDER,
+    sort: Literal["lastUpdatedDate", "relevance", "submittedDate"] = SORT,
+) -> ThreadedIterator[Article]:
+    """Search for articles in arXiv and yield them as they arrive.
+
+    Unlike :func:`search`, each article is yielded (and formatted)
+    as soon as the page including it is fetched from arXiv,
+    so that later stages (e.g. :func:`aixiv.translate.aiter_translate`)
+    can start before the search finishes. Async pipelines consume it
+    in a worker thread (see :class:`aixiv.article.ThreadedIterator`).
+
+    Args:
+        categories: arXiv categories.
+        keywords: Keywords of the search.
+        start: Start date (and time) of the search.
+        end: End date (and time) of the search.
+        formatting: Whether to format articles.
+        maximum: Maximum number of articles to return.
+        order: Sort order of the search results.
+        sort: Sort criterion of the search results.
+
+    Returns:
+        Iterator of articles found with given conditions.
+
+    """
+    query = create_query(categories, keywords, start, end)
+    LOGGER.debug(f"Query for search: {query!r}")
+    articles = fetch(query, maximum=maximum, order=order, sort=sort)
+
+    if formatting:
+        articles = map(format_article, articles)
+
+    return ThreadedIterator(articles)
+
+
+def fetch(
+    query: str,
+    /,
+    *,
+    maximum: int = MAXIMUM,
+    order: Literal["ascending", "descending"] = ORDER,
+    sort: Literal["lastUpdatedDate", "relevance", "submittedDate"] = SORT,
+) -> Iterator[Article]:
+    """Fetch articles from arXiv page by page for a query."""
+    from arxiv import Client, Search, SortCriterion, SortOrder
 
     client = Client(delay_seconds=5, num_retries=5)
     search = Search(
@@ -104,25 +416,311 @@ def search(
         sort_order=SortOrder(order),
         max_results=maximum,
     )
-    results = client.results(search)
-    articles = list(map(Article.from_arxiv, results))
+
+    for result in client.results(search):
+        yield Article.from_arxiv(result)
+
+
+async def aiter_search(
+    categories: Sequence[str] = CATEGORIES,
+    keywords: Sequence[str] = KEYWORDS,
+    start: str = START,
+    end: str = END,
+    *,
+    formatting: bool = FORMATTING,
+    maximum: int = MAXIMUM,
+    order: Literal["ascending", "descending"] = ORDER,
+    sort: Literal["lastUpdatedDate", "relevance", "submittedDate"] = SORT,
+    fetcher: Optional[Fetcher] = None,
+) -> AsyncIterator[Article]:
+    """Search for articles in arXiv and yield them asynchronously.
+
+    It is the async counterpart of :func:`iter_search` using
+    the native async fetcher (:class:`aixiv.fetcher.Fetcher`).
+
+    Args:
+        categories: arXiv categories.
+        keywords: Keywords of the search.
+        start: Start date (and time) of the search.
+        end: End date (and time) of the search.
+        formatting: Whether to format articles.
+        maximum: Maximum number of articles to return.
+        order: Sort order of the search results.
+        sort: Sort criterion of the search results.
+        fetcher: Native async fetcher of the arXiv API.
+            If it is not given, a fetcher with default options is used.
+
+    Yields:
+        Articles found with given conditions.
+
+    """
+    query = create_query(categories, keywords, start, end)
     LOGGER.debug(f"Query for search: {query!r}")
-    LOGGER.debug(f"Number of articles found: {len(articles)}")
 
-    return format(articles) if formatting else articles
+    if fetcher is None:
+        fetcher = Fetcher()
+
+    async for article in fetcher.results(
+        query,
+        maximum=maximum,
+        order=order,
+        sort=sort,
+    ):
+        yield format_article(article) if formatting else article
+
+
+def harvest(
+    categories: Sequence[str] = CATEGORIES,
+    keywords: Sequence[str] = KEYWORDS,
+    start: str = START,
+    end: str = END,
+    *,
+    formatting: bool = FORMATTING,
+    maximum: int = MAXIMUM,
+    store: Union[Store, Path, str] = STORE_PATH,
+    fetcher: Optional[Fetcher] = None,
+) -> list[Article]:
+    """Harvest articles in arXiv incrementally into a local store.
+
+    The latest submitted date fetched for given categories and keywords
+    (watermark) is recorded in the store, and the next harvest only
+    fetches articles submitted since then (``start`` is only used
+    for the first harvest). Fetched articles are upserted into the store
+    by their arXiv ID (keeping the latest version) page by page,
+    so that an interrupted harvest resumes from the last page.
+    Use :meth:`aixiv.store.Store.untranslated` to read articles
+    not yet translated from the store.
+
+    Args:
+        categories: arXiv categories.
+        keywords: Keywords of the search.
+        start: Start date (and time) of the first harvest.
+        end: End date (and time) of the harvest.
+        formatting: Whether to format articles.
+        maximum: Maximum number of articles to fetch.
+        store: Local article store or the path for it.
+        fetcher: Native async fetcher of the arXiv API.
+            If it is not given, a fetcher with default options is used.
+
+    Returns:
+        Articles fetched in the harvest.
+
+    """
+    return run(
+        aharvest(
+            categories,
+            keywords,
+            start,
+            end,
+            formatting=formatting,
+            maximum=maximum,
+            store=store,
+            fetcher=fetcher,
+        )
+    )
+
+
+async def aharvest(
+    categories: Sequence[str] = CATEGORIES,
+    keywords: Sequence[str] = KEYWORDS,
+    start: str = START,
+    end: str = END,
+    *,
+    formatting: bool = FORMATTING,
+    maximum: int = MAXIMUM,
+    store: Union[Store, Path, str] = STORE_PATH,
+    fetcher: Optional[Fetcher] = None,
+) -> list[Article]:
+    """Harvest articles in arXiv incrementally into a local store (async version).
+
+    See :func:`harvest` for the details.
+
+    """
+    store_ = store if isinstance(store, Store) else Store(store)
+
+    if fetcher is None:
+        fetcher = Fetcher()
+
+    key = Store.key(categories, keywords)
+    articles: list[Article] = []
+
+    with ExitStack() as stack:
+        # close the store only if it is created here
+        if store_ is not store:
+            stack.callback(store_.close)
+
+        since = store_.get_watermark(key) or format_date(start)
+        query = f"submittedDate:[{since} TO {format_date(end)}]"
+        query += create_filter(categories, keywords)
+        LOGGER.debug(f"Query for harvest: {query!r}")
+
+        async for page in fetcher.pages(
+            query,
+            maximum=maximum,
+            order="ascending",
+            sort="submittedDate",
+        ):
+            if formatting:
+                formatted = list(map(format_article, page.articles))
+                page = page._replace(articles=formatted)
+
+            store_.add(page.articles, page.dates)
+
+            if page.dates:
+                store_.set_watermark(key, max(page.dates))
+
+            articles.extend(page.articles)
+
+    LOGGER.debug(f"Number of articles harvested: {len(articles)}")
+    return articles
+
+
+def create_query(
+    categories: Sequence[str],
+    keywords: Sequence[str],
+    start: str,
+    end: str,
+    /,
+) -> str:
+    """Create a query string for arXiv."""
+    query = f"submittedDate:[{format_date(start)} TO {format_date(end)}]"
+    return query + create_filter(categories, keywords)
+
+
+def create_filter(categories: Sequence[str], keywords: Sequence[str], /) -> str:
+    """Create a filter (appended to a date query) for arXiv."""
+    query = ""
+
+    if categories:
+        sub = " OR ".join(f"cat:{cat}" for cat in categories)
+        query += f" AND ({sub})"
+
+    if keywords:
+        sub = " OR ".join(f'abs:"{kwd}"' for kwd in keywords)
+        query += f" AND ({sub})"
+
+    return query
 
 
 def convert_latex(string: str, /) -> str:
-    """Convert all LaTeX commands in a string to Unicode."""
-    return ARXIV_LATEX_CONVERTER.latex_to_text(string)
+    """Convert all LaTeX commands in a string to Unicode.
+
+    Strings without any LaTeX-significant characters are returned as is.
+    If LaTeX appears only in inline math (e.g. ``$z \\sim 2$``),
+    each math fragment is converted (and memoized) separately.
+    Otherwise the whole string is converted (and memoized).
+
+    """
+    if not ARXIV_LATEX_PATTERN.search(string):
+        return string
+
+    parts = ARXIV_LATEX_MATH_PATTERN.split(string)
+
+    if any(ARXIV_LATEX_PATTERN.search(text) for text in parts[::2]):
+        return convert_latex_cached(string)
+
+    parts[1::2] = map(convert_latex_cached, parts[1::2])
+    return "".join(parts)
+
+
+@lru_cache(maxsize=ARXIV_LATEX_CACHE_SIZE)
+def convert_latex_cached(string: str, /) -> str:
+    """Convert all LaTeX commands in a string to Unicode (memoized)."""
+    return get_latex_converter().latex_to_text(string)
+
+
+@lru_cache(maxsize=None)
+def get_latex_converter() -> "LatexNodes2Text":
+    """Return the LaTeX-to-Unicode converter (constructed on first use)."""
+    from pylatexenc.latex2text import LatexNodes2Text
+
+    return LatexNodes2Text()
+
+
+def format_article(article: TArticle, /) -> TArticle:
+    """Format the title and summary of an article."""
+    try:
+        title = convert_latex(format_sep(article.title))
+        summary = convert_latex(format_sep(article.summary))
+        return replace(article, title=title, summary=summary)
+    except Exception:
+        LOGGER.warning(
+            f"Failed to format {article:100}. "
+            "The original article was returned instead."
+        )
+        return article
 
 
 def format_date(string: str, /) -> str:
-    """Format a data-like string for arXiv."""
-    if (dt := parse(string)) is not None:
-        return dt.strftime(ARXIV_DATE_FORMAT)
+    """Format a date-like string for arXiv.
+
+    ISO dates (e.g. ``2021-01-01`` or ``2021-01-01T12:00:00Z``) and
+    relative dates (e.g. ``1 day ago at midnight in UTC``) are parsed
+    without dateparser, which is only used for other strings. As with
+    dateparser, the date and time are formatted as written (i.e. not
+    converted between time zones). Results are memoized per string
+    and reference time (the current time in seconds).
+
+    Raises:
+        ValueError: Raised if the string cannot be parsed.
+
+    """
+    return format_date_cached(string, int(time()))
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def format_date_cached(string: str, timestamp: int, /) -> str:
+    """Format a date-like string for arXiv at a reference time (memoized)."""
+    if (dt := parse_date(string, timestamp)) is None:
+        from dateparser import parse
+
+        dt = parse(string)
+
+    if dt is None:
+        raise ValueError(f"Failed to parse {string!r}.")
+
+    return dt.strftime(ARXIV_DATE_FORMAT)
+
+
+def parse_date(string: str, timestamp: float, /) -> Optional[datetime]:
+    """Parse an ISO or a relative date-like string at a reference time.
+
+    Args:
+        string: Date-like string (e.g. ``1 day ago at midnight in UTC``).
+        timestamp: Reference time (POSIX timestamp) for relative dates.
+
+    Returns:
+        Parsed date and time, or ``None`` if the string is not recognized.
+
+    """
+    string = string.strip()
+
+    if match := DATE_ISO_PATTERN.fullmatch(string):
+        year, month, day, hour, minute, second = (
+            int(group or 0) for group in match.groups()
+        )
+
+        try:
+            return datetime(year, month, day, hour, minute, second)
+        except ValueError:
+            return None
+
+    if match := DATE_RELATIVE_PATTERN.fullmatch(string):
+        amount, unit, midnight, utc = match.groups()
+
+        if utc:
+            now = datetime.fromtimestamp(timestamp, timezone.utc)
+        else:
+            now = datetime.fromtimestamp(timestamp)
+
+        dt = now - timedelta(**{f"{unit.lower()}s": int(amount)})
+
+        if midnight:
+            return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        return dt
 
-    raise ValueError(f"Failed to parse {string!r}.")
+    return None
 
 
 def format_sep(string: str, /) -> str:
@@ -0,0 +1,260 @@
+__all__ = ["Store", "parse_id"]
+
+
+# standard library
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from json import dumps, loads
+from logging import getLogger
+from pathlib import Path
+from re import compile
+from sqlite3 import Connection, connect
+from typing import Any, Optional, Union
+
+
+# dependencies
+from typing_extensions import Self
+from .article import Article
+from .defaults import STORE_PATH
+
+
+# constants
+ARXIV_ID_PATTERN = compile(r"/abs/(.+?)(?:v(\d+))?$")
+LOGGER = getLogger(__name__)
+SQL_CREATE = """
+CREATE TABLE IF NOT EXISTS articles (
+    id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    authors TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    submitted TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS translations (
+    id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    language TEXT NOT NULL,
+    summarize INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    PRIMARY KEY (id, version, language, summarize)
+);
+CREATE TABLE IF NOT EXISTS watermarks (
+    query TEXT PRIMARY KEY,
+    submitted TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_submitted ON articles (submitted);
+"""
+SQL_MEMORY = ":memory:"
+SQL_SELECT = "SELECT url, title, authors, summary FROM articles ORDER BY submitted"
+SQL_SELECT_TRANSLATED = """
+SELECT a.url, a.title, a.authors, a.summary, t.title, t.summary
+FROM articles a JOIN translations t
+ON t.id = a.id AND t.version = a.version
+WHERE t.language = ? AND t.summarize = ?
+ORDER BY a.submitted
+"""
+SQL_SELECT_UNTRANSLATED = """
+SELECT a.url, a.title, a.authors, a.summary
+FROM articles a LEFT JOIN translations t
+ON t.id = a.id AND t.version = a.version
+AND t.language = ? AND t.summarize = ?
+WHERE t.id IS NULL
+ORDER BY a.submitted
+"""
+SQL_SELECT_WATERMARK = "SELECT submitted FROM watermarks WHERE query = ?"
+SQL_SIZE = "SELECT COUNT(*) FROM articles"
+SQL_UPSERT = """
+INSERT INTO articles VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    version = excluded.version,
+    url = excluded.url,
+    title = excluded.title,
+    authors = excluded.authors,
+    summary = excluded.summary,
+    submitted = excluded.submitted
+WHERE excluded.version >= articles.version
+"""
+SQL_UPSERT_TRANSLATION = "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?)"
+SQL_UPSERT_WATERMARK = """
+INSERT INTO watermarks VALUES (?, ?)
+ON CONFLICT (query) DO UPDATE SET submitted = excluded.submitted
+WHERE excluded.submitted > watermarks.submitted
+"""
+
+
+@dataclass
+class Store:
+    """Local (SQLite) store of harvested articles and their translations.
+
+    Articles are upserted by their arXiv ID, keeping the latest version.
+    The latest submitted date fetched for each query (watermark) is also
+    recorded so that incremental harvests only fetch newer submissions.
+
+    Args:
+        path: Path of the SQLite database (``":memory:"`` for in-memory).
+
+    """
+
+    path: Union[Path, str] = STORE_PATH
+    """Path of the SQLite database."""
+
+    connection: Connection = field(init=False, repr=False)
+    """Connection to the SQLite database."""
+
+    def __post_init__(self) -> None:
+        path = Path(self.path).expanduser()
+
+        if str(path) != SQL_MEMORY:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.connection = connect(path)
+        self.connection.executescript(SQL_CREATE)
+        self.connection.commit()
+
+    def add(self, articles: Iterable[Article], dates: Iterable[str], /) -> None:
+        """Upsert articles by their arXiv ID (keeping the latest version).
+
+        Args:
+            articles: Articles to be stored.
+            dates: Submitted dates of the articles (in the arXiv date format).
+
+        """
+        rows: list[tuple[Any, ...]] = []
+
+        for article, date in zip(articles, dates):
+            id, version = parse_id(article.url)
+            authors = dumps(list(article.authors), ensure_ascii=False)
+            rows.append(
+                (
+                    id,
+                    version,
+                    article.url,
+                    article.title,
+                    authors,
+                    article.summary,
+                    date,
+                )
+            )
+
+        self.connection.executemany(SQL_UPSERT, rows)
+        self.connection.commit()
+
+    def add_translations(
+        self,
+        articles: Iterable[Article],
+        /,
+        *,
+        language: str,
+        summarize: bool,
+    ) -> None:
+        """Store translated articles (with their original ones in ``origin``).
+
+        Args:
+            articles: Translated articles to be stored.
+            language: Language code of the translated articles.
+            summarize: Whether the articles were summarized.
+
+        """
+        rows: list[tuple[Any, ...]] = []
+
+        for article in articles:
+            if article.origin is None:
+                continue
+
+            id, version = parse_id(article.url)
+            rows.append(
+                (
+                    id,
+                    version,
+                    language,
+                    summarize,
+                    article.title,
+                    article.summary,
+                )
+            )
+
+        self.connection.executemany(SQL_UPSERT_TRANSLATION, rows)
+        self.connection.commit()
+
+    def articles(self) -> Iterator[Article]:
+        """Yield all stored articles in the order of submitted date."""
+        for row in self.connection.execute(SQL_SELECT):
+            yield to_article(row)
+
+    def translated(self, *, language: str, summarize: bool) -> Iterator[Article]:
+        """Yield stored translations with their original articles.
+
+        Args:
+            language: Language code of the translated articles.
+            summarize: Whether the articles were summarized.
+
+        Yields:
+            Translated articles with each original one in ``origin``.
+
+        """
+        params = (language, summarize)
+
+        for row in self.connection.execute(SQL_SELECT_TRANSLATED, params):
+            origin = to_article(row[:4])
+            yield Article(row[4], origin.authors, row[5], origin.url, origin)
+
+    def untranslated(self, *, language: str, summarize: bool) -> Iterator[Article]:
+        """Yield stored articles not yet translated.
+
+        Args:
+            language: Language code of the translated articles.
+            summarize: Whether the articles are summarized.
+
+        Yields:
+            Articles (of their latest versions) not yet translated.
+
+        """
+        params = (language, summarize)
+
+        for row in self.connection.execute(SQL_SELECT_UNTRANSLATED, params):
+            yield to_article(row)
+
+    def get_watermark(self, query: str, /) -> Optional[str]:
+        """Return the latest submitted date fetched for a query (if any)."""
+        row = self.connection.execute(SQL_SELECT_WATERMARK, (query,)).fetchone()
+        return None if row is None else row[0]
+
+    def set_watermark(self, query: str, date: str, /) -> None:
+        """Update the latest submitted date fetched for a query."""
+        self.connection.execute(SQL_UPSERT_WATERMARK, (query, date))
+        self.connection.commit()
+
+    def size(self) -> int:
+        """Return the current number of stored articles."""
+        return self.connection.execute(SQL_SIZE).fetchone()[0]
+
+    def close(self) -> None:
+        """Close the connection to the SQLite database."""
+        self.connection.close()
+
+    @staticmethod
+    def key(categories: Sequence[str], keywords: Sequence[str], /) -> str:
+        """Return the watermark key of a query."""
+        return dumps([sorted(categories), sorted(keywords)], ensure_ascii=False)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def parse_id(url: str, /) -> tuple[str, int]:
+    """Parse the arXiv ID and version of an article from its URL."""
+    if (match := ARXIV_ID_PATTERN.search(url)) is None:
+        return url, 0
+
+    return match[1], int(match[2] or 0)
+
+
+def to_article(row: Sequence[Any], /) -> Article:
+    """Convert a row of the articles table to an article."""
+    url, title, authors, summary = row
+    return Article(title, loads(authors), summary, url)
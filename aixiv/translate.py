@@ -1,22 +1,33 @@
-__all__ = ["Translator", "translate"]
+__all__ = ["Translator", "aiter_translate", "atranslate", "translate"]
 
 
 # standard library
-from abc import ABC, abstractmethod
-from collections.abc import Iterable
-from dataclasses import dataclass, field
+from abc import ABC
+from asyncio import gather, run
+from collections.abc import AsyncIterator, Awaitable, Iterable
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field, replace
 from importlib import import_module
 from logging import getLogger
 from os import environ
+from pathlib import Path
 from re import compile
-from typing import Any, Union
+from typing import Any, ClassVar, Optional, Union
 
 
 # dependencies
 from babel import Locale
-from .article import Finally, TArticle, amap
+from typing_extensions import Self
+from .adaptive import AdaptiveConcurrency, maximum
+from .article import Articles, Finally, TArticle, aiter_map, amap_async
+from .batch import Batcher, Singleflight
+from .cache import Cache
+from .limiter import RateLimiter
+from .memory import TranslationMemory, join_sentences, split_sentences
+from .retry import Retry
 from .defaults import (
     API_KEY,
+    CACHE,
     CONCURRENCY,
     LANGUAGE,
     SUMMARIZE,
@@ -25,7 +36,8 @@ from .defaults import (
 )
 
 # type hints
-TranslatorLike = Union[type["Translator"], str]
+CacheLike = Union[Cache, Path, str]
+TranslatorLike = Union["Translator", type["Translator"], str]
 
 
 # constants
@@ -45,9 +57,26 @@ class Translator(ABC):
         api_key: API key or the environment variable for it.
         language: Language code of the translated articles.
         summarize: Whether to summarize the articles.
+        rpm: Maximum requests per minute (``None`` if unlimited).
+        tpm: Maximum tokens per minute (``None`` if unlimited).
+        batch_size: Maximum number of texts per request.
+            Only used when the translator supports batch requests.
+        batch_tokens: Maximum number of (estimated) tokens per request.
+            Only used when the translator supports batch requests.
+        concurrency: Maximum number of pooled connections to the provider.
+            Only used when the translator has a client of the provider.
+        memory: Sentence-level translation memory (if any).
+            Only used when the articles are not summarized and
+            the translator calls :meth:`translate_fields`.
 
     """
 
+    fields: ClassVar[tuple[str, ...]] = ("title", "summary")
+    """Names of the article fields to be translated."""
+
+    requestable: ClassVar[bool] = False
+    """Whether the translator implements :meth:`request` to send texts."""
+
     api_key: str = field(repr=False)
     """API key of the translator."""
 
@@ -57,10 +86,194 @@ class Translator(ABC):
     summarize: bool
     """Whether to summarize the articles."""
 
-    @abstractmethod
+    rpm: Optional[float] = None
+    """Maximum requests per minute (``None`` if unlimited)."""
+
+    tpm: Optional[float] = None
+    """Maximum tokens per minute (``None`` if unlimited)."""
+
+    batch_size: int = 1
+    """Maximum number of texts per request."""
+
+    batch_tokens: Optional[int] = None
+    """Maximum number of (estimated) tokens per request."""
+
+    concurrency: int = CONCURRENCY
+    """Maximum number of pooled connections to the provider."""
+
+    memory: Optional[TranslationMemory] = field(
+        default=None,
+        repr=False,
+        compare=False,
+    )
+    """Sentence-level translation memory (if any)."""
+
+    client: Any = field(default=None, init=False, repr=False, compare=False)
+    """Client of the provider (created on first use)."""
+
+    limiter: RateLimiter = field(init=False, repr=False, compare=False)
+    """Rate limiter shared by all calls of the translator."""
+
+    batcher: Batcher = field(init=False, repr=False, compare=False)
+    """Batcher of texts shared by all calls of the translator."""
+
+    singleflight: Singleflight = field(init=False, repr=False, compare=False)
+    """Deduplicator of identical texts shared by all calls of the translator."""
+
+    def __post_init__(self) -> None:
+        cls = type(self)
+
+        if cls.__call__ is Translator.__call__ and not self.requestable:
+            raise TypeError(
+                f"{cls.__name__} must override __call__ "
+                "or implement request (and set requestable to True)."
+            )
+
+        self.limiter = RateLimiter(self.rpm, self.tpm)
+        self.batcher = Batcher(
+            self.request,
+            self.batch_size,
+            self.batch_tokens,
+            name=type(self).__name__,
+        )
+        self.singleflight = Singleflight(self.batcher)
+
     def __call__(self, article: TArticle, /) -> Finally[TArticle]:
-        """Translate (and summarize) an article."""
-        pass
+        """Translate (and summarize) an article.
+
+        Translators should override either it (to translate an article
+        as a whole) or :meth:`request` (to translate texts, in which case
+        they set :attr:`requestable` to True and the fields of an article
+        are translated by :meth:`translate_fields`).
+
+        """
+        return self.translate_fields(article)
+
+    async def translate_fields(self, article: TArticle, /) -> TArticle:
+        """Translate (and summarize) the fields of an article concurrently.
+
+        Each field listed in :attr:`fields` is submitted to :attr:`batcher`
+        at the same time, so that the requests for them are sent
+        concurrently (or packed into a batch request) within
+        the rate limits of the translator. Identical texts (e.g. of
+        cross-listed articles) are sent only once by :attr:`singleflight`.
+        If :attr:`memory` is given, only the sentences missing in it
+        are sent (see :meth:`translate_text`).
+
+        Args:
+            article: Article to be translated (and summarized).
+
+        Returns:
+            Article with each field translated (and summarized).
+
+        Raises:
+            TypeError: Raised if the translator does not implement
+                :meth:`request` to send the texts of the fields.
+
+        """
+        if not self.requestable:
+            raise TypeError(
+                f"{type(self).__name__} must implement request "
+                "(and set requestable to True) to translate fields."
+            )
+
+        texts = [getattr(article, name) for name in self.fields]
+        results: list[Any] = await gather(*map(self.translate_text, texts))
+        return replace(article, **dict(zip(self.fields, results)))
+
+    async def translate_text(self, text: str, /) -> str:
+        """Translate (and summarize) a text through the translation memory.
+
+        If :attr:`memory` is given (and the text is not summarized),
+        the text is split into sentences and only the sentences missing
+        in the memory are sent. They are packed into a single request
+        (or into batch requests with other texts if the translator sends
+        batch requests), so that a text missing in the memory costs
+        as many requests as it would without the memory.
+        The translated text is reassembled from the stored
+        and the newly translated sentences.
+
+        Args:
+            text: Text to be translated (and summarized).
+
+        Returns:
+            Translated (and summarized) text.
+
+        """
+        if self.memory is None or self.summarize or not text.strip():
+            return await self.singleflight(text)
+
+        sentences = split_sentences(text)
+        stored = [self.memory.get(self, sentence) for sentence in sentences]
+        missed = [sent for sent, hit in zip(sentences, stored) if hit is None]
+
+        if self.batched or len(missed) <= 1:
+            translated = iter(await gather(*map(self.singleflight, missed)))
+        else:
+            translated = iter(await self.batcher.pack(missed))
+
+        results: list[str] = []
+
+        for sentence, hit in zip(sentences, stored):
+            if hit is None:
+                self.memory.set(self, sentence, hit := next(translated))
+
+            results.append(hit)
+
+        return join_sentences(results, self.language)
+
+    async def request(self, texts: list[str], /) -> list[str]:
+        """Send a single request to translate (and summarize) texts.
+
+        Translators translating texts (rather than whole articles)
+        should override it and set :attr:`requestable` to True,
+        so that the fields of an article are translated by
+        :meth:`translate_fields` (see :meth:`__call__`).
+        It is never called unless :attr:`requestable` is True.
+
+        Args:
+            texts: Texts to be translated (and summarized).
+
+        Returns:
+            Translated (and summarized) texts in the same order.
+
+        Raises:
+            BatchError: Raised if the response does not match the texts.
+
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not send requests.")
+
+    def create_client(self) -> Any:
+        """Create a client of the provider.
+
+        Translators with a client should override it so that
+        the client is created once and reused by all calls.
+
+        """
+        return None
+
+    def get_client(self) -> Any:
+        """Return the client of the provider (created on first use)."""
+        if self.client is None:
+            self.client = self.create_client()
+
+        return self.client
+
+    async def aclose(self) -> None:
+        """Close the client of the provider (if any)."""
+        self.client = None
+        self.singleflight.clear()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    @property
+    def batched(self) -> bool:
+        """Whether the translator sends batch requests."""
+        return self.batch_size > 1 and self.requestable
 
 
 def translate(
@@ -72,9 +285,11 @@ def translate(
     api_key: str = API_KEY,
     language: str = LANGUAGE,
     summarize: bool = SUMMARIZE,
+    cache: Optional[CacheLike] = CACHE,
     # options for mapping
-    concurrency: int = CONCURRENCY,
+    concurrency: Union[int, AdaptiveConcurrency] = CONCURRENCY,
     timeout: float = TIMEOUT,
+    retry: Optional[Retry] = None,
     # other options for translator
     **options: Any,
 ) -> list[TArticle]:
@@ -83,21 +298,275 @@ def translate(
     Args:
         articles: Articles to be translated.
         translator: Translator class or the path for it.
+            It may also be a translator instance (see :func:`atranslate`).
         api_key: API key of the translator or the environment
             variable for it. The latter must start with ``"$"``.
         language: Language code of the translated articles.
             If it is ``"auto"``, the locale language will be used.
         summarize: Whether to summarize the articles.
+        cache: Translation cache or the path for it.
+            If it is given, only articles missing in the cache
+            will be sent to the translator. Defaults to no cache.
         concurrency: Number of concurrent executions.
             Only used when ``translator`` supports async calls.
-        timeout: Timeout per article in seconds.
+            It also sizes the connection pool of ``translator``.
+            If ``translator`` sends batch requests, it will be
+            multiplied by the batch size so that up to ``concurrency``
+            batch requests can be sent concurrently.
+            If it is an adaptive concurrency limit, the number is
+            adjusted by the latencies and failures of the requests,
+            and its maximum sizes the connection pool instead.
+        timeout: Timeout per attempt in seconds.
             Only used when ``translator`` supports async calls.
+        retry: Retry policy for failed (or timed-out) articles.
+            Defaults to :class:`aixiv.retry.Retry` with the default options.
+            Reports of the attempts for recent articles are kept
+            in its ``reports`` attribute. If all attempts fail,
+            the original article is returned instead.
         **options: Other options for ``translator`` (if any).
 
     Returns:
         Translated (and summarized) articles.
 
     """
+    return run(
+        atranslate(
+            articles,
+            translator=translator,
+            api_key=api_key,
+            language=language,
+            summarize=summarize,
+            cache=cache,
+            concurrency=concurrency,
+            timeout=timeout,
+            retry=retry,
+            **options,
+        )
+    )
+
+
+async def atranslate(
+    articles: Iterable[TArticle],
+    /,
+    *,
+    # options for translator
+    translator: TranslatorLike = TRANSLATOR,
+    api_key: str = API_KEY,
+    language: str = LANGUAGE,
+    summarize: bool = SUMMARIZE,
+    cache: Optional[CacheLike] = CACHE,
+    # options for mapping
+    concurrency: Union[int, AdaptiveConcurrency] = CONCURRENCY,
+    timeout: float = TIMEOUT,
+    retry: Optional[Retry] = None,
+    # other options for translator
+    **options: Any,
+) -> list[TArticle]:
+    """Translate (and summarize) articles (async version).
+
+    See :func:`translate` for the details. If ``translator`` is
+    a translator instance, it is used as is (the other options for
+    translator are ignored) and is not closed after the translation,
+    so that its client, rate limits, and batches can be shared by
+    several stages within one event loop.
+
+    """
+    translator_ = create_translator(
+        translator,
+        api_key,
+        language,
+        summarize,
+        maximum(concurrency),
+        **options,
+    )
+    cache_ = create_cache(cache)
+    retry_ = Retry() if retry is None else retry
+
+    if translator_.batched and isinstance(concurrency, int):
+        concurrency *= translator_.batch_size
+
+    async with AsyncExitStack() as stack:
+        stack.callback(log_singleflight, translator_)
+
+        # close the cache only if it is created here
+        if cache_ is not None and cache_ is not cache:
+            stack.callback(cache_.close)
+
+        if translator_ is not translator:
+            await stack.enter_async_context(translator_)
+
+        # translate w/o cache
+        if cache_ is None:
+            return await amap_async(
+                translator_,
+                articles,
+                concurrency=concurrency,
+                timeout=timeout,
+                retry=retry_,
+            )
+
+        # translate w/ cache
+        articles = list(articles)
+        cached = [cache_.get(translator_, article) for article in articles]
+        missed = [art for art, hit in zip(articles, cached) if hit is None]
+        LOGGER.debug(f"Cache statistics: {cache_.info()}")
+
+        translated = iter(
+            await amap_async(
+                translator_,
+                missed,
+                concurrency=concurrency,
+                timeout=timeout,
+                retry=retry_,
+            )
+        )
+
+        results: list[TArticle] = []
+
+        for article, hit in zip(articles, cached):
+            if hit is None:
+                hit = next(translated)
+
+                if is_translated(hit, article, translator_.fields):
+                    cache_.set(translator_, article, hit)
+
+            results.append(hit)
+
+        return results
+
+
+async def aiter_translate(
+    articles: Articles[TArticle],
+    /,
+    *,
+    # options for translator
+    translator: TranslatorLike = TRANSLATOR,
+    api_key: str = API_KEY,
+    language: str = LANGUAGE,
+    summarize: bool = SUMMARIZE,
+    cache: Optional[CacheLike] = CACHE,
+    # options for mapping
+    concurrency: Union[int, AdaptiveConcurrency] = CONCURRENCY,
+    timeout: float = TIMEOUT,
+    retry: Optional[Retry] = None,
+    ordered: bool = True,
+    # other options for translator
+    **options: Any,
+) -> AsyncIterator[TArticle]:
+    """Translate (and summarize) articles and yield them as they are done.
+
+    Unlike :func:`translate`, it consumes ``articles`` lazily
+    (e.g. from :func:`aixiv.search.iter_search`) and yields each
+    translated article as soon as it is ready,
+    keeping at most ``concurrency`` articles in memory at once.
+
+    Args:
+        articles: Articles (or async iterable of them) to be translated.
+        translator: Translator class or the path for it.
+            It may also be a translator instance (see :func:`atranslate`).
+        api_key: API key of the translator or the environment
+            variable for it. The latter must start with ``"$"``.
+        language: Language code of the translated articles.
+            If it is ``"auto"``, the locale language will be used.
+        summarize: Whether to summarize the articles.
+        cache: Translation cache or the path for it.
+            If it is given, only articles missing in the cache
+            will be sent to the translator. Defaults to no cache.
+        concurrency: Number of concurrent executions.
+            See :func:`translate` for the details.
+        timeout: Timeout per attempt in seconds.
+            Only used when ``translator`` supports async calls.
+        retry: Retry policy for failed (or timed-out) articles.
+            Defaults to :class:`aixiv.retry.Retry` with the default options.
+            Reports of the attempts for recent articles are kept
+            in its ``reports`` attribute. If all attempts fail,
+            the original article is returned instead.
+        ordered: If True, translated articles are yielded in the original
+            order. Otherwise, they are yielded in the order of completion.
+        **options: Other options for ``translator`` (if any).
+
+    Yields:
+        Translated (and summarized) articles.
+
+    """
+    translator_ = create_translator(
+        translator,
+        api_key,
+        language,
+        summarize,
+        maximum(concurrency),
+        **options,
+    )
+    cache_ = create_cache(cache)
+    retry_ = Retry() if retry is None else retry
+
+    if translator_.batched and isinstance(concurrency, int):
+        concurrency *= translator_.batch_size
+
+    def runner(article: TArticle, /) -> Finally[TArticle]:
+        # return cache hits directly so that they are not observed
+        # by an adaptive concurrency limit (only the calls of translator)
+        if cache_ is not None:
+            if (hit := cache_.get(translator_, article)) is not None:
+                return hit
+
+        return finish(article)
+
+    async def finish(article: TArticle, /) -> TArticle:
+        if isinstance(result := translator_(article), Awaitable):
+            result = await result
+
+        translated = replace(result, origin=article)
+
+        if cache_ is not None:
+            if is_translated(translated, article, translator_.fields):
+                cache_.set(translator_, article, translated)
+
+        return translated
+
+    async with AsyncExitStack() as stack:
+        stack.callback(log_singleflight, translator_)
+
+        # close the cache only if it is created here
+        if cache_ is not None and cache_ is not cache:
+            stack.callback(cache_.close)
+
+        if translator_ is not translator:
+            await stack.enter_async_context(translator_)
+
+        async for article in aiter_map(
+            runner,
+            articles,
+            concurrency=concurrency,
+            timeout=timeout,
+            retry=retry_,
+            ordered=ordered,
+        ):
+            yield article
+
+
+def create_cache(cache: Optional[CacheLike], /) -> Optional[Cache]:
+    """Create a translation cache from a cache-like object (if any)."""
+    if cache is None or isinstance(cache, Cache):
+        return cache
+
+    return Cache(cache)
+
+
+def create_translator(
+    translator: TranslatorLike,
+    api_key: str,
+    language: str,
+    summarize: bool,
+    concurrency: int,
+    /,
+    **options: Any,
+) -> Translator:
+    """Create a translator from a translator-like object and options."""
+    # return translator instance as is
+    if isinstance(translator, Translator):
+        return translator
+
     # parse translator
     Translator_: type[Translator]
 
@@ -117,9 +586,28 @@ def translate(
     else:
         language = Locale.parse(language).language
 
-    return amap(
-        Translator_(api_key, language, summarize, **options),
-        articles,
+    return Translator_(
+        api_key,
+        language,
+        summarize,
         concurrency=concurrency,
-        timeout=timeout,
+        **options,
+    )
+
+
+def is_translated(
+    translated: TArticle,
+    article: TArticle,
+    fields: Iterable[str] = Translator.fields,
+    /,
+) -> bool:
+    """Check if an article was actually translated from an original one."""
+    return translated.origin is article and any(
+        getattr(translated, name) != getattr(article, name) for name in fields
     )
+
+
+def log_singleflight(translator: Translator, /) -> None:
+    """Log the number of calls saved by the deduplication of texts."""
+    calls, saved = translator.singleflight.calls, translator.singleflight.saved
+    LOGGER.debug(f"Saved {saved} calls by deduplication ({calls} calls sent).")
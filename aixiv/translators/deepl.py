@@ -2,13 +2,14 @@ __all__ = ["DeepL"]
 
 
 # standard library
-from dataclasses import dataclass, replace
+from asyncio import to_thread
+from dataclasses import dataclass
 from logging import getLogger
-from typing import cast
+from typing import Any, Optional, cast
 
 
 # dependencies
-from ..article import TArticle
+from ..limiter import estimate_tokens
 from ..translate import Translator
 
 
@@ -24,38 +25,69 @@ class DeepL(Translator):
         api_key: API key of the translator.
         language: Language code of the translated articles.
         summarize: Whether to summarize the articles.
+        rpm: Maximum requests per minute (``None`` if unlimited).
+        tpm: Maximum tokens per minute (``None`` if unlimited).
+        batch_size: Maximum number of texts per request.
+        batch_tokens: Maximum number of (estimated) tokens per request.
+        concurrency: Maximum number of pooled connections to the provider.
+        url: URL of the API (``None`` for the official one).
+            It may be a local stand-in server (e.g. for benchmarks).
 
     """
 
+    requestable = True
+    """Whether the translator implements request to send texts."""
+
+    batch_size: int = 50
+    """Maximum number of texts per request."""
+
+    url: Optional[str] = None
+    """URL of the API (``None`` for the official one)."""
+
     def __post_init__(self) -> None:
+        super().__post_init__()
+
         if self.summarize:
             LOGGER.warning("Summarization is not supported.")
 
-    def __call__(self, article: TArticle, /) -> TArticle:
-        """Translate (and summarize) an article."""
-        # create model
-        from deepl import TextResult, Translator
-
-        model = Translator(self.api_key)
-
-        # run translations
-        def run(prompt: str) -> str:
-            response = model.translate_text(
-                text=prompt,
-                target_lang=self.language,
-            )
-            return cast(TextResult, response).text
-
-        try:
-            return replace(
-                article,
-                title=run(article.title),
-                summary=run(article.summary),
-            )
-        except Exception as error:
-            LOGGER.warning(error)
-            LOGGER.warning(
-                f"Failed to translate {article:100}. "
-                "The original article was returned instead."
-            )
-            return article
+    def create_client(self) -> Any:
+        """Create a client of the provider with a keep-alive connection pool."""
+        from deepl import Translator
+        from requests.adapters import HTTPAdapter
+
+        client = Translator(self.api_key, server_url=self.url)
+
+        # size the connection pool of the underlying session (if any)
+        # to concurrency so that concurrent requests reuse connections
+        session = getattr(getattr(client, "_client", None), "_session", None)
+
+        if session is None:
+            LOGGER.debug("Failed to size the connection pool.")
+            return client
+
+        adapter = HTTPAdapter(pool_maxsize=self.concurrency)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return client
+
+    async def aclose(self) -> None:
+        """Close the client of the provider (if any)."""
+        if self.client is not None:
+            self.client.close()
+
+        await super().aclose()
+
+    async def request(self, texts: list[str], /) -> list[str]:
+        """Send a single request to translate (and summarize) texts."""
+        from deepl import TextResult
+
+        model = self.get_client()
+
+        # run translation(s)
+        await self.limiter.acquire(sum(map(estimate_tokens, texts)))
+        response = await to_thread(
+            model.translate_text,
+            text=texts,
+            target_lang=self.language,
+        )
+        return [result.text for result in cast(list[TextResult], response)]
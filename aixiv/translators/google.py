@@ -2,14 +2,16 @@ __all__ = ["Google"]
 
 
 # standard library
-from dataclasses import dataclass, replace
+from asyncio import to_thread
+from dataclasses import dataclass
 from logging import getLogger
-from time import sleep
+from typing import Any, Optional
 
 
 # dependencies
 from babel import Locale
-from ..article import TArticle
+from ..batch import dumps_batch, loads_batch
+from ..limiter import estimate_tokens
 from ..translate import Translator
 
 
@@ -18,6 +20,10 @@ LANG_EN = "en"
 LOGGER = getLogger(__name__)
 PROMPT_TRANSLATE = "Strictly translate the following texts in {language}."
 PROMPT_SUMMARIZE = "Summarize the following texts in {language}."
+PROMPT_BATCH = (
+    "The texts are given as a JSON array. Answer only with a JSON array"
+    " of the results in the same order and of the same length."
+)
 
 
 @dataclass
@@ -28,24 +34,59 @@ class Google(Translator):
         api_key: API key of the translator.
         language: Language code of the translated articles.
         summarize: Whether to summarize the articles.
-        latency: Latency to avoid exceeding the API rate limit.
+        rpm: Maximum requests per minute (``None`` if unlimited).
+        tpm: Maximum tokens per minute (``None`` if unlimited).
+        batch_size: Maximum number of texts per request.
+            Texts of concurrent articles are packed into a request
+            (answered as a JSON array) by default.
+        batch_tokens: Maximum number of (estimated) tokens per request.
+            It keeps a batch response within the output limit of the model.
+        concurrency: Maximum number of pooled connections to the provider.
         model: Name of the generative model.
+        url: URL of the API (``None`` for the official one).
+            It may be a local stand-in server (e.g. for benchmarks).
+            If it is given, the API is reached by the REST transport,
+            whose requests are sent from worker threads (as its async
+            calls would block the event loop).
 
     """
 
-    latency: float = 1.0
-    """Latency to avoid exceeding the API rate limit."""
+    requestable = True
+    """Whether the translator implements request to send texts."""
+
+    rpm: Optional[float] = 60.0
+    """Maximum requests per minute (``None`` if unlimited)."""
+
+    batch_size: int = 10
+    """Maximum number of texts per request."""
+
+    batch_tokens: Optional[int] = 1000
+    """Maximum number of (estimated) tokens per request."""
 
     model: str = "gemini-pro"
     """Name of the generative model."""
 
-    async def __call__(self, article: TArticle, /) -> TArticle:
-        """Translate (and summarize) an article."""
-        # create model
+    url: Optional[str] = None
+    """URL of the API (``None`` for the official one)."""
+
+    def create_client(self) -> Any:
+        """Create a client (generative model) of the provider."""
         from google import generativeai as genai
 
-        genai.configure(api_key=self.api_key)
-        model = genai.GenerativeModel(self.model)
+        if self.url is None:
+            genai.configure(api_key=self.api_key)
+        else:
+            genai.configure(
+                api_key=self.api_key,
+                client_options={"api_endpoint": self.url},
+                transport="rest",
+            )
+
+        return genai.GenerativeModel(self.model)
+
+    async def request(self, texts: list[str], /) -> list[str]:
+        """Send a single request to translate (and summarize) texts."""
+        model = self.get_client()
 
         # create prompt w/o texts
         language = Locale.parse(self.language).get_language_name(LANG_EN)
@@ -55,22 +96,20 @@ class Google(Translator):
         else:
             prompt = PROMPT_TRANSLATE.format(language=language)
 
-        # run translations
-        async def run(prompt: str) -> str:
-            sleep(self.latency)  # sync sleep!
+        # run translation(s)
+        if len(texts) == 1:
+            prompt = f"{prompt}\n{texts[0]}"
+        else:
+            prompt = f"{prompt} {PROMPT_BATCH}\n{dumps_batch(texts)}"
+
+        await self.limiter.acquire(estimate_tokens(prompt))
+
+        if self.url is None:
             response = await model.generate_content_async(prompt)
-            return response.text
+        else:
+            response = await to_thread(model.generate_content, prompt)
 
-        try:
-            return replace(
-                article,
-                title=await run(f"{prompt}\n{article.title}"),
-                summary=await run(f"{prompt}\n{article.summary}"),
-            )
-        except Exception as error:
-            LOGGER.warning(error)
-            LOGGER.warning(
-                f"Failed to translate {article:100}. "
-                "The original article was returned instead."
-            )
-            return article
+        if len(texts) == 1:
+            return [response.text]
+        else:
+            return loads_batch(response.text, len(texts))
@@ -2,14 +2,16 @@ __all__ = ["OpenAI"]
 
 
 # standard library
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 from logging import getLogger
-from time import sleep
+from typing import Any, Optional
 
 
 # dependencies
 from babel import Locale
-from ..article import TArticle
+from ..batch import dumps_batch, loads_batch
+from ..limiter import estimate_tokens
+from ..metrics import REGISTRY
 from ..translate import Translator
 
 
@@ -18,6 +20,10 @@ LANG_EN = "en"
 LOGGER = getLogger(__name__)
 PROMPT_TRANSLATE = "Strictly translate the following texts in {language}."
 PROMPT_SUMMARIZE = "Summarize the following texts in {language}."
+PROMPT_BATCH = (
+    "The texts are given as a JSON array. Answer only with a JSON array"
+    " of the results in the same order and of the same length."
+)
 
 
 @dataclass
@@ -28,23 +34,63 @@ class OpenAI(Translator):
         api_key: API key of the translator.
         language: Language code of the translated articles.
         summarize: Whether to summarize the articles.
-        latency: Latency to avoid exceeding the API rate limit.
+        rpm: Maximum requests per minute (``None`` if unlimited).
+        tpm: Maximum tokens per minute (``None`` if unlimited).
+        batch_size: Maximum number of texts per request.
+            Texts of concurrent articles are packed into a request
+            (answered as a JSON array) by default.
+        batch_tokens: Maximum number of (estimated) tokens per request.
+            It keeps a batch response within the output limit of the model.
+        concurrency: Maximum number of pooled connections to the provider.
         model: Name of the generative model.
+        url: URL of the API (``None`` for the official one).
+            It may be a local stand-in server (e.g. for benchmarks).
 
     """
 
-    latency: float = 1.0
-    """Latency to avoid exceeding the API rate limit."""
+    requestable = True
+    """Whether the translator implements request to send texts."""
+
+    rpm: Optional[float] = 60.0
+    """Maximum requests per minute (``None`` if unlimited)."""
+
+    batch_size: int = 10
+    """Maximum number of texts per request."""
+
+    batch_tokens: Optional[int] = 1000
+    """Maximum number of (estimated) tokens per request."""
 
     model: str = "gpt-3.5-turbo"
     """Name of the generative model."""
 
-    async def __call__(self, article: TArticle, /) -> TArticle:
-        """Translate (and summarize) an article."""
-        # lazy import
+    url: Optional[str] = None
+    """URL of the API (``None`` for the official one)."""
+
+    def create_client(self) -> Any:
+        """Create a client of the provider with a keep-alive connection pool."""
+        from httpx import AsyncClient, Limits
         from openai import AsyncOpenAI
 
-        client = AsyncOpenAI(api_key=self.api_key)
+        limits = Limits(
+            max_connections=self.concurrency,
+            max_keepalive_connections=self.concurrency,
+        )
+        return AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=self.url,
+            http_client=AsyncClient(limits=limits),
+        )
+
+    async def aclose(self) -> None:
+        """Close the client of the provider (if any)."""
+        if self.client is not None:
+            await self.client.close()
+
+        await super().aclose()
+
+    async def request(self, texts: list[str], /) -> list[str]:
+        """Send a single request to translate (and summarize) texts."""
+        client = self.get_client()
 
         # create prompt w/o texts
         language = Locale.parse(self.language).get_language_name(LANG_EN)
@@ -54,25 +100,23 @@ class OpenAI(Translator):
         else:
             prompt = PROMPT_TRANSLATE.format(language=language)
 
-        # run translations
-        async def run(prompt: str) -> str:
-            sleep(self.latency)  # sync sleep!
-            completion = await client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model=self.model,
-            )
-            return completion.choices[0].text  # type: ignore
-
-        try:
-            return replace(
-                article,
-                title=await run(f"{prompt}\n{article.title}"),
-                summary=await run(f"{prompt}\n{article.summary}"),
-            )
-        except Exception as error:
-            LOGGER.warning(error)
-            LOGGER.warning(
-                f"Failed to translate {article:100}. "
-                "The original article was returned instead."
-            )
-            return article
+        # run translation(s)
+        if len(texts) == 1:
+            prompt = f"{prompt}\n{texts[0]}"
+        else:
+            prompt = f"{prompt} {PROMPT_BATCH}\n{dumps_batch(texts)}"
+
+        await self.limiter.acquire(estimate_tokens(prompt))
+        completion = await client.chat.completions.create(
+            messages=[{"role": "user", "content": prompt}],
+            model=self.model,
+        )
+        content = completion.choices[0].message.content or ""
+
+        if (usage := completion.usage) is not None:
+            REGISTRY.inc("aixiv_tokens_total", usage.total_tokens, model=self.model)
+
+        if len(texts) == 1:
+            return [content]
+        else:
+            return loads_batch(content, len(texts))
@@ -0,0 +1,132 @@
+"""Benchmark of static and adaptive concurrency against a fake provider.
+
+Run ``python benchmarks/adaptive.py [--rpm RPM]`` to translate
+synthetic articles by a local fake provider which answers
+with 429 errors beyond its rate limit and slows down as
+requests queue up beyond its capacity. Static concurrency
+limits are compared with the adaptive (AIMD) one.
+
+"""
+
+# standard library
+from argparse import ArgumentParser
+from asyncio import run, sleep
+from dataclasses import dataclass, field, replace
+from logging import ERROR, getLogger
+from time import perf_counter
+from typing import Union
+
+
+# dependencies
+from aixiv.adaptive import AdaptiveConcurrency
+from aixiv.article import Article, TArticle
+from aixiv.limiter import Bucket
+from aixiv.metrics import REGISTRY
+from aixiv.retry import Retry
+from aixiv.translate import Translator, atranslate
+
+
+# constants
+CAPACITY = 16
+LATENCY = 0.05
+N_ARTICLES = 500
+RPM = 6000.0
+SECONDS_PER_MINUTE = 60.0
+
+
+class TooManyRequests(Exception):
+    """Error raised by the fake provider beyond its rate limit."""
+
+    status_code = 429
+
+
+@dataclass
+class FakeProvider(Translator):
+    """Fake provider with a rate limit and a limited capacity."""
+
+    quota: float = RPM
+    """Rate limit of the provider in requests per minute."""
+
+    inflight: int = field(default=0, init=False)
+    """Current number of in-flight requests."""
+
+    throttled: int = field(default=0, init=False)
+    """Number of requests answered with 429 errors."""
+
+    bucket: Bucket = field(init=False, repr=False)
+    """Token bucket for the rate limit."""
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        rate = self.quota / SECONDS_PER_MINUTE
+        self.bucket = Bucket(rate, max(1.0, rate / 10))
+
+    async def __call__(self, article: TArticle, /) -> TArticle:
+        self.inflight += 1
+
+        try:
+            if self.bucket.delay(1) > 0:
+                self.throttled += 1
+                await sleep(LATENCY / 10)
+                raise TooManyRequests("Too many requests.")
+
+            self.bucket.consume(1)
+            await sleep(LATENCY * max(1.0, self.inflight / CAPACITY))
+            return replace(article, title=article.title.upper())
+        finally:
+            self.inflight -= 1
+
+
+def create_articles(n: int, /) -> list[Article]:
+    """Create synthetic articles."""
+    return [
+        Article(f"Title {i}", ["Author"], "Summary", f"http://example.com/{i}")
+        for i in range(n)
+    ]
+
+
+async def measure(
+    name: str,
+    concurrency: Union[int, AdaptiveConcurrency],
+    rpm: float,
+    /,
+) -> None:
+    """Measure the throughput of translating articles by the fake provider."""
+    articles = create_articles(N_ARTICLES)
+    provider = FakeProvider("", "en", False, quota=rpm)
+    retry = Retry(attempts=10, backoff=0.05)
+    REGISTRY.reset()
+
+    start = perf_counter()
+    await atranslate(
+        articles,
+        translator=provider,
+        concurrency=concurrency,
+        retry=retry,
+    )
+    elapsed = perf_counter() - start
+
+    outcomes = REGISTRY.counters["aixiv_outcomes_total"]
+    failed = int(sum(outcomes.values()) - outcomes.get((("outcome", "success"),), 0))
+    print(
+        f"{name:<24}{N_ARTICLES / elapsed:>10.1f} articles/s"
+        f"{provider.throttled:>8} throttled{failed:>6} failed"
+    )
+
+
+async def main(rpm: float, /) -> None:
+    getLogger("aixiv").setLevel(ERROR)
+    print(f"Fake provider: {rpm:.0f} rpm, capacity {CAPACITY}")
+
+    for concurrency in (4, 16, 64):
+        await measure(f"static ({concurrency})", concurrency, rpm)
+
+    adaptive = AdaptiveConcurrency(minimum=1, maximum=64)
+    await measure("adaptive (1-64)", adaptive, rpm)
+    print(f"Final adaptive limit: {adaptive.limit:.1f}")
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--rpm", type=float, default=RPM)
+    run(main(parser.parse_args().rpm))
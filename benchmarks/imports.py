@@ -0,0 +1,60 @@
+"""Import-time benchmark of aixiv modules.
+
+Run ``python benchmarks/imports.py [--runs N] [--threshold SECONDS]``
+to measure the median time to import aixiv modules in fresh
+interpreters (as short-lived CLI, cron, or worker invocations do).
+The benchmark exits with an error if any median exceeds the threshold,
+so that an eager import of a heavy dependency (e.g. dateparser)
+is caught as a regression.
+
+"""
+
+# standard library
+from argparse import ArgumentParser
+from statistics import median
+from subprocess import run
+from sys import executable
+
+
+# constants
+MODULES = ("aixiv", "aixiv.article", "aixiv.search", "aixiv.translate")
+N_RUNS = 10
+THRESHOLD = 0.3
+TIMER = (
+    "from time import perf_counter; start = perf_counter(); import {module}; "
+    "print(perf_counter() - start)"
+)
+
+
+def measure(module: str, runs: int, /) -> float:
+    """Measure the median time to import a module in fresh interpreters."""
+    elapsed: list[float] = []
+
+    for _ in range(runs):
+        code = TIMER.format(module=module)
+        result = run([executable, "-c", code], capture_output=True, check=True)
+        elapsed.append(float(result.stdout))
+
+    return median(elapsed)
+
+
+def main(runs: int, threshold: float, /) -> None:
+    print(f"Median of {runs} runs (threshold: {threshold * 1e3:.0f} ms)")
+    exceeded = False
+
+    for module in MODULES:
+        elapsed = measure(module, runs)
+        exceeded |= elapsed > threshold
+        mark = " (exceeded)" if elapsed > threshold else ""
+        print(f"{module:<24}{elapsed * 1e3:>8.1f} ms{mark}")
+
+    if exceeded:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--runs", type=int, default=N_RUNS)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    args = parser.parse_args()
+    main(args.runs, args.threshold)
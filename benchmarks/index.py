@@ -0,0 +1,96 @@
+"""Benchmark of aixiv.index.Index.
+
+Run ``python benchmarks/index.py [--n N] [--queries N]`` to measure
+the time to build a local inverted index of synthetic articles
+(modeled on a few months of arXiv submissions, with a Zipfian
+vocabulary), the size of its posting lists, the time to add new
+articles incrementally, and the latency (p50/p99) of BM25 queries
+of words sampled from titles (the first query of each term
+includes computing its cached weights).
+
+"""
+
+# standard library
+from argparse import ArgumentParser
+from itertools import accumulate
+from random import Random
+from time import perf_counter
+
+
+# dependencies
+from aixiv.article import Article
+from aixiv.index import Index
+
+
+# constants
+N_ARTICLES = 50_000
+N_ADDED = 1000
+N_QUERIES = 200
+N_TERMS = 50_000
+SEED = 0
+VOCABULARY = [f"term{rank}" for rank in range(1, N_TERMS + 1)]
+CUMULATIVE_WEIGHTS = list(accumulate(1 / rank for rank in range(1, N_TERMS + 1)))
+
+
+def create_words(random: Random, k: int, /) -> list[str]:
+    """Create words of a Zipfian vocabulary (frequencies inverse to ranks)."""
+    return random.choices(VOCABULARY, cum_weights=CUMULATIVE_WEIGHTS, k=k)
+
+
+def create_articles(n: int, offset: int = 0, /) -> list[Article]:
+    """Create synthetic articles."""
+    random = Random(SEED + offset)
+    articles: list[Article] = []
+
+    for index in range(offset, offset + n):
+        title = " ".join(create_words(random, 10)).capitalize()
+        summary = " ".join(create_words(random, 150)) + "."
+        authors = [f"Author {random.randrange(5000)}" for _ in range(5)]
+        url = f"http://arxiv.org/abs/2401.{index:05d}v1"
+        articles.append(Article(title, authors, summary, url))
+
+    return articles
+
+
+def main(n: int, queries: int, /) -> None:
+    articles = create_articles(n)
+    random = Random(SEED)
+
+    begin = perf_counter()
+    index = Index.from_articles(articles)
+    elapsed = perf_counter() - begin
+    postings = sum(
+        len(documents) * documents.itemsize + len(frequencies) * frequencies.itemsize
+        for documents, frequencies in index.postings.values()
+    )
+    print(f"Build ({n} articles):{elapsed:>10.2f} s")
+    print(f"Postings ({len(index.postings)} terms):{postings / 2**20:>10.1f} MiB")
+
+    begin = perf_counter()
+    index.add(create_articles(N_ADDED, n))
+    elapsed = perf_counter() - begin
+    print(f"Add ({N_ADDED} articles):{elapsed * 1e3:>10.1f} ms")
+
+    samples: list[float] = []
+
+    for _ in range(queries):
+        title = random.choice(articles).title
+        query = " ".join(random.sample(title.split(), k=3))
+        begin = perf_counter()
+        index.search(query)
+        samples.append(perf_counter() - begin)
+
+    samples.sort()
+    p50 = samples[len(samples) // 2]
+    p99 = samples[min(len(samples) - 1, int(0.99 * len(samples)))]
+    print(
+        f"Query (3 title words):{p50 * 1e3:>10.2f} ms (p50){p99 * 1e3:>10.2f} ms (p99)"
+    )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--n", type=int, default=N_ARTICLES)
+    parser.add_argument("--queries", type=int, default=N_QUERIES)
+    args = parser.parse_args()
+    main(args.n, args.queries)
@@ -0,0 +1,89 @@
+"""Micro-benchmark of aixiv.search.convert_latex.
+
+Run ``python benchmarks/latex.py`` to compare the plain converter
+of pylatexenc with the fast path and memoization of convert_latex
+on a synthetic corpus modeled on arXiv titles and abstracts.
+
+"""
+
+# standard library
+from collections.abc import Callable
+from random import Random
+from time import perf_counter
+
+
+# dependencies
+from aixiv.search import convert_latex, convert_latex_cached, get_latex_converter
+
+
+# constants
+N_ARTICLES = 1000
+SEED = 0
+MATH = [
+    "$z\\sim 2$",
+    "$\\Lambda$CDM",
+    "$10^{10}\\,M_\\odot$",
+    "$H_0$",
+    "$\\sigma_8$",
+    "$\\chi^2$",
+    "$\\sim$",
+    "$\\alpha$",
+]
+WORDS = (
+    "we present observations of galaxies clusters at high redshift using "
+    "the new survey data and find that star formation is suppressed in "
+    "dense environments with a significance of more than five sigma"
+).split()
+
+
+def create_corpus(n: int, /) -> list[str]:
+    """Create titles and abstracts (about half of them with math)."""
+    random = Random(SEED)
+    corpus: list[str] = []
+
+    for _ in range(n):
+        title = " ".join(random.choices(WORDS, k=10)).capitalize()
+        words = random.choices(WORDS, k=150)
+
+        if random.random() < 0.5:
+            for index in random.sample(range(len(words)), k=5):
+                words[index] = random.choice(MATH)
+
+        corpus.extend([title, " ".join(words) + "."])
+
+    return corpus
+
+
+def measure(
+    name: str,
+    func: Callable[[str], str],
+    corpus: list[str],
+    /,
+) -> tuple[float, list[str]]:
+    """Measure the elapsed time to convert a corpus."""
+    start = perf_counter()
+    converted = list(map(func, corpus))
+    elapsed = perf_counter() - start
+    print(f"{name:<32}{elapsed:>8.3f} s")
+    return elapsed, converted
+
+
+def main() -> None:
+    corpus = create_corpus(N_ARTICLES)
+    print(f"Corpus: {len(corpus)} strings ({N_ARTICLES} titles and abstracts)")
+
+    base, expected = measure(
+        "latex_to_text",
+        get_latex_converter().latex_to_text,
+        corpus,
+    )
+    convert_latex_cached.cache_clear()
+    cold, converted = measure("convert_latex (cold cache)", convert_latex, corpus)
+    warm, _ = measure("convert_latex (warm cache)", convert_latex, corpus)
+    assert converted == expected, "Converted strings differ."
+    print(f"Speedup (cold): {base / cold:.1f}x")
+    print(f"Speedup (warm): {base / warm:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Memory benchmark of article collections.
+
+Run ``python benchmarks/memory.py [--n N]`` to compare the memory
+usage of synthetic articles with their translations stored as
+plain (non-slotted, list-authors) dataclasses, compact articles,
+and an article table (struct-of-arrays).
+
+"""
+
+# standard library
+from argparse import ArgumentParser
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from random import Random
+from tracemalloc import get_traced_memory, start, stop
+from typing import Any, Optional
+
+
+# dependencies
+from aixiv.article import Article, ArticleTable
+
+
+# constants
+N_ARTICLES = 100_000
+N_AUTHORS = 5000
+SEED = 0
+
+
+@dataclass(frozen=True)
+class PlainArticle:
+    """Plain article (as before the compact representation)."""
+
+    title: str
+    authors: list[str]
+    summary: str
+    url: str
+    origin: Optional["PlainArticle"] = field(default=None, repr=False)
+
+
+def create_rows(n: int, /) -> list[tuple[str, list[str], str, str]]:
+    """Create rows of synthetic articles with a shared pool of authors."""
+    random = Random(SEED)
+    names = [f"Author {i}" for i in range(N_AUTHORS)]
+    rows: list[tuple[str, list[str], str, str]] = []
+
+    for i in range(n):
+        # copy names so that equal names are distinct objects (as if parsed)
+        authors = ["".join(name) for name in random.sample(names, k=5)]
+        rows.append((f"Title {i}", authors, f"Summary {i}", f"/abs/{i}"))
+
+    return rows
+
+
+def create_plain(rows: list[tuple[str, list[str], str, str]], /) -> Any:
+    """Create plain articles and their translations."""
+    articles = [PlainArticle(*row) for row in rows]
+    return [replace(a, title=a.title.upper(), origin=a) for a in articles]
+
+
+def create_compact(rows: list[tuple[str, list[str], str, str]], /) -> Any:
+    """Create compact articles and their translations."""
+    articles = [Article(*row) for row in rows]
+    return [replace(a, title=a.title.upper(), origin=a) for a in articles]
+
+
+def create_table(rows: list[tuple[str, list[str], str, str]], /) -> Any:
+    """Create an article table of the translations."""
+    return ArticleTable.from_articles(create_compact(rows))
+
+
+def measure(
+    name: str,
+    func: Callable[[list[tuple[str, list[str], str, str]]], Any],
+    n: int,
+    /,
+) -> float:
+    """Measure the memory retained by a collection of articles."""
+    start()
+    rows = create_rows(n)
+    collection = func(rows)
+    del rows
+    current, _ = get_traced_memory()
+    stop()
+    del collection
+    print(f"{name:<32}{current / 2**20:>8.1f} MiB")
+    return current
+
+
+def main(n: int, /) -> None:
+    print(f"Articles: {n} (with translations)")
+    plain = measure("plain dataclass", create_plain, n)
+    compact = measure("compact article", create_compact, n)
+    table = measure("article table", create_table, n)
+    print(f"Reduction (compact): {plain / compact:.1f}x")
+    print(f"Reduction (table): {plain / table:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--n", type=int, default=N_ARTICLES)
+    main(parser.parse_args().n)
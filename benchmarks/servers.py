@@ -0,0 +1,256 @@
+"""Local stand-ins of the arXiv API and translation providers for benchmarks.
+
+A stand-in server runs in a separate process (so that it does not
+compete with the benchmarked client for the GIL or traced memory)
+and answers the following requests with configurable latency,
+jitter, rate limit, and failure rate:
+
+- ``GET /api/query``: arXiv API (Atom feed of a given corpus).
+- ``POST /v1/chat/completions``: OpenAI-compatible chat completions.
+- ``POST /v2/translate``: DeepL-compatible text translation.
+- ``POST /v1beta/models/{model}:generateContent``: Google-compatible
+  content generation (REST transport).
+
+The stand-in "translation" of a text is the text in uppercase
+(batch prompts are answered with JSON arrays as real models do).
+
+"""
+
+# standard library
+from collections.abc import Sequence
+from dataclasses import dataclass
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps, loads
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from random import Random
+from threading import Lock
+from time import sleep, time
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlsplit
+
+
+# dependencies
+from aixiv.article import Article
+from aixiv.limiter import Bucket
+
+
+# constants
+ATOM_ENTRY = """
+  <entry>
+    <id>{url}</id>
+    <published>{published}</published>
+    <title>{title}</title>
+    <summary>{summary}</summary>
+    {authors}
+  </entry>
+"""
+ATOM_AUTHOR = "<author><name>{name}</name></author>"
+ATOM_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"
+  xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">
+  <title>arXiv Query</title>
+  <opensearch:totalResults>{total}</opensearch:totalResults>
+  {entries}
+</feed>
+"""
+HOST = "127.0.0.1"
+HTTP_ERROR = 500
+HTTP_NOT_FOUND = 404
+HTTP_OK = 200
+HTTP_TOO_MANY_REQUESTS = 429
+QUEUE_SIZE = 1024
+SECONDS_PER_MINUTE = 60.0
+SEED = 0
+
+
+@dataclass(frozen=True)
+class Behavior:
+    """Behavior of a stand-in server."""
+
+    latency: float = 0.0
+    """Mean latency of a response in seconds."""
+
+    jitter: float = 0.0
+    """Maximum deviation from the mean latency in seconds."""
+
+    rpm: Optional[float] = None
+    """Rate limit in requests per minute (``None`` if unlimited)."""
+
+    failure: float = 0.0
+    """Probability (between 0 and 1) of answering with a server error."""
+
+
+class Server(ThreadingHTTPServer):
+    """Threading HTTP server holding the state of a stand-in."""
+
+    daemon_threads = True
+    request_queue_size = QUEUE_SIZE
+
+    def __init__(self, behavior: Behavior, entries: list[str], /) -> None:
+        super().__init__((HOST, 0), Handler)
+        self.behavior = behavior
+        self.entries = entries
+        self.lock = Lock()
+        self.random = Random(SEED)
+
+        if behavior.rpm is None:
+            self.bucket = None
+        else:
+            rate = behavior.rpm / SECONDS_PER_MINUTE
+            self.bucket = Bucket(rate, max(1.0, rate / 10))
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Request handler of a stand-in server."""
+
+    protocol_version = "HTTP/1.1"
+    server: Server
+
+    def do_GET(self) -> None:
+        if self.behave():
+            params = parse_qs(urlsplit(self.path).query)
+            start = int(params.get("start", ["0"])[0])
+            size = int(params.get("max_results", ["10"])[0])
+            entries = "".join(self.server.entries[start : start + size])
+            feed = ATOM_FEED.format(total=len(self.server.entries), entries=entries)
+            self.send_body(feed.encode(), "application/atom+xml")
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        request = loads(self.rfile.read(length) or b"{}")
+
+        if not self.behave():
+            return
+
+        path = urlsplit(self.path).path
+
+        if path.endswith("/chat/completions"):
+            content = answer(request["messages"][-1]["content"])
+            response: Any = {
+                "id": "chatcmpl-0",
+                "object": "chat.completion",
+                "created": int(time()),
+                "model": request.get("model", ""),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_tokens": 0,
+                },
+            }
+        elif path.endswith("/translate"):
+            response = {
+                "translations": [
+                    {"detected_source_language": "EN", "text": text.upper()}
+                    for text in request["text"]
+                ]
+            }
+        elif path.endswith(":generateContent"):
+            content = answer(request["contents"][-1]["parts"][-1]["text"])
+            response = {
+                "candidates": [
+                    {
+                        "content": {"parts": [{"text": content}], "role": "model"},
+                        "finishReason": 1,
+                        "index": 0,
+                    }
+                ]
+            }
+        else:
+            self.send_error(HTTP_NOT_FOUND)
+            return
+
+        self.send_body(dumps(response).encode(), "application/json")
+
+    def behave(self) -> bool:
+        """Behave as configured and return whether to answer normally."""
+        behavior, server = self.server.behavior, self.server
+
+        with server.lock:
+            throttled = server.bucket is not None and server.bucket.delay(1) > 0
+            failed = server.random.random() < behavior.failure
+            deviation = server.random.uniform(-behavior.jitter, behavior.jitter)
+
+            if server.bucket is not None and not throttled:
+                server.bucket.consume(1)
+
+        if throttled:
+            self.send_body(b"{}", "application/json", HTTP_TOO_MANY_REQUESTS)
+            return False
+
+        sleep(max(0.0, behavior.latency + deviation))
+
+        if failed:
+            self.send_body(b"{}", "application/json", HTTP_ERROR)
+            return False
+
+        return True
+
+    def send_body(self, body: bytes, type: str, status: int = HTTP_OK, /) -> None:
+        """Send a response with a body."""
+        self.send_response(status)
+        self.send_header("Content-Type", type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def answer(prompt: str, /) -> str:
+    """Answer a (batch) translation prompt of generative models."""
+    instruction, _, text = prompt.partition("\n")
+
+    if "JSON array" in instruction:
+        return dumps([text.upper() for text in loads(text)], ensure_ascii=False)
+
+    return text.upper()
+
+
+def to_entry(article: Article, index: int, /) -> str:
+    """Convert an article to an Atom entry of the arXiv API."""
+    return ATOM_ENTRY.format(
+        url=escape(article.url),
+        published=f"2024-01-01T00:00:{index % 60:02d}Z",
+        title=escape(article.title),
+        summary=escape(article.summary),
+        authors="".join(ATOM_AUTHOR.format(name=escape(a)) for a in article.authors),
+    )
+
+
+def serve(behavior: Behavior, entries: list[str], sender: Connection, /) -> None:
+    """Serve a stand-in forever (in a separate process)."""
+    with Server(behavior, entries) as server:
+        sender.send(server.server_address[1])
+        server.serve_forever()
+
+
+def start(
+    behavior: Behavior,
+    articles: Sequence[Article] = (),
+    /,
+) -> tuple[str, Process]:
+    """Start a stand-in server in a separate process.
+
+    Args:
+        behavior: Behavior of the stand-in server.
+        articles: Corpus of articles served by the arXiv API.
+
+    Returns:
+        Base URL of the stand-in server and its process.
+
+    """
+    receiver, sender = Pipe(duplex=False)
+    entries = [to_entry(article, index) for index, article in enumerate(articles)]
+    process = Process(target=serve, args=(behavior, entries, sender), daemon=True)
+    process.start()
+    return f"http://{HOST}:{receiver.recv()}", process
@@ -0,0 +1,327 @@
+"""Offline benchmark suite of aixiv stages.
+
+Run ``python benchmarks/suite.py [--n N] [--output PATH] [--baseline PATH]``
+to measure the throughput (articles/s), latency (p50/p99), and peak
+(traced) memory of search, format, amap, and translate across
+concurrency settings against local stand-ins of the arXiv API and
+translation providers (see ``benchmarks/servers.py``), so that no
+network access is needed and the results are comparable between runs.
+A recorded corpus (a JSONL file written by
+:func:`aixiv.archive.write_jsonl`) can be served by ``--corpus``
+instead of the synthetic one.
+
+The results can be written in JSON by ``--output`` and compared with
+previous ones by ``--baseline``: the suite exits with an error if the
+throughput of any case drops by more than ``--tolerance``.
+
+Rate limits of the translators are disabled so that only those of
+the stand-ins (``--rpm``) apply. Note that the Google stand-in is
+reached by the REST transport of its client, whose requests are sent
+from worker threads, so its results scale with concurrency only up to
+the number of the threads (unlike the official gRPC transport).
+
+"""
+
+# standard library
+from argparse import ArgumentParser, Namespace
+from asyncio import run, sleep
+from collections.abc import Awaitable, Callable
+from json import dumps, loads
+from logging import ERROR, getLogger
+from math import nan
+from pathlib import Path
+from random import Random
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+from typing import NamedTuple
+
+
+# dependencies
+from aixiv.archive import read_jsonl
+from aixiv.article import Article, amap_async
+from aixiv.fetcher import Fetcher
+from aixiv.metrics import REGISTRY
+from aixiv.retry import Retry
+from aixiv.search import aformat, asearch
+from aixiv.translate import atranslate
+from latex import MATH, WORDS
+from servers import Behavior, start as start_server
+
+
+# constants
+CONCURRENCIES = (1, 8, 64)
+JITTER = 0.01
+LATENCY = 0.02
+N_ARTICLES = 1000
+N_REQUESTS = 200
+PAGE_SIZES = (100, 500)
+PROCESSES = (1, 2, 4)
+PROVIDERS = ("OpenAI", "DeepL", "Google")
+SEED = 0
+TOLERANCE = 0.2
+TRANSLATE_CONCURRENCIES = (4, 16, 64)
+
+
+class Result(NamedTuple):
+    """Result of a benchmark case."""
+
+    stage: str
+    """Name of the benchmarked stage."""
+
+    setting: str
+    """Setting (e.g. concurrency) of the case."""
+
+    articles: int
+    """Number of processed articles."""
+
+    rate: float
+    """Throughput in articles per second."""
+
+    p50: float
+    """Median latency in seconds (NaN if not recorded)."""
+
+    p99: float
+    """99th-percentile latency in seconds (NaN if not recorded)."""
+
+    peak: float
+    """Peak traced memory in MiB."""
+
+
+def create_articles(n: int, /) -> list[Article]:
+    """Create synthetic articles (about half of them with math)."""
+    random = Random(SEED)
+    articles: list[Article] = []
+
+    for index in range(n):
+        title = " ".join(random.choices(WORDS, k=10)).capitalize()
+        words = random.choices(WORDS, k=150)
+
+        if random.random() < 0.5:
+            for position in random.sample(range(len(words)), k=5):
+                words[position] = random.choice(MATH)
+
+        authors = [f"Author {random.randrange(5000)}" for _ in range(5)]
+        url = f"http://arxiv.org/abs/2401.{index:05d}v1"
+        articles.append(Article(title, authors, " ".join(words) + ".", url))
+
+    return articles
+
+
+def percentile(samples: list[float], q: float, /) -> float:
+    """Return a percentile (e.g. 0.99 for p99) of samples."""
+    if not samples:
+        return nan
+
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def measure(
+    stage: str,
+    setting: str,
+    metric: str,
+    func: Callable[[], Awaitable[int]],
+    /,
+) -> Result:
+    """Measure a benchmark case.
+
+    The case is run twice: first with memory tracing for the peak memory,
+    then without it for the throughput and latency (as tracing slows down
+    allocation-heavy clients by several times).
+
+    Args:
+        stage: Name of the benchmarked stage.
+        setting: Setting (e.g. concurrency) of the case.
+        metric: Name of the histogram metric used as the latency.
+        func: Async function running the case and returning
+            the number of processed articles.
+
+    Returns:
+        Result of the benchmark case.
+
+    """
+    samples: list[float] = []
+
+    def hook(name: str, value: float, labels: dict[str, str]) -> None:
+        if name == metric:
+            samples.append(value)
+
+    start()
+
+    try:
+        await func()
+        peak = get_traced_memory()[1]
+    finally:
+        stop()
+
+    REGISTRY.reset()
+    REGISTRY.hooks.append(hook)
+
+    try:
+        begin = perf_counter()
+        count = await func()
+        elapsed = perf_counter() - begin
+    finally:
+        REGISTRY.hooks.remove(hook)
+
+    result = Result(
+        stage,
+        setting,
+        count,
+        count / elapsed,
+        percentile(samples, 0.5),
+        percentile(samples, 0.99),
+        peak / 2**20,
+    )
+    print(
+        f"{stage:<10}{setting:<20}{result.rate:>10.1f} articles/s"
+        f"{result.p50 * 1e3:>10.1f} ms (p50){result.p99 * 1e3:>10.1f} ms (p99)"
+        f"{result.peak:>8.1f} MiB"
+    )
+    return result
+
+
+async def run_suite(args: Namespace, /) -> list[Result]:
+    """Run all benchmark cases against the stand-in servers."""
+    if args.corpus is None:
+        articles = create_articles(args.n)
+    else:
+        articles = list(read_jsonl(args.corpus))
+
+    requests = articles[: args.requests]
+    behavior = Behavior(args.latency, args.jitter, args.rpm, args.failure)
+    url, server = start_server(behavior, articles)
+    results: list[Result] = []
+
+    print(f"Corpus: {len(articles)} articles ({args.requests} for I/O stages)")
+    print(f"Stand-ins: {behavior}")
+
+    try:
+        for page_size in PAGE_SIZES:
+
+            async def search_case() -> int:
+                fetcher = Fetcher(f"{url}/api/query", 0.0, page_size=page_size)
+                found = await asearch(
+                    maximum=len(articles),
+                    formatting=False,
+                    fetcher=fetcher,
+                )
+                return len(found)
+
+            setting = f"page_size={page_size}"
+            results.append(
+                await measure("search", setting, "aixiv_fetch_seconds", search_case)
+            )
+
+        for processes in PROCESSES:
+
+            async def format_case() -> int:
+                return len(await aformat(articles, processes=processes))
+
+            setting = f"processes={processes}"
+            results.append(
+                await measure("format", setting, "aixiv_article_seconds", format_case)
+            )
+
+        for concurrency in CONCURRENCIES:
+            random = Random(SEED)
+
+            async def io(article: Article) -> Article:
+                await sleep(
+                    max(0.0, args.latency + random.uniform(-1, 1) * args.jitter)
+                )
+                return article
+
+            async def amap_case() -> int:
+                return len(await amap_async(io, requests, concurrency=concurrency))
+
+            setting = f"concurrency={concurrency}"
+            results.append(
+                await measure("amap", setting, "aixiv_article_seconds", amap_case)
+            )
+
+        for provider in args.providers:
+
+            async def translate(articles: list[Article], concurrency: int) -> int:
+                translated = await atranslate(
+                    articles,
+                    translator=f"aixiv.translators.{provider}",
+                    api_key="stand-in",
+                    cache=None,
+                    concurrency=concurrency,
+                    retry=Retry(attempts=10, backoff=0.01),
+                    rpm=None,
+                    tpm=None,
+                    url=f"{url}/v1" if provider == "OpenAI" else url,
+                )
+                return len(translated)
+
+            # warm up (e.g. import the client) before measurement
+            await translate(requests[:1], 1)
+
+            for concurrency in TRANSLATE_CONCURRENCIES:
+
+                async def translate_case() -> int:
+                    return await translate(requests, concurrency)
+
+                setting = f"{provider} concurrency={concurrency}"
+                results.append(
+                    await measure(
+                        "translate", setting, "aixiv_article_seconds", translate_case
+                    )
+                )
+    finally:
+        server.terminate()
+
+    return results
+
+
+def compare(results: list[Result], baseline: Path, tolerance: float, /) -> bool:
+    """Compare the results with baseline ones and return whether no regression."""
+    rates = {
+        (result["stage"], result["setting"]): result["rate"]
+        for result in loads(baseline.read_text())
+    }
+    passed = True
+
+    for result in results:
+        if (rate := rates.get((result.stage, result.setting))) is None:
+            continue
+
+        if result.rate < (1 - tolerance) * rate:
+            passed = False
+            print(
+                f"Regression: {result.stage} ({result.setting}) "
+                f"{result.rate:.1f} < {rate:.1f} articles/s"
+            )
+
+    return passed
+
+
+def main(args: Namespace, /) -> None:
+    getLogger("aixiv").setLevel(ERROR)
+    results = run(run_suite(args))
+
+    if args.output is not None:
+        data = [result._asdict() for result in results]
+        args.output.write_text(dumps(data, indent=2))
+
+    if args.baseline is not None:
+        if not compare(results, args.baseline, args.tolerance):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("--n", type=int, default=N_ARTICLES)
+    parser.add_argument("--requests", type=int, default=N_REQUESTS)
+    parser.add_argument("--corpus", type=Path)
+    parser.add_argument("--latency", type=float, default=LATENCY)
+    parser.add_argument("--jitter", type=float, default=JITTER)
+    parser.add_argument("--rpm", type=float)
+    parser.add_argument("--failure", type=float, default=0.0)
+    parser.add_argument("--providers", nargs="*", default=PROVIDERS)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    main(parser.parse_args())
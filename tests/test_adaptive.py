@@ -0,0 +1,72 @@
+# standard library
+from asyncio import run, sleep
+from dataclasses import replace
+from time import monotonic
+
+
+# dependencies
+from aixiv.adaptive import AdaptiveConcurrency
+from aixiv.article import Article, TArticle, amap
+
+
+# test datasets
+articles = [
+    Article(f"Title {i}", ["Author"], "Summary", f"http://example.com/{i}")
+    for i in range(100)
+]
+
+
+# test functions
+def test_adaptive_increase() -> None:
+    adaptive = AdaptiveConcurrency(minimum=1, maximum=8, initial=1)
+
+    async def upper(article: TArticle) -> TArticle:
+        await sleep(0.001)
+        return replace(article, title=article.title.upper())
+
+    assert len(amap(upper, articles, concurrency=adaptive)) == len(articles)
+    assert 1 < adaptive.limit <= 8
+    assert adaptive.inflight == 0
+
+
+def test_adaptive_decrease() -> None:
+    adaptive = AdaptiveConcurrency(minimum=2, maximum=8, initial=8)
+
+    async def throttle() -> None:
+        await adaptive.acquire()
+        adaptive.update(monotonic(), True)
+        adaptive.release()
+
+    for _ in range(3):
+        run(throttle())
+
+    assert adaptive.limit == 2
+    assert adaptive.inflight == 0
+
+
+def test_adaptive_limit() -> None:
+    adaptive = AdaptiveConcurrency(minimum=1, maximum=4, initial=2)
+    running: list[int] = [0, 0]
+
+    async def count(article: TArticle) -> TArticle:
+        running[0] += 1
+        running[1] = max(running)
+        await sleep(0.01)
+        running[0] -= 1
+        return article
+
+    assert len(amap(count, articles, concurrency=adaptive)) == len(articles)
+    assert running[1] <= 4
+
+
+def test_adaptive_timeout() -> None:
+    adaptive = AdaptiveConcurrency(minimum=1, maximum=20, initial=2)
+
+    async def upper(article: TArticle) -> TArticle:
+        await sleep(0.05)
+        return replace(article, title=article.title.upper())
+
+    mapped = amap(upper, articles[:20], concurrency=adaptive, timeout=0.15)
+    assert all(article.title.isupper() for article in mapped)
+    assert adaptive.limit >= 2
+    assert adaptive.inflight == 0
@@ -0,0 +1,54 @@
+# standard library
+from pathlib import Path
+
+
+# dependencies
+from pytest import raises
+from aixiv.archive import Archive, read_jsonl, write_archive, write_jsonl
+from aixiv.article import Article
+
+
+# test datasets
+articles = [
+    Article("Title A", ["Author A", "Author B"], "Summary A", "http://example.com/a"),
+    Article("Title B", [], "Summary B", "http://example.com/b"),
+]
+translated = [
+    Article("タイトル A", articles[0].authors, "要約 A", articles[0].url, articles[0]),
+    Article("Title B", ["Other"], "Summary B", "http://example.com/c", articles[1]),
+]
+
+
+# test functions
+def test_jsonl(tmp_path: Path) -> None:
+    path = tmp_path / "articles.jsonl"
+    assert write_jsonl(translated[:1], path) == 1
+    assert write_jsonl(iter(translated[1:]), path) == 1
+    assert list(read_jsonl(path)) == translated
+    assert list(read_jsonl(path))[0].origin == articles[0]
+
+    write_jsonl(articles, path, append=False)
+    assert list(read_jsonl(path)) == articles
+
+
+def test_archive(tmp_path: Path) -> None:
+    path = tmp_path / "articles.bin"
+    assert write_archive(iter(articles + translated), path) == 4
+
+    with Archive(path) as archive:
+        assert len(archive) == 4
+        assert list(archive) == articles + translated
+        assert archive[2].origin == articles[0]
+        assert archive[-1].origin == articles[1]
+        assert list(archive.column("title"))[2] == "タイトル A"
+
+        with raises(IndexError):
+            archive[4]
+
+
+def test_archive_invalid(tmp_path: Path) -> None:
+    path = tmp_path / "articles.jsonl"
+    write_jsonl(articles, path)
+
+    with raises(ValueError):
+        Archive(path)
@@ -1,11 +1,21 @@
 # standard library
-from asyncio import sleep as async_sleep
+from asyncio import run, sleep as async_sleep
+from collections.abc import Iterator
 from dataclasses import replace
+from sys import version_info
 from time import sleep
 
 
 # dependencies
-from aixiv.article import Article, TArticle, amap
+from pytest import raises
+from aixiv.article import (
+    Article,
+    ArticleTable,
+    TArticle,
+    aiter_map,
+    amap,
+    amap_async,
+)
 
 
 # test datasets
@@ -51,3 +61,92 @@ def test_amap_async() -> None:
 
 def test_amap_async_timeout() -> None:
     assert amap(async_upper, articles, timeout=0.1) == articles
+
+
+def test_amap_in_running_loop() -> None:
+    async def main() -> list[Article]:
+        return await amap_async(async_upper, articles, timeout=10.0)
+
+    assert run(main()) == articles_upper
+
+
+def test_aiter_map() -> None:
+    async def main() -> list[Article]:
+        return [a async for a in aiter_map(async_upper, iter(articles))]
+
+    assert run(main()) == articles_upper
+
+
+def test_aiter_map_lazy() -> None:
+    consumed: list[Article] = []
+
+    def generate() -> Iterator[Article]:
+        for article in articles:
+            consumed.append(article)
+            yield article
+
+    async def main() -> Article:
+        async for article in aiter_map(async_upper, generate(), concurrency=1):
+            return article
+
+        raise StopAsyncIteration
+
+    assert run(main()) == articles_upper[0]
+    assert len(consumed) <= 2
+
+
+def test_aiter_map_as_completed() -> None:
+    async def delayed(article: TArticle) -> TArticle:
+        await async_sleep(0.5 if article is articles[0] else 0.1)
+        return await async_upper(article)
+
+    async def main() -> list[Article]:
+        mapped = aiter_map(delayed, articles, timeout=10.0, ordered=False)
+        return [article async for article in mapped]
+
+    assert run(main()) == articles_upper[1:] + articles_upper[:1]
+
+
+def test_aiter_map_bounded() -> None:
+    running: list[int] = [0, 0]
+
+    async def count(article: TArticle) -> TArticle:
+        running[0] += 1
+        running[1] = max(running)
+        await async_sleep(0.01)
+        running[0] -= 1
+        return article
+
+    async def main() -> int:
+        mapped = aiter_map(count, (articles[0] for _ in range(100)), concurrency=3)
+        return len([article async for article in mapped])
+
+    assert run(main()) == 100
+    assert running[1] == 3
+
+
+def test_aiter_map_error() -> None:
+    async def fail(article: TArticle) -> TArticle:
+        raise ValueError(article.title)
+
+    async def main() -> list[Article]:
+        return [article async for article in aiter_map(fail, articles)]
+
+    with raises(ValueError, match="Title A"):
+        run(main())
+
+
+def test_article_compact() -> None:
+    article = Article("Title", ["".join(["Author", " A"])], "Summary", "url")
+    assert article.authors == ("Author A",)
+    assert article.authors[0] is articles[0].authors[0]
+    assert replace(article, title="TITLE").authors is article.authors
+    assert not hasattr(article, "__dict__") or version_info < (3, 10)
+
+
+def test_article_table() -> None:
+    table = ArticleTable.from_articles(articles_upper)
+    assert len(table) == len(articles_upper)
+    assert table.to_articles() == articles_upper
+    assert table[1:].to_articles() == articles_upper[1:]
+    assert table.origin_authors[0] is table.authors[0]
@@ -0,0 +1,122 @@
+# standard library
+from asyncio import gather, run
+from dataclasses import dataclass
+
+
+# dependencies
+from aixiv.article import Article, TArticle
+from aixiv.batch import Batcher, BatchError, Singleflight, loads_batch
+from aixiv.translate import Translator, translate
+from pytest import raises
+
+
+# test datasets
+articles = [
+    Article("Title A", ["Author A"], "Summary A", "http://example.com/a"),
+    Article("Title B", ["Author B"], "Summary B", "http://example.com/b"),
+    Article("Title C", ["Author C"], "Summary C", "http://example.com/c"),
+]
+articles_upper = [
+    Article("TITLE A", ["Author A"], "SUMMARY A", "http://example.com/a", articles[0]),
+    Article("TITLE B", ["Author B"], "SUMMARY B", "http://example.com/b", articles[1]),
+    Article("TITLE C", ["Author C"], "SUMMARY C", "http://example.com/c", articles[2]),
+]
+requests: list[list[str]] = []
+
+
+async def upper(texts: list[str]) -> list[str]:
+    requests.append(texts)
+    return [text.upper() for text in texts]
+
+
+async def partial(texts: list[str]) -> list[str]:
+    requests.append(texts)
+    return [text.upper() for text in texts[:1]]
+
+
+@dataclass
+class BatchTester(Translator):
+    requestable = True
+
+    async def __call__(self, article: TArticle, /) -> TArticle:
+        return await self.translate_fields(article)
+
+    async def request(self, texts: list[str], /) -> list[str]:
+        return await upper(texts)
+
+
+# test functions
+def test_batcher() -> None:
+    requests.clear()
+    batcher = Batcher(upper, size=4)
+
+    async def main() -> list[str]:
+        return await gather(*map(batcher, "abcdefg"))
+
+    assert run(main()) == list("ABCDEFG")
+    assert requests == [list("abcd"), list("efg")]
+
+
+def test_batcher_tokens() -> None:
+    requests.clear()
+    batcher = Batcher(upper, size=10, tokens=4)
+
+    async def main() -> list[str]:
+        return await gather(*map(batcher, ["aaaa", "bbbb", "cccc"]))
+
+    assert run(main()) == ["AAAA", "BBBB", "CCCC"]
+    assert requests == [["aaaa", "bbbb"], ["cccc"]]
+
+
+def test_batcher_fallback() -> None:
+    requests.clear()
+    batcher = Batcher(partial, size=3)
+
+    async def main() -> list[str]:
+        return await gather(*map(batcher, "abc"))
+
+    assert run(main()) == list("ABC")
+    assert requests == [list("abc"), ["a"], ["b"], ["c"]]
+
+
+def test_loads_batch() -> None:
+    assert loads_batch('```json\n["A", "B"]\n```', 2) == ["A", "B"]
+
+    with raises(BatchError):
+        loads_batch('["A", "B"]', 3)
+
+    with raises(BatchError):
+        loads_batch("A, B", 2)
+
+
+def test_translate_batch() -> None:
+    requests.clear()
+    translated = translate(articles, translator=BatchTester, batch_size=3)
+    assert translated == articles_upper
+    assert sum(map(len, requests)) == 6
+    assert len(requests) == 2
+
+
+def test_singleflight() -> None:
+    requests.clear()
+    singleflight = Singleflight(Batcher(upper))
+
+    async def main() -> list[str]:
+        first = await gather(*map(singleflight, "abab"))
+        return first + [await singleflight("a")]
+
+    assert run(main()) == list("ABABA")
+    assert sorted(requests) == [["a"], ["b"]]
+    assert (singleflight.calls, singleflight.saved) == (2, 3)
+
+
+def test_translate_singleflight() -> None:
+    requests.clear()
+    translator = BatchTester("", "en", False)
+    duplicated = articles + [Article("Title A", [], "Summary B", "http://a")]
+    assert len(translate(duplicated, translator=translator)) == 4
+    assert sorted(text for texts in requests for text in texts) == sorted(
+        [article.title for article in articles]
+        + [article.summary for article in articles]
+    )
+    assert translator.singleflight.saved == 2
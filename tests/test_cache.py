@@ -0,0 +1,113 @@
+# standard library
+from dataclasses import dataclass, replace
+from pathlib import Path
+from time import time
+
+
+# dependencies
+from pytest import MonkeyPatch
+from aixiv.article import Article, TArticle
+from aixiv.cache import Cache, ResponseCache
+from aixiv.translate import Translator, translate
+
+
+# test datasets
+articles = [
+    Article("Title A", ["Author A"], "Summary A", "http://example.com/a"),
+    Article("Title B", ["Author B"], "Summary B", "http://example.com/b"),
+    Article("Title C", ["Author C"], "Summary C", "http://example.com/c"),
+]
+articles_upper = [
+    Article("TITLE A", ["Author A"], "SUMMARY A", "http://example.com/a", articles[0]),
+    Article("TITLE B", ["Author B"], "SUMMARY B", "http://example.com/b", articles[1]),
+    Article("TITLE C", ["Author C"], "SUMMARY C", "http://example.com/c", articles[2]),
+]
+
+
+calls: list[str] = []
+
+
+@dataclass
+class Counter(Translator):
+    async def __call__(self, article: TArticle, /) -> TArticle:
+        calls.append(article.url)
+
+        return replace(
+            article,
+            title=article.title.upper(),
+            summary=article.summary.upper(),
+        )
+
+
+# test functions
+def test_translate_cache(tmp_path: Path) -> None:
+    calls.clear()
+
+    with Cache(tmp_path / "cache.db") as cache:
+        assert translate(articles, translator=Counter, cache=cache) == articles_upper
+        assert len(calls) == 3
+        assert translate(articles, translator=Counter, cache=cache) == articles_upper
+        assert len(calls) == 3
+        assert cache.info() == (3, 3, cache.maxsize, 3)
+
+
+def test_translate_cache_path(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+    translate(articles[:2], translator=Counter, language="en", cache=path)
+
+    with Cache(path) as cache:
+        assert cache.get(Counter("", "en", False), articles[0]) == articles_upper[0]
+        assert cache.get(Counter("", "en", True), articles[0]) is None
+        assert cache.get(Counter("", "en", False), articles[2]) is None
+
+
+def test_translate_cache_close(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    closed: list[Cache] = []
+    monkeypatch.setattr(Cache, "close", lambda cache: closed.append(cache))
+    translate(articles[:1], translator=Counter, cache=tmp_path / "cache.db")
+    assert len(closed) == 1
+
+    with Cache(tmp_path / "cache.db") as cache:
+        translate(articles[:1], translator=Counter, cache=cache)
+        assert len(closed) == 1
+
+
+def test_cache_maxsize() -> None:
+    with Cache(":memory:", maxsize=2) as cache:
+        for article, translated in zip(articles, articles_upper):
+            cache.set(Counter("", "en", False), article, translated)
+
+        assert cache.size() == 2
+        assert cache.get(Counter("", "en", False), articles[0]) is None
+
+
+def test_response_cache_expires() -> None:
+    with ResponseCache(":memory:", ttl=60.0, settle=86400.0) as cache:
+        assert cache.expires("submittedDate:[20210101000000 TO 20210102000000]") is None
+        assert (expires := cache.expires("all:test")) is not None
+        assert 0 < expires - time() <= 60.0
+
+
+def test_response_cache_key() -> None:
+    key = ResponseCache.key
+    url = "http://export.arxiv.org/api/query"
+    assert key(url, "cat:a  AND\n cat:b", 0, 10) == key(url, "cat:a AND cat:b", 0, 10)
+    assert key(url, "cat:a", 0, 10) != key(url, "cat:a", 10, 10)
+
+
+def test_cache_touch() -> None:
+    translator = Counter("", "en", False)
+
+    with Cache(":memory:", maxsize=2) as cache:
+        for article, translated in zip(articles[:2], articles_upper):
+            cache.set(translator, article, translated)
+
+        changes = cache.connection.total_changes
+        assert cache.get(translator, articles[0]) == articles_upper[0]
+        assert cache.connection.total_changes == changes
+        assert not cache.connection.in_transaction
+
+        # the pending access time is written before eviction
+        cache.set(translator, articles[2], articles_upper[2])
+        assert cache.get(translator, articles[0]) == articles_upper[0]
+        assert cache.get(translator, articles[1]) is None
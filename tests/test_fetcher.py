@@ -0,0 +1,204 @@
+# standard library
+from asyncio import run
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from urllib.parse import parse_qs, urlsplit
+
+
+# dependencies
+from aixiv.article import Article
+from aixiv.cache import ResponseCache
+from aixiv.fetcher import Fetcher
+from aixiv.search import search, search_sharded
+from pytest import fixture
+
+
+# constants
+ATOM_ENTRY = """
+  <entry>
+    <id>http://arxiv.org/abs/2101.{index:05d}v1</id>
+    <title>Title
+      {index}</title>
+    <summary>Summary of $x^{index}$.</summary>
+    <author><name>Author {index}</name></author>
+    <author><name>Coauthor {index}</name></author>
+  </entry>
+"""
+ATOM_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"
+  xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">
+  <title>arXiv Query</title>
+  <opensearch:totalResults>{total}</opensearch:totalResults>
+  {entries}
+</feed>
+"""
+TOTAL = 25
+
+
+# test datasets
+articles = [
+    Article(
+        f"Title\n      {index}",
+        [f"Author {index}", f"Coauthor {index}"],
+        f"Summary of $x^{index}$.",
+        f"http://arxiv.org/abs/2101.{index:05d}v1",
+    )
+    for index in range(TOTAL)
+]
+
+
+class Handler(BaseHTTPRequestHandler):
+    drops = 0
+    failures = 0
+    requests: list[int] = []
+    revalidations: list[int] = []
+
+    def do_GET(self) -> None:
+        params = parse_qs(urlsplit(self.path).query)
+        start = int(params["start"][0])
+        size = int(params["max_results"][0])
+
+        if Handler.drops > 0:
+            Handler.drops -= 1
+            self.close_connection = True
+            return
+
+        if Handler.failures > 0:
+            Handler.failures -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+
+        if self.headers.get("If-None-Match") == f'"{start}"':
+            Handler.revalidations.append(start)
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        # articles of other keywords are numbered after the others
+        offset = TOTAL if "other" in params["search_query"][0] else 0
+        Handler.requests.append(start)
+        entries = "".join(
+            ATOM_ENTRY.format(index=offset + index)
+            for index in range(start, min(start + size, TOTAL))
+        )
+        body = ATOM_FEED.format(total=TOTAL, entries=entries).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/atom+xml")
+        self.send_header("ETag", f'"{start}"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@fixture
+def url() -> Iterator[str]:
+    Handler.drops = 0
+    Handler.failures = 0
+    Handler.requests = []
+    Handler.revalidations = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/api/query"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+# test functions
+def test_fetcher(url: str) -> None:
+    fetcher = Fetcher(url, delay=0.01, page_size=10)
+
+    async def main() -> list[Article]:
+        return [article async for article in fetcher.results("all:test")]
+
+    assert run(main()) == articles
+    assert Handler.requests == [0, 10, 20]
+
+
+def test_fetcher_maximum(url: str) -> None:
+    fetcher = Fetcher(url, delay=0.01, page_size=10)
+
+    async def main() -> list[Article]:
+        results = fetcher.results("all:test", maximum=15)
+        return [article async for article in results]
+
+    assert run(main()) == articles[:15]
+    assert Handler.requests == [0, 10]
+
+
+def test_fetcher_retry(url: str) -> None:
+    Handler.failures = 2
+    fetcher = Fetcher(url, delay=0.01, page_size=10)
+
+    async def main() -> list[Article]:
+        return [article async for article in fetcher.results("all:test")]
+
+    assert run(main()) == articles
+
+
+def test_fetcher_dropped(url: str) -> None:
+    Handler.drops = 2
+    fetcher = Fetcher(url, delay=0.01, page_size=10)
+
+    async def main() -> list[Article]:
+        return [article async for article in fetcher.results("all:test")]
+
+    assert run(main()) == articles
+
+
+def test_fetcher_cache(url: str) -> None:
+    async def main(fetcher: Fetcher) -> list[Article]:
+        return [article async for article in fetcher.results("all:test")]
+
+    with ResponseCache(":memory:") as cache:
+        fetcher = Fetcher(url, delay=0.01, page_size=10, cache=cache)
+        assert run(main(fetcher)) == articles
+        assert run(main(fetcher)) == articles
+        assert Handler.requests == [0, 10, 20]
+        assert (cache.hits, cache.revalidated, cache.misses) == (3, 0, 3)
+
+    with ResponseCache(":memory:", ttl=0.0) as cache:
+        fetcher = Fetcher(url, delay=0.01, page_size=10, cache=cache)
+        assert run(main(fetcher)) == articles
+        assert run(main(fetcher)) == articles
+        assert Handler.revalidations == [0, 10, 20]
+        assert (cache.hits, cache.revalidated, cache.misses) == (0, 3, 3)
+
+
+def test_search_fetcher(url: str) -> None:
+    fetcher = Fetcher(url, delay=0.01, page_size=10)
+    found = search(start="2021-01-01", end="2021-01-02", fetcher=fetcher)
+    assert [article.url for article in found] == [a.url for a in articles]
+    assert found[1].title == "Title 1"
+
+
+def test_search_sharded(url: str) -> None:
+    fetcher = Fetcher(url, delay=0.01, page_size=10)
+    found = search_sharded(
+        ["astro-ph.GA", "astro-ph.CO"],
+        start="2021-01-01",
+        end="2021-01-10",
+        days=7,
+        fetcher=fetcher,
+    )
+    assert [article.url for article in found] == [a.url for a in articles]
+    assert len(Handler.requests) == 4 * 3
+
+
+def test_search_sharded_maximum(url: str) -> None:
+    fetcher = Fetcher(url, delay=0.01, page_size=10)
+    found = search_sharded(
+        keywords=["galaxy", "other"],
+        start="2021-01-01",
+        end="2021-01-02",
+        maximum=TOTAL,
+        fetcher=fetcher,
+    )
+    assert len(found) == 2 * TOTAL
+    assert len({article.url for article in found}) == 2 * TOTAL
@@ -0,0 +1,96 @@
+# standard library
+from dataclasses import replace
+
+
+# dependencies
+from aixiv.article import Article
+from aixiv.index import Index, tokenize
+from aixiv.store import Store
+
+
+# test datasets
+articles = [
+    Article(
+        "Dark matter halos of dwarf galaxies",
+        ["Alice Smith"],
+        "We study dark matter halos of dwarf galaxies with simulations.",
+        "http://arxiv.org/abs/2101.00001v1",
+    ),
+    Article(
+        "Star formation in spiral galaxies",
+        ["Bob Jones"],
+        "Star formation rates of nearby spiral galaxies are measured.",
+        "http://arxiv.org/abs/2101.00002v1",
+    ),
+    Article(
+        "Cosmic microwave background anisotropies",
+        ["Alice Smith", "Carol White"],
+        "We constrain cosmological parameters with the CMB.",
+        "http://arxiv.org/abs/2101.00003v1",
+    ),
+]
+dates = ["20210101000000", "20210101120000", "20210102000000"]
+
+
+# test functions
+def test_tokenize() -> None:
+    assert tokenize("Dark-matter HALOS of $z\\sim 2$") == [
+        "dark",
+        "matter",
+        "halos",
+        "of",
+        "z",
+        "sim",
+        "2",
+    ]
+
+
+def test_index_search() -> None:
+    index = Index.from_articles(articles)
+    assert len(index) == 3
+    assert [hit.article for hit in index.search("dark matter")] == articles[:1]
+    assert {hit.article.url for hit in index.search("galaxies")} == {
+        articles[0].url,
+        articles[1].url,
+    }
+    assert len(index.search("galaxies", limit=1)) == 1
+    assert index.search("neutrino") == []
+    assert Index().search("galaxies") == []
+
+    hits = index.search("star formation galaxies")
+    assert hits[0].article == articles[1]
+    assert hits[0].score > hits[1].score > 0
+    assert index.search("star formation galaxies", limit=1) == hits[:1]
+
+
+def test_index_incremental() -> None:
+    index = Index.from_articles(articles[:2])
+    assert index.add(articles) == 1
+    assert index.add(articles) == 0
+    assert [hit.article for hit in index.search("cmb")] == articles[2:]
+
+    article_v2 = replace(
+        articles[0],
+        title="Neutrino masses",
+        summary="We constrain neutrino masses.",
+        url=articles[0].url[:-1] + "2",
+    )
+    assert index.add([article_v2]) == 1
+    assert index.add(articles[:1]) == 0
+    assert len(index) == 3
+    assert index.search("dwarf") == []
+    assert [hit.article for hit in index.search("neutrino")] == [article_v2]
+    assert index.removed["dwarf"] == 1
+
+    index.compact()
+    assert len(index.articles) == 3
+    assert "dwarf" not in index.postings
+    assert [hit.article for hit in index.search("neutrino")] == [article_v2]
+
+
+def test_index_store() -> None:
+    with Store(":memory:") as store:
+        store.add(articles, dates)
+        index = Index.from_articles(store.articles())
+
+    assert [hit.article for hit in index.search("cosmological")] == articles[2:]
@@ -0,0 +1,41 @@
+# standard library
+from asyncio import gather, run
+from time import monotonic
+
+
+# dependencies
+from aixiv.limiter import RateLimiter
+
+
+# test functions
+def test_limiter_rpm() -> None:
+    limiter = RateLimiter(rpm=600)
+
+    async def main() -> float:
+        start = monotonic()
+        await gather(*(limiter.acquire() for _ in range(15)))
+        return monotonic() - start
+
+    assert 0.4 < run(main()) < 1.0
+
+
+def test_limiter_tpm() -> None:
+    limiter = RateLimiter(tpm=12000)
+
+    async def main() -> float:
+        start = monotonic()
+        await gather(*(limiter.acquire(50) for _ in range(6)))
+        return monotonic() - start
+
+    assert 0.4 < run(main()) < 1.0
+
+
+def test_limiter_unlimited() -> None:
+    limiter = RateLimiter()
+
+    async def main() -> float:
+        start = monotonic()
+        await gather(*(limiter.acquire(1000) for _ in range(100)))
+        return monotonic() - start
+
+    assert run(main()) < 0.1
@@ -0,0 +1,104 @@
+# standard library
+from dataclasses import dataclass
+
+
+# dependencies
+from aixiv.article import Article, TArticle
+from aixiv.memory import TranslationMemory, split_sentences
+from aixiv.translate import Translator, translate
+
+
+# test datasets
+summary_v1 = (
+    "We present a new survey of galaxies. "
+    "As shown by Smith et al. in 2020, star formation is suppressed. "
+    "We detect it at 5 sigma."
+)
+summary_v2 = (
+    "We present a new survey  of galaxies. "
+    "As shown by Smith et al. in 2020, star formation is suppressed. "
+    "We detect it at 6 sigma with new data."
+)
+article_v1 = Article("Title", ["Author"], summary_v1, "http://arxiv.org/abs/1v1")
+article_v2 = Article("Title", ["Author"], summary_v2, "http://arxiv.org/abs/1v2")
+requests: list[str] = []
+batches: list[list[str]] = []
+
+
+@dataclass
+class FieldsMemoryTester(Translator):
+    requestable = True
+
+    async def request(self, texts: list[str], /) -> list[str]:
+        requests.extend(texts)
+        batches.append(texts)
+        return [text.upper() for text in texts]
+
+
+@dataclass
+class MemoryTester(FieldsMemoryTester):
+    fields = ("summary",)
+
+    async def __call__(self, article: TArticle, /) -> TArticle:
+        return await self.translate_fields(article)
+
+
+# test functions
+def test_split_sentences() -> None:
+    assert split_sentences(summary_v1) == [
+        "We present a new survey of galaxies.",
+        "As shown by Smith et al. in 2020, star formation is suppressed.",
+        "We detect it at 5 sigma.",
+    ]
+
+
+def test_memory_fuzzy() -> None:
+    translator = MemoryTester("", "en", False)
+    memory = TranslationMemory(":memory:", similarity=0.9)
+    memory.set(translator, "We detect it at 5 sigma.", "WE DETECT IT AT 5 SIGMA.")
+
+    assert memory.get(translator, "We  detect it at 5 sigma.") is not None
+    assert memory.get(translator, "We detect it at 5 sigma!") is not None
+    assert memory.get(translator, "We detect it at 6 sigma.") is None
+    assert memory.info()[:3] == (1, 1, 1)
+
+
+def test_translate_memory_negation() -> None:
+    requests.clear()
+    memory = TranslationMemory(":memory:")
+    translator = MemoryTester("", "en", False, memory=memory)
+    positive = "We find strong evidence that star formation is suppressed."
+    negative = "We find no strong evidence that star formation is suppressed."
+
+    translate([Article("Title", [], positive, "http://a")], translator=translator)
+    translated = translate(
+        [Article("Title", [], negative, "http://b")],
+        translator=translator,
+    )
+    assert translated[0].summary == negative.upper()
+    assert requests == [positive, negative]
+
+
+def test_translate_memory() -> None:
+    requests.clear()
+    memory = TranslationMemory(":memory:")
+    translator = MemoryTester("", "en", False, memory=memory)
+
+    translated = translate([article_v1], translator=translator)
+    assert translated[0].summary == summary_v1.upper()
+    assert len(requests) == 3
+
+    translated = translate([article_v2], translator=translator)
+    expected = summary_v1.upper().replace("5 SIGMA.", "6 SIGMA WITH NEW DATA.")
+    assert translated[0].summary == expected
+    assert requests[3:] == ["We detect it at 6 sigma with new data."]
+
+
+def test_translate_memory_requests() -> None:
+    batches.clear()
+    memory = TranslationMemory(":memory:")
+    translator = FieldsMemoryTester("", "en", False, memory=memory)
+
+    translated = translate([article_v1], translator=translator)
+    assert translated[0].summary == summary_v1.upper()
+    assert sorted(map(len, batches)) == [1, 3]
@@ -0,0 +1,97 @@
+# standard library
+from asyncio import sleep
+from dataclasses import dataclass
+from json import loads
+
+
+# dependencies
+from aixiv.article import Article, TArticle, amap
+from aixiv.metrics import REGISTRY, Histogram, Registry
+from aixiv.translate import Translator, translate
+
+
+# test datasets
+articles = [
+    Article("Title A", ["Author A"], "Summary A", "http://example.com/a"),
+    Article("Title B", ["Author B"], "Summary B", "http://example.com/b"),
+]
+
+
+@dataclass
+class MetricsTester(Translator):
+    requestable = True
+
+    async def __call__(self, article: TArticle, /) -> TArticle:
+        return await self.translate_fields(article)
+
+    async def request(self, texts: list[str], /) -> list[str]:
+        return [text.upper() for text in texts]
+
+
+async def identity(article: Article) -> Article:
+    await sleep(0.01)
+    return article
+
+
+# test functions
+def test_histogram() -> None:
+    histogram = Histogram((1.0, 2.0, 4.0))
+
+    for value in (0.5, 1.5, 1.5, 3.0, 10.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [1, 2, 1, 1]
+    assert (histogram.count, histogram.sum) == (5, 16.5)
+    assert histogram.quantile(0.5) == 1.75
+    assert histogram.quantile(0.99) == 4.0
+    assert Histogram().quantile(0.5) == 0.0
+
+
+def test_registry() -> None:
+    registry = Registry()
+    recorded: list[tuple[str, float, dict[str, str]]] = []
+    registry.hooks.append(lambda *args: recorded.append(args))
+
+    registry.inc("requests_total", cache="hit")
+    registry.inc("requests_total", 2, cache="hit")
+    registry.observe("request_seconds", 0.3, translator='Say "hi"')
+
+    assert registry.counters["requests_total"] == {(("cache", "hit"),): 3.0}
+    assert recorded[-1] == ("request_seconds", 0.3, {"translator": 'Say "hi"'})
+
+    metrics = loads(registry.to_json())
+    assert metrics["requests_total"]["samples"][0]["value"] == 3.0
+    assert metrics["request_seconds"]["samples"][0]["count"] == 1
+
+    exposition = registry.to_prometheus()
+    assert "# TYPE requests_total counter" in exposition
+    assert 'requests_total{cache="hit"} 3.0' in exposition
+    assert 'request_seconds_bucket{translator="Say \\"hi\\"",le="0.5"} 1' in exposition
+    assert 'request_seconds_count{translator="Say \\"hi\\""} 1' in exposition
+
+    registry.reset()
+    assert registry.to_dict() == {}
+
+
+def test_registry_hook_error() -> None:
+    registry = Registry()
+
+    def hook(name: str, value: float, labels: dict[str, str]) -> None:
+        raise RuntimeError(name)
+
+    registry.hooks.append(hook)
+    registry.inc("errors_total")
+    assert registry.counters["errors_total"] == {(): 1.0}
+
+
+def test_pipeline_metrics() -> None:
+    REGISTRY.reset()
+    amap(identity, articles, concurrency=1)
+    assert REGISTRY.histograms["aixiv_article_seconds"][()].count == 2
+    assert REGISTRY.histograms["aixiv_queue_wait_seconds"][()].count == 2
+
+    REGISTRY.reset()
+    translate(articles, translator=MetricsTester, batch_size=4)
+    labels = (("requester", "MetricsTester"),)
+    assert REGISTRY.counters["aixiv_request_texts_total"][labels] == 4
+    assert REGISTRY.histograms["aixiv_request_seconds"][labels].count == 1
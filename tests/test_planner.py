@@ -0,0 +1,52 @@
+# dependencies
+from aixiv.article import Article
+from aixiv.planner import Shard, merge, plan
+from pytest import raises
+
+
+# test datasets
+def article(id: str, version: int) -> Article:
+    return Article(f"Title {id}", [], "", f"http://arxiv.org/abs/{id}v{version}")
+
+
+# test functions
+def test_plan() -> None:
+    shards = plan(["cs.CL", "cs.LG"], [], "20210101000000", "20210110000000", days=7)
+    assert shards == [
+        Shard("20210101000000", "20210108000000", "cs.CL"),
+        Shard("20210101000000", "20210108000000", "cs.LG"),
+        Shard("20210108000000", "20210110000000", "cs.CL"),
+        Shard("20210108000000", "20210110000000", "cs.LG"),
+    ]
+    assert shards[0].query == (
+        "submittedDate:[20210101000000 TO 20210108000000] AND (cat:cs.CL)"
+    )
+
+    shards = plan([], ["galaxy"], "20210101000000", "20210101000000")
+    assert shards == [Shard("20210101000000", "20210101000000", None, "galaxy")]
+
+    with raises(ValueError):
+        plan([], [], "20210101000000", "20210102000000", days=0)
+
+
+def test_merge_dates() -> None:
+    results = [
+        [("20210103", article("2101.3", 1)), ("20210101", article("2101.1", 1))],
+        [("20210104", article("2101.4", 1)), ("20210103", article("2101.3", 2))],
+    ]
+    merged = merge(results, order="descending", sort="submittedDate")
+    assert merged == [article("2101.4", 1), article("2101.3", 2), article("2101.1", 1)]
+
+    results = [list(reversed(result)) for result in results]
+    merged = merge(results, order="ascending", sort="submittedDate")
+    assert merged == [article("2101.1", 1), article("2101.3", 2), article("2101.4", 1)]
+
+
+def test_merge_relevance() -> None:
+    results = [
+        [("", article("2101.1", 1)), ("", article("2101.2", 1))],
+        [("", article("2101.3", 1)), ("", article("2101.1", 1))],
+        [("", article("2101.4", 1))],
+    ]
+    merged = merge(results, sort="relevance")
+    assert [a.url[-8:-2] for a in merged] == ["2101.1", "2101.3", "2101.4", "2101.2"]
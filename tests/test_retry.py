@@ -0,0 +1,162 @@
+# standard library
+from asyncio import run, sleep
+from dataclasses import dataclass, replace
+from time import monotonic
+from typing import ClassVar
+
+
+# dependencies
+from pytest import raises
+from aixiv.article import Article, TArticle, amap
+from aixiv.metrics import REGISTRY
+from aixiv.retry import Retry, is_retryable
+from aixiv.translate import Translator, translate
+
+
+# test datasets
+articles = [
+    Article("Title A", ["Author A"], "Summary A", "http://example.com/a"),
+    Article("Title B", ["Author B"], "Summary B", "http://example.com/b"),
+]
+articles_upper = [
+    Article("TITLE A", ["Author A"], "SUMMARY A", "http://example.com/a", articles[0]),
+    Article("TITLE B", ["Author B"], "SUMMARY B", "http://example.com/b", articles[1]),
+]
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+@dataclass
+class FlakyTester(Translator):
+    failures: int = 2
+    calls: int = 0
+
+    async def __call__(self, article: TArticle, /) -> TArticle:
+        self.calls += 1
+
+        if self.calls <= self.failures:
+            raise RateLimitError("Too many requests.")
+
+        return replace(
+            article,
+            title=article.title.upper(),
+            summary=article.summary.upper(),
+        )
+
+
+@dataclass
+class HangingTester(Translator):
+    fields: ClassVar[tuple[str, ...]] = ("title",)
+    requestable = True
+    hangs: int = 2
+    delay: float = 10.0
+    calls: int = 0
+
+    async def __call__(self, article: TArticle, /) -> TArticle:
+        return await self.translate_fields(article)
+
+    async def request(self, texts: list[str], /) -> list[str]:
+        self.calls += 1
+        await sleep(self.delay if self.calls <= self.hangs else 0.01)
+        return [text.upper() for text in texts]
+
+
+# test functions
+def test_is_retryable() -> None:
+    assert is_retryable(TimeoutError())
+    assert is_retryable(ConnectionResetError())
+    assert is_retryable(RateLimitError())
+    assert not is_retryable(ValueError())
+
+
+def test_retry() -> None:
+    retry = Retry(attempts=3, backoff=0.01)
+    translator = FlakyTester("", "en", False)
+    assert amap(translator, articles[:1], retry=retry) == articles_upper[:1]
+    assert retry.reports[0].attempts == 3
+    assert retry.reports[0].outcome == "success"
+
+
+def test_retry_exhausted() -> None:
+    retry = Retry(attempts=2, backoff=0.01)
+    translator = FlakyTester("", "en", False, failures=3)
+    assert amap(translator, articles[:1], retry=retry) == articles[:1]
+    assert retry.reports[0].attempts == 2
+    assert retry.reports[0].outcome == "error"
+
+
+def test_retry_not_retryable() -> None:
+    calls: list[Article] = []
+
+    async def fail(article: TArticle) -> TArticle:
+        calls.append(article)
+        raise ValueError(article.title)
+
+    retry = Retry(attempts=3, backoff=0.01)
+    assert amap(fail, articles[:1], retry=retry) == articles[:1]
+    assert len(calls) == 1
+
+    with raises(ValueError):
+        amap(fail, articles[:1])
+
+
+def test_retry_hedge() -> None:
+    retry = Retry(hedge=0.9)
+    retry.latencies.extend([0.01] * 10)
+    calls: list[float] = []
+
+    async def slow_once() -> str:
+        calls.append(monotonic())
+        await sleep(1.0 if len(calls) == 1 else 0.01)
+        return "done"
+
+    start = monotonic()
+    assert run(retry.run(slow_once, 10.0, "slow")) == "done"
+    assert monotonic() - start < 0.5
+    assert retry.reports[0].hedged
+
+
+def test_translate_retry() -> None:
+    retry = Retry(backoff=0.01)
+    translator = FlakyTester("", "en", False, failures=1)
+    assert translate(articles, translator=translator, retry=retry) == articles_upper
+    assert sorted(report.attempts for report in retry.reports) == [1, 2]
+
+
+def test_retry_reports() -> None:
+    REGISTRY.reset()
+    retry = Retry()
+    translate(articles * 600, translator=FlakyTester, failures=0, retry=retry)
+    assert len(retry.reports) == 1000
+    assert REGISTRY.counters["aixiv_outcomes_total"] == {
+        (("outcome", "success"),): 1200.0
+    }
+
+
+def test_translate_fields_retry() -> None:
+    retry = Retry(attempts=3, backoff=0.01)
+    translator = HangingTester("", "en", False)
+    translated = translate(
+        articles[:1],
+        translator=translator,
+        retry=retry,
+        timeout=0.1,
+    )
+    assert translated[0].title == "TITLE A"
+    assert translator.calls == 3
+    assert retry.reports[0].attempts == 3
+
+
+def test_translate_fields_hedge() -> None:
+    retry = Retry(hedge=0.5)
+    retry.latencies.extend([0.01] * 10)
+    translator = HangingTester("", "en", False, hangs=1, delay=2.0)
+
+    start = monotonic()
+    translated = translate(articles[:1], translator=translator, retry=retry)
+    assert translated[0].title == "TITLE A"
+    assert monotonic() - start < 1.0
+    assert translator.calls == 2
+    assert retry.reports[0].hedged
@@ -1,5 +1,20 @@
+# standard library
+from datetime import datetime, timezone
+from subprocess import run
+from sys import executable
+
+
 # dependencies
-from aixiv.search import search
+from aixiv.article import Article
+from aixiv.search import (
+    ARXIV_LATEX_CONVERTER,
+    convert_latex,
+    format,
+    format_date,
+    parse_date,
+    search,
+)
+from dateparser import parse
 
 
 # constants
@@ -7,6 +22,17 @@ CATEGORIES = ("astro-ph.GA",)
 KEYWORDS = ("galaxy",)
 START = "2021-01-01 in UTC"
 END = "2021-01-02 in UTC"
+DATES = (
+    "2021-01-01",
+    "2021-01-01 in UTC",
+    "2021-01-01T12:30:00Z",
+    "2021-01-01 12:30 in UTC",
+    "2021-01-01T09:00:00+09:00",
+    "1 day ago at midnight in UTC",
+    "0 day ago at midnight in UTC",
+    "2 weeks ago at midnight",
+)
+LAZY_MODULES = ("arxiv", "dateparser", "pylatexenc")
 EXPECTED_URLS = [
     "http://arxiv.org/abs/2101.00188v2",
     "http://arxiv.org/abs/2101.00158v1",
@@ -15,8 +41,70 @@ EXPECTED_URLS = [
 ]
 
 
+# test datasets
+articles = [
+    Article(
+        f"Title\n  {i} with $\\alpha$",
+        [f"Author {i}"],
+        f"Summary {i} of \\textit{{galaxies}} at $z \\sim {i}$.",
+        f"http://example.com/{i}",
+    )
+    for i in range(20)
+]
+
+
 # test functions
 def test_search() -> None:
     articles = search(CATEGORIES, KEYWORDS, START, END)
     urls = [article.url for article in articles]
     assert urls == EXPECTED_URLS
+
+
+def test_format() -> None:
+    formatted = format(articles[:1])
+    assert formatted[0].title == "Title 0 with α"
+    assert formatted[0].summary == "Summary 0 of galaxies at z ∼ 0."
+    assert formatted[0].origin == articles[0]
+
+
+def test_format_processes() -> None:
+    assert format(articles, processes=2, chunksize=3) == format(articles)
+
+
+def test_convert_latex() -> None:
+    plain = "Plain title (without any LaTeX): 5.2 sigma!"
+    assert convert_latex(plain) is plain
+
+    for string in [
+        "Galaxies at $z \\sim 2$ in the $\\Lambda$CDM model",
+        "$\\alpha$ and ``quotes'' -- with \\textbf{macros} and 50\\% of $x$",
+    ]:
+        assert convert_latex(string) == ARXIV_LATEX_CONVERTER.latex_to_text(string)
+
+
+def test_lazy_imports() -> None:
+    code = (
+        "import sys, aixiv, aixiv.search, aixiv.translate; "
+        f"print([name for name in {LAZY_MODULES!r} if name in sys.modules])"
+    )
+    result = run([executable, "-c", code], capture_output=True, text=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_format_date() -> None:
+    for string in DATES:
+        assert format_date(string) == parse(string).strftime("%Y%m%d%H%M%S")
+
+    assert format_date("January 1, 2021") == "20210101000000"
+
+
+def test_parse_date() -> None:
+    utc = timezone.utc
+    timestamp = datetime(2021, 1, 1, 12, tzinfo=utc).timestamp()
+    midnight = parse_date("1 day ago at midnight in UTC", timestamp)
+    assert midnight == datetime(2020, 12, 31, tzinfo=utc)
+    assert parse_date("3 hours ago in UTC", timestamp) == datetime(
+        2021, 1, 1, 9, tzinfo=utc
+    )
+    assert parse_date("2021-02-30", timestamp) is None
+    assert parse_date("January 1, 2021", timestamp) is None
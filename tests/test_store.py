@@ -0,0 +1,106 @@
+# standard library
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any
+
+
+# dependencies
+from pytest import MonkeyPatch
+from aixiv.article import Article, TArticle
+from aixiv.fetcher import Fetcher, Page
+from aixiv.search import harvest
+from aixiv.store import Store, parse_id
+from aixiv.translate import Translator, translate
+
+
+# test datasets
+articles = [
+    Article("Title A", ["Author A"], "Summary A", "http://arxiv.org/abs/2101.00001v1"),
+    Article("Title B", ["Author B"], "Summary B", "http://arxiv.org/abs/2101.00002v1"),
+    Article("Title C", ["Author C"], "Summary C", "http://arxiv.org/abs/2101.00003v1"),
+]
+dates = ["20210101000000", "20210101120000", "20210102000000"]
+
+
+@dataclass
+class FakeFetcher(Fetcher):
+    queries: list[str] = field(default_factory=list)
+
+    async def pages(self, query: str, /, **options: Any) -> AsyncIterator[Page]:
+        self.queries.append(query)
+        yield Page(articles[:2], 3, dates[:2])
+        yield Page(articles[2:], 3, dates[2:])
+
+
+@dataclass
+class UpperTester(Translator):
+    async def __call__(self, article: TArticle, /) -> TArticle:
+        return replace(article, title=article.title.upper())
+
+
+# test functions
+def test_parse_id() -> None:
+    assert parse_id("http://arxiv.org/abs/2101.00188v2") == ("2101.00188", 2)
+    assert parse_id("http://arxiv.org/abs/hep-th/9901001v1") == ("hep-th/9901001", 1)
+
+
+def test_store_upsert() -> None:
+    article_v2 = replace(articles[0], title="Title A2", url=articles[0].url[:-1] + "2")
+
+    with Store(":memory:") as store:
+        store.add(articles, dates)
+        store.add([article_v2], dates[:1])
+        store.add(articles[:1], dates[:1])
+        assert store.size() == 3
+        assert list(store.articles()) == [article_v2, *articles[1:]]
+
+
+def test_store_untranslated() -> None:
+    translated = [replace(articles[0], title="TITLE A", origin=articles[0])]
+
+    with Store(":memory:") as store:
+        store.add(articles, dates)
+        store.add_translations(translated, language="ja", summarize=False)
+        assert list(store.untranslated(language="ja", summarize=False)) == articles[1:]
+        assert list(store.untranslated(language="en", summarize=False)) == articles
+        assert list(store.translated(language="ja", summarize=False)) == translated
+
+
+def test_harvest() -> None:
+    fetcher = FakeFetcher()
+
+    with Store(":memory:") as store:
+        for _ in range(2):
+            harvested = harvest(
+                ["astro-ph.GA"],
+                start="2021-01-01",
+                end="2021-01-03",
+                store=store,
+                fetcher=fetcher,
+            )
+            assert harvested == articles
+
+        assert store.size() == 3
+        assert store.get_watermark(Store.key(["astro-ph.GA"], [])) == dates[-1]
+        assert fetcher.queries[0].startswith("submittedDate:[20210101000000 TO")
+        assert fetcher.queries[1].startswith(f"submittedDate:[{dates[-1]} TO")
+
+
+def test_translate_untranslated() -> None:
+    with Store(":memory:") as store:
+        store.add(articles, dates)
+        untranslated = store.untranslated(language="ja", summarize=False)
+        translated = translate(untranslated, translator=UpperTester, language="ja")
+        assert [article.title for article in translated] == [
+            "TITLE A",
+            "TITLE B",
+            "TITLE C",
+        ]
+
+
+def test_harvest_close(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    closed: list[Store] = []
+    monkeypatch.setattr(Store, "close", lambda store: closed.append(store))
+    harvest(start="2021-01-01", store=tmp_path / "store.db", fetcher=FakeFetcher())
+    assert len(closed) == 1
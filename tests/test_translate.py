@@ -1,7 +1,10 @@
 # dependencies
+from asyncio import run, sleep
 from dataclasses import dataclass, replace
-from aixiv.article import Article, TArticle
-from aixiv.translate import Translator, translate
+from time import monotonic
+from pytest import raises
+from aixiv.article import Article, TArticle, amap
+from aixiv.translate import Translator, aiter_translate, atranslate, translate
 
 
 # test datasets
@@ -37,6 +40,59 @@ class AsyncTester(Translator):
         )
 
 
+@dataclass
+class ClientTester(Translator):
+    clients: int = 0
+    closed: int = 0
+
+    def create_client(self) -> str:
+        self.clients += 1
+        return "client"
+
+    async def aclose(self) -> None:
+        self.closed += 1
+        await super().aclose()
+
+    async def __call__(self, article: TArticle, /) -> TArticle:
+        assert self.get_client() == "client"
+        return replace(
+            article,
+            title=article.title.upper(),
+            summary=article.summary.upper(),
+        )
+
+
+@dataclass
+class SlowTester(Translator):
+    requestable = True
+
+    async def __call__(self, article: TArticle, /) -> TArticle:
+        return await self.translate_fields(article)
+
+    async def request(self, texts: list[str], /) -> list[str]:
+        await sleep(0.5)
+        return [text.upper() for text in texts]
+
+
+@dataclass
+class FieldsTester(SlowTester):
+    fields = ("title",)
+
+
+@dataclass
+class RequestTester(Translator):
+    fields = ("title",)
+    requestable = True
+
+    async def request(self, texts: list[str], /) -> list[str]:
+        return [text.upper() for text in texts]
+
+
+@dataclass
+class IncompleteTester(Translator):
+    fields = ("title",)
+
+
 # test functions
 def test_translate() -> None:
     assert translate(articles, translator=Tester) == articles_upper
@@ -44,3 +100,53 @@ def test_translate() -> None:
 
 def test_translate_async() -> None:
     assert translate(articles, translator=AsyncTester) == articles_upper
+
+
+def test_translator_client() -> None:
+    translator = ClientTester("", "en", False)
+    assert amap(translator, articles) == articles_upper
+    assert translator.clients == 1
+    assert translator.closed == 1
+    assert translator.client is None
+
+
+def test_translate_fields() -> None:
+    expected = [replace(a, title=a.title.upper(), origin=a) for a in articles]
+    assert translate(articles, translator=FieldsTester) == expected
+
+
+def test_translate_request() -> None:
+    expected = [replace(a, title=a.title.upper(), origin=a) for a in articles]
+    assert translate(articles, translator=RequestTester) == expected
+
+    with raises(TypeError):
+        IncompleteTester("", "en", False)
+
+
+def test_translate_fields_concurrently() -> None:
+    translator = SlowTester("", "en", False)
+    start = monotonic()
+    assert amap(translator, articles[:1]) == articles_upper[:1]
+    assert monotonic() - start < 0.9
+
+
+def test_aiter_translate() -> None:
+    async def main() -> list[Article]:
+        translated = aiter_translate(iter(articles), translator=AsyncTester)
+        return [article async for article in translated]
+
+    assert run(main()) == articles_upper
+
+
+def test_atranslate_shared() -> None:
+    translator = ClientTester("", "en", False)
+
+    async def main() -> tuple[list[Article], list[Article]]:
+        async with translator:
+            first = await atranslate(articles, translator=translator)
+            second = await atranslate(articles, translator=translator)
+            return first, second
+
+    assert run(main()) == (articles_upper, articles_upper)
+    assert translator.clients == 1
+    assert translator.closed == 1